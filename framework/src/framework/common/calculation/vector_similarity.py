@@ -33,6 +33,13 @@ class VectorSimilarityCalculator:
             case _:
                 raise NotImplementedException("Unsupported calculation method.", method=self.__method)
 
+    def calculate_similarities_np(self, matrix: np.ndarray, vector: NPArray) -> NPArray:
+        match self.__method:
+            case DistanceMetric.INNER_PRODUCT:
+                return matrix @ vector
+            case _:
+                raise NotImplementedException("Unsupported calculation method.", method=self.__method)
+
     def __calculate_inner_product(self, vector_a: NPArray, vector_b: NPArray) -> float:
         return np.inner(  # type: ignore[attr-defined] # it exists
             vector_a,
@@ -199,7 +199,8 @@ class Vector:
     ) -> frozenset[int]:
         if not negative_filter_indices:
             return frozenset({})
-        if invalid_indices := [idx for idx in negative_filter_indices if idx < 0 or idx >= dimension]:
+        if min(negative_filter_indices) < 0 or max(negative_filter_indices) >= dimension:
+            invalid_indices = [idx for idx in negative_filter_indices if idx < 0 or idx >= dimension]
             raise InvalidStateException(
                 "Invalid negative filter indices.",
                 invalid_indices=invalid_indices,
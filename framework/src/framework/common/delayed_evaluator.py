@@ -15,9 +15,10 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from itertools import accumulate
 
 import structlog
 from beartype.typing import Awaitable, Callable, Generic, Sequence, TypeVar, cast
@@ -29,6 +30,9 @@ logger = structlog.getLogger()
 InputT = TypeVar("InputT")
 OutputT = TypeVar("OutputT")
 
+ADAPTIVE_DELAY_RANGE = 4
+ADAPTIVE_DELAY_SMOOTHING = 0.2
+
 
 @dataclass(frozen=True)
 class DelayedRequest(Generic[InputT, OutputT]):
@@ -36,6 +40,43 @@ class DelayedRequest(Generic[InputT, OutputT]):
     future: asyncio.Future[list[OutputT]] = field(
         default_factory=asyncio.Future, init=False, repr=False, compare=False, hash=False
     )
+    partial_results: dict[int, tuple[int, list[OutputT] | None]] = field(
+        default_factory=dict, init=False, repr=False, compare=False, hash=False
+    )
+
+    def set_partial_result(self, start: int, end: int, results: list[OutputT] | None) -> None:
+        """Collects the results of the [start, end) slice and resolves the future once every input is covered."""
+        if self.future.done():
+            return
+        self.partial_results[start] = (end, results)
+        if sum(end - start for start, (end, _) in self.partial_results.items()) < len(self.inputs):
+            return
+        slice_results = [results for _, (_, results) in sorted(self.partial_results.items())]
+        if any(results is None for results in slice_results):
+            self.future.set_result(cast(list[OutputT], None))
+            return
+        self.future.set_result([item for results in slice_results for item in cast(list[OutputT], results)])
+
+
+@dataclass(frozen=True)
+class DelayedRequestSlice(Generic[InputT, OutputT]):
+    request: DelayedRequest[InputT, OutputT]
+    start: int
+    end: int
+
+    @property
+    def inputs(self) -> Sequence[InputT]:
+        return self.request.inputs[self.start : self.end]
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start
+
+    def split(self, size: int) -> tuple[DelayedRequestSlice[InputT, OutputT], DelayedRequestSlice[InputT, OutputT]]:
+        return (
+            DelayedRequestSlice(self.request, self.start, self.start + size),
+            DelayedRequestSlice(self.request, self.start + size, self.end),
+        )
 
 
 class DelayedEvaluator(Generic[InputT, OutputT]):
@@ -49,6 +90,12 @@ class DelayedEvaluator(Generic[InputT, OutputT]):
     Args:
         delay_ms: Delay in milliseconds before processing accumulated requests
         eval_fn: Async function that processes a batch of inputs and returns results
+        task_name: Name of the evaluation used in the logs
+        max_batch_size: Maximum number of inputs passed to a single eval_fn call, unlimited if not positive
+        max_in_flight_batches: Maximum number of concurrently running eval_fn calls, unlimited if not positive.
+            Defaults to a single in-flight batch when delay_ms is positive and to unlimited otherwise.
+        adaptive: Whether to adjust the delay between delay_ms / 4 and delay_ms * 4
+            based on the observed queue depth and evaluation latency
     """
 
     def __init__(
@@ -56,65 +103,132 @@ class DelayedEvaluator(Generic[InputT, OutputT]):
         delay_ms: int,
         eval_fn: Callable[[Sequence[InputT]], Awaitable[list[OutputT]]],
         task_name: str | None = None,
+        max_batch_size: int = 0,
+        max_in_flight_batches: int | None = None,
+        adaptive: bool = False,
     ) -> None:
         self._delay_ms = delay_ms
+        self._current_delay_ms = float(delay_ms)
         self._evaluate_fn = eval_fn
         self._task_name = task_name or "delayed evaluation"
-        self._pending_requests: list[DelayedRequest[InputT, OutputT]] = []
-        self._batch_task: asyncio.Task[None] | None = None
+        self._max_batch_size = max_batch_size
+        self._adaptive = adaptive and self._delay_ms > 0
+        if max_in_flight_batches is None:
+            max_in_flight_batches = 1 if self._delay_ms > 0 else 0
+        self._in_flight_semaphore = asyncio.Semaphore(max_in_flight_batches) if max_in_flight_batches > 0 else None
+        self._pending_slices: deque[DelayedRequestSlice[InputT, OutputT]] = deque()
+        self._is_batch_scheduled = False
+        self._batch_tasks: set[asyncio.Task[None]] = set()
         self._lock = None if self._delay_ms <= 0 else asyncio.Lock()
 
     async def evaluate(self, inputs: Sequence[InputT]) -> list[OutputT]:
         if not inputs:
             return []
         if self._delay_ms <= 0:
-            return await self._evaluate_with_logging(inputs)
+            return await self._evaluate_in_batches(inputs)
         request = DelayedRequest[InputT, OutputT](inputs)
-        if self._lock is None:
-            raise InvalidStateException("Lock must not be None.")
-        async with self._lock:
-            self._pending_requests.append(request)
-            if self._batch_task is None or self._batch_task.done():
-                self._batch_task = asyncio.create_task(self._process_batch_after_delay())
+        async with self._get_lock():
+            self._pending_slices.append(DelayedRequestSlice(request, 0, len(inputs)))
+            if not self._is_batch_scheduled:
+                self._schedule_batch(self._current_delay_ms)
         return await request.future
 
-    async def _process_batch_after_delay(self) -> None:
-        await asyncio.sleep(self._delay_ms / 1000)
-        if self._lock is None:
-            raise InvalidStateException("Lock must not be None.")
-        async with self._lock:
-            if not self._pending_requests:
-                return
-            requests = self._pending_requests.copy()
-            self._pending_requests.clear()
+    def _schedule_batch(self, delay_ms: float) -> None:
+        self._is_batch_scheduled = True
+        task = asyncio.create_task(self._process_batch_after_delay(delay_ms))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _process_batch_after_delay(self, delay_ms: float) -> None:
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+        async with self._acquire_in_flight_slot():
+            async with self._get_lock():
+                batch = self._take_batch()
+                queue_depth = sum(pending_slice.size for pending_slice in self._pending_slices)
+                self._is_batch_scheduled = False
+                if self._pending_slices:
+                    # the remaining inputs have already waited, they are dispatched without a further delay
+                    self._schedule_batch(0)
+            if batch:
+                await self._process_batch(batch, queue_depth)
+
+    def _take_batch(self) -> list[DelayedRequestSlice[InputT, OutputT]]:
+        if self._max_batch_size <= 0:
+            batch = list(self._pending_slices)
+            self._pending_slices.clear()
+            return batch
+        batch = []
+        capacity = self._max_batch_size
+        while self._pending_slices and capacity > 0:
+            pending_slice = self._pending_slices.popleft()
+            if pending_slice.size > capacity:
+                pending_slice, remaining_slice = pending_slice.split(capacity)
+                self._pending_slices.appendleft(remaining_slice)
+            batch.append(pending_slice)
+            capacity -= pending_slice.size
+        return batch
+
+    async def _process_batch(self, batch: Sequence[DelayedRequestSlice[InputT, OutputT]], queue_depth: int) -> None:
+        start_time = time.perf_counter()
         try:
-            await self._process_batch_requests(requests)
-        except Exception as e:
-            for request in requests:
-                if not request.future.done():
-                    request.future.set_exception(e)
-            raise
-        await self._handle_when_other_request_arrived_during_sleep()
-
-    async def _handle_when_other_request_arrived_during_sleep(self) -> None:
-        """To avoid freezing requests"""
+            results = await self._evaluate_with_logging(
+                [input_item for batch_slice in batch for input_item in batch_slice.inputs]
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            for batch_slice in batch:
+                if not batch_slice.request.future.done():
+                    batch_slice.request.future.set_exception(e)
+            return
+        batch_size = sum(batch_slice.size for batch_slice in batch)
+        self._adapt_delay(batch_size, queue_depth, (time.perf_counter() - start_time) * 1000)
+        position = 0
+        for batch_slice in batch:
+            end = position + batch_slice.size
+            slice_results = None if results is None else results[position:end]
+            batch_slice.request.set_partial_result(batch_slice.start, batch_slice.end, slice_results)
+            position = end
+
+    def _adapt_delay(self, batch_size: int, queue_depth: int, duration_ms: float) -> None:
+        """
+        Shrinks the delay while inputs are queueing up, otherwise moves it towards the evaluation latency,
+        as waiting longer than an evaluation takes rarely improves the batches.
+        """
+        if not self._adaptive:
+            return
+        if queue_depth > 0 or 0 < self._max_batch_size <= batch_size:
+            target_delay_ms = self._current_delay_ms / 2
+        else:
+            target_delay_ms = (
+                1 - ADAPTIVE_DELAY_SMOOTHING
+            ) * self._current_delay_ms + ADAPTIVE_DELAY_SMOOTHING * duration_ms
+        self._current_delay_ms = min(
+            max(target_delay_ms, self._delay_ms / ADAPTIVE_DELAY_RANGE), self._delay_ms * ADAPTIVE_DELAY_RANGE
+        )
+
+    async def _evaluate_in_batches(self, inputs: Sequence[InputT]) -> list[OutputT]:
+        batch_size = self._max_batch_size if self._max_batch_size > 0 else len(inputs)
+        batch_results = await asyncio.gather(
+            *[
+                self._evaluate_with_in_flight_limit(inputs[start : start + batch_size])
+                for start in range(0, len(inputs), batch_size)
+            ]
+        )
+        if any(results is None for results in batch_results):
+            return cast(list[OutputT], None)
+        return [item for results in batch_results for item in results]
+
+    async def _evaluate_with_in_flight_limit(self, inputs: Sequence[InputT]) -> list[OutputT]:
+        async with self._acquire_in_flight_slot():
+            return await self._evaluate_with_logging(inputs)
+
+    def _acquire_in_flight_slot(self) -> contextlib.AbstractAsyncContextManager:
+        return self._in_flight_semaphore or contextlib.nullcontext()
+
+    def _get_lock(self) -> asyncio.Lock:
         if self._lock is None:
             raise InvalidStateException("Lock must not be None.")
-        async with self._lock:
-            if self._pending_requests:
-                self._batch_task = asyncio.create_task(self._process_batch_after_delay())
-            else:
-                self._batch_task = None
-
-    async def _process_batch_requests(self, requests: Sequence[DelayedRequest[InputT, OutputT]]) -> None:
-        results = await self._evaluate_with_logging(
-            [input_item for request in requests for input_item in request.inputs]
-        )
-        positions = [0] + list(accumulate(len(request.inputs) for request in requests))
-        for request, start, end in zip(requests, positions, positions[1:]):
-            if not request.future.done():
-                result = cast(list[OutputT], None if results is None else results[start:end])
-                request.future.set_result(result)
+        return self._lock
 
     async def _evaluate_with_logging(self, inputs: Sequence[InputT]) -> list[OutputT]:
         start_time = time.perf_counter()
@@ -125,6 +239,6 @@ class DelayedEvaluator(Generic[InputT, OutputT]):
                 f"Processed {self._task_name}",
                 n_items=len(inputs),
                 duration_ms=duration_ms,
-                wait_ms=self._delay_ms,
+                wait_ms=round(self._current_delay_ms),
             )
         return results
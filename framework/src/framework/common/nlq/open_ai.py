@@ -79,16 +79,18 @@ def suppress_tokenizer_warnings() -> Generator[None, Any, None]:
 class OpenAIClient:
     def __init__(self, config: OpenAIClientConfig) -> None:
         super().__init__()
-        self._client = instructor.from_openai(
-            openAILib.AsyncOpenAI(
-                api_key=config.api_key,
-                organization=config.organization,
-                project=config.project,
-                base_url=config.base_url,
-            )
+        self._openai_client = openAILib.AsyncOpenAI(
+            api_key=config.api_key,
+            organization=config.organization,
+            project=config.project,
+            base_url=config.base_url,
         )
+        self._client = instructor.from_openai(self._openai_client)
         self._openai_model = config.model
 
+    async def aclose(self) -> None:
+        await self._openai_client.close()
+
     async def query(self, prompt: str, instructor_prompt: str, response_model: type[BaseModel]) -> dict[str, Any]:
         max_retries = settings.SUPERLINKED_NLQ_MAX_RETRIES
         with suppress_tokenizer_warnings():
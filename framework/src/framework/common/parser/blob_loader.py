@@ -16,14 +16,16 @@
 import asyncio
 import base64
 import binascii
+import hashlib
 import logging
+import os
 from collections import defaultdict
 from urllib.parse import urlparse
 
 import aiofiles
 import httpx
 import structlog
-from beartype.typing import Any, Awaitable, Callable, Sequence
+from beartype.typing import Any, Awaitable, Callable, Mapping, Sequence, cast
 
 from superlinked.framework.blob.blob_handler_factory import (
     BlobHandlerConfig,
@@ -35,33 +37,76 @@ from superlinked.framework.common.exception import (
     UnexpectedResponseException,
 )
 from superlinked.framework.common.schema.blob_information import BlobInformation
+from superlinked.framework.common.settings import image_settings, settings
 from superlinked.framework.common.telemetry.telemetry_registry import telemetry
 from superlinked.framework.common.util.image_util import ImageUtil, PILImage
+from superlinked.framework.common.util.process_pool_util import ProcessPoolUtil
+from superlinked.framework.common.util.sqlite_key_value_store import (
+    SqliteKeyValueStore,
+)
 
 logger = structlog.getLogger()
 httpx_logger = logging.getLogger("httpx")
 httpx_logger.setLevel(logging.WARNING)
 
 GCS_URL_IDENTIFIER = "storage.cloud.google.com"
+NON_BASE64_URL_CHARS = (":", ".")
+LOCAL_FILE_SCHEMES = ("file", "")
+BLOB_CACHE_TABLE = "blob"
 
 
 class BlobLoader:
     def __init__(self, blob_handler_config: BlobHandlerConfig | None = None) -> None:
         self._scheme_to_load_function: dict[str, Callable[[Sequence[str]], Awaitable[list[BlobInformation]]]] = {
-            "file": BlobLoader._load_from_local,
-            "": BlobLoader._load_from_local,
+            "file": self._load_from_local,
+            "": self._load_from_local,
             "http": self._load_from_url,
             "https": self._load_from_url,
         }
         if handler := BlobHandlerFactory.create_blob_handler(blob_handler_config):
             self._scheme_to_load_function[handler.get_supported_cloud_storage_scheme()] = handler.download
         self._httpx_client: httpx.AsyncClient | None = None
+        # fetch and resize semaphores, shared by the concurrent loads of this loader
+        self.__semaphores_by_loop: dict[asyncio.AbstractEventLoop, tuple[asyncio.Semaphore, asyncio.Semaphore]] = {}
+        self._disk_cache = (
+            SqliteKeyValueStore.get_instance(
+                settings.BLOB_DISK_CACHE_PATH, BLOB_CACHE_TABLE, settings.BLOB_DISK_CACHE_MAX_SIZE_BYTES
+            )
+            if settings.BLOB_DISK_CACHE_PATH
+            else None
+        )
+        # resized blobs are cached separately for each resize config
+        self.__resize_config_key = ":".join(
+            str(setting)
+            for setting in [
+                image_settings.RESIZE_IMAGE_WIDTH,
+                image_settings.RESIZE_IMAGE_HEIGHT,
+                image_settings.IMAGE_FORMAT,
+                image_settings.IMAGE_QUALITY,
+            ]
+        )
 
     def _get_httpx_client(self) -> httpx.AsyncClient:
         if self._httpx_client is None or self._httpx_client.is_closed:
             self._httpx_client = httpx.AsyncClient(http2=True, follow_redirects=True)
         return self._httpx_client
 
+    def __get_semaphores(self) -> tuple[asyncio.Semaphore, asyncio.Semaphore]:
+        loop = asyncio.get_running_loop()
+        if (semaphores := self.__semaphores_by_loop.get(loop)) is None:
+            # semaphores are bound to the loop they are used in, those of closed loops are dropped
+            self.__semaphores_by_loop = {
+                semaphore_loop: loop_semaphores
+                for semaphore_loop, loop_semaphores in self.__semaphores_by_loop.items()
+                if not semaphore_loop.is_closed()
+            }
+            semaphores = (
+                asyncio.Semaphore(max(settings.BLOB_LOADER_MAX_CONCURRENT_FETCHES, 1)),
+                asyncio.Semaphore(max(settings.BLOB_LOADER_MAX_CONCURRENT_RESIZES, 1)),
+            )
+            self.__semaphores_by_loop[loop] = semaphores
+        return semaphores
+
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         if self._httpx_client is not None and not self._httpx_client.is_closed:
             await self._httpx_client.aclose()
@@ -98,12 +143,15 @@ class BlobLoader:
             )
 
     async def _load_parsed_inputs(self, parsed_inputs: Sequence[str | PILImage]) -> list[BlobInformation | None]:
-        loader_to_string_positions = self.__init_loader_to_string_positions(parsed_inputs)
         results: list[BlobInformation | None] = [None] * len(parsed_inputs)
+        loader_to_string_positions = self.__init_loader_to_string_positions(parsed_inputs, results)
+        cache_keys, cached_positions = await self.__load_from_cache(parsed_inputs, results, loader_to_string_positions)
 
         loader_tasks = []
         loader_info = []
         for loader, string_positions in loader_to_string_positions.items():
+            if not string_positions:
+                continue
             unique_strings = list(string_positions.keys())
             loader_tasks.append(loader(unique_strings))
             loader_info.append((unique_strings, string_positions))
@@ -112,21 +160,100 @@ class BlobLoader:
             for unique_string, blob_info in zip(unique_strings, blob_infos):
                 for position in string_positions[unique_string]:
                     results[position] = blob_info
-        index_pil_image_or_blob_info_pairs = [(i, blob) for i, blob in enumerate(results) if blob is not None] + [
-            (i, parsed_input) for i, parsed_input in enumerate(parsed_inputs) if isinstance(parsed_input, PILImage)
-        ]
+        index_pil_image_or_blob_info_pairs = [
+            (i, blob) for i, blob in enumerate(results) if blob is not None and i not in cached_positions
+        ] + [(i, parsed_input) for i, parsed_input in enumerate(parsed_inputs) if isinstance(parsed_input, PILImage)]
         resized_blobs = await asyncio.gather(
-            *[asyncio.to_thread(self.__resize, blob) for _, blob in index_pil_image_or_blob_info_pairs]
+            *[self.__resize_in_background(blob) for _, blob in index_pil_image_or_blob_info_pairs]
         )
         for (i, _), resized_blob in zip(index_pil_image_or_blob_info_pairs, resized_blobs):
             results[i] = resized_blob
+        await self.__write_to_cache(cache_keys, cached_positions, results)
         return results
 
-    @staticmethod
-    async def _load_from_local(paths: Sequence[str]) -> list[BlobInformation]:
+    def __calculate_cache_keys(
+        self, parsed_inputs: Sequence[str | PILImage], results: Sequence[BlobInformation | None]
+    ) -> dict[int, str]:
+        """
+        Maps the positions of the cacheable string inputs to their cache key. `results` holds the decoded
+        base64 inputs at this point, these are keyed by their content, everything else by its source.
+        """
+        string_to_cache_key: dict[str, str | None] = {}
+        cache_keys: dict[int, str] = {}
+        for i, parsed_input in enumerate(parsed_inputs):
+            if not isinstance(parsed_input, str):
+                continue
+            if parsed_input not in string_to_cache_key:
+                string_to_cache_key[parsed_input] = self.__calculate_cache_key(parsed_input, results[i])
+            if (cache_key := string_to_cache_key[parsed_input]) is not None:
+                cache_keys[i] = cache_key
+        return cache_keys
+
+    def __calculate_cache_key(self, blob_like_input: str, decoded_blob_info: BlobInformation | None) -> str | None:
+        if decoded_blob_info is not None and decoded_blob_info.data is not None:
+            return f"sha256:{hashlib.sha256(decoded_blob_info.data).hexdigest()}"
+        if urlparse(blob_like_input).scheme in LOCAL_FILE_SCHEMES:
+            try:
+                stat = os.stat(blob_like_input)
+            except OSError:
+                return None
+            # a modified local file gets a new key
+            return f"file:{blob_like_input}:{stat.st_mtime_ns}:{stat.st_size}"
+        return f"url:{blob_like_input}"
+
+    async def __load_from_cache(
+        self,
+        parsed_inputs: Sequence[str | PILImage],
+        results: list[BlobInformation | None],
+        loader_to_string_positions: Mapping[Any, dict[str, list[int]]],
+    ) -> tuple[dict[int, str], set[int]]:
+        """
+        Fills `results` with the already resized cached blobs, and removes them from the inputs to load.
+        Returns the cache keys by position and the positions found in the cache.
+        """
+        if self._disk_cache is None:
+            return {}, set()
+        cache_keys, cached_data = await asyncio.to_thread(self.__read_cache, parsed_inputs, results)
+        cached_positions = {i for i, cache_key in cache_keys.items() if cache_key in cached_data}
+        for i in cached_positions:
+            # decoded base64 inputs have no path
+            path = None if results[i] is not None else cast(str, parsed_inputs[i])
+            results[i] = BlobInformation(cached_data[cache_keys[i]], path)
+        for string_positions in loader_to_string_positions.values():
+            for cached_string in [
+                string for string, positions in string_positions.items() if positions[0] in cached_positions
+            ]:
+                del string_positions[cached_string]
+        return cache_keys, cached_positions
+
+    def __read_cache(
+        self, parsed_inputs: Sequence[str | PILImage], results: Sequence[BlobInformation | None]
+    ) -> tuple[dict[int, str], dict[str, bytes]]:
+        # calculating the keys of local files hits the disk too
+        cache_keys = self.__calculate_cache_keys(parsed_inputs, results)
+        if self._disk_cache is None or not cache_keys:
+            return cache_keys, {}
+        return cache_keys, self._disk_cache.get_many(self.__resize_config_key, list(cache_keys.values()))
+
+    async def __write_to_cache(
+        self, cache_keys: Mapping[int, str], cached_positions: set[int], results: Sequence[BlobInformation | None]
+    ) -> None:
+        if self._disk_cache is None:
+            return
+        key_to_data = {
+            cache_key: blob_info.data
+            for i, cache_key in cache_keys.items()
+            if i not in cached_positions and (blob_info := results[i]) is not None and blob_info.data is not None
+        }
+        if key_to_data:
+            await asyncio.to_thread(self._disk_cache.put_many, self.__resize_config_key, key_to_data)
+
+    async def _load_from_local(self, paths: Sequence[str]) -> list[BlobInformation]:
+        semaphore, _ = self.__get_semaphores()
+
         async def read_file(path: str) -> BlobInformation:
             try:
-                async with aiofiles.open(path, "rb") as f:
+                async with semaphore, aiofiles.open(path, "rb") as f:
                     content = await f.read()
             except (OSError, FileNotFoundError) as e:
                 raise InvalidInputException(f"Failed to open image {path}.") from e
@@ -134,15 +261,12 @@ class BlobLoader:
 
         return await asyncio.gather(*[read_file(path) for path in paths])
 
-    @staticmethod
-    async def _load_from_bytes(blob_like_inputs: Sequence[str]) -> list[BlobInformation]:
-        return [BlobInformation(base64.b64decode(blob_like_input), None) for blob_like_input in blob_like_inputs]
-
     async def _load_from_url(self, urls: Sequence[str]) -> list[BlobInformation]:
         client = self._get_httpx_client()
+        semaphore, _ = self.__get_semaphores()
 
         async def fetch(url: str) -> BlobInformation:
-            async with client.stream("GET", url) as resp:
+            async with semaphore, client.stream("GET", url) as resp:
                 resp.raise_for_status()
                 self._validate_response_content(url, resp)
                 content = await resp.aread()  # read fully; returns conn to pool
@@ -162,33 +286,54 @@ class BlobLoader:
             )
         raise UnexpectedResponseException(f"Unexpected HTML content for URL: {url}")
 
+    async def __resize_in_background(self, image_data: BlobInformation | PILImage) -> BlobInformation:
+        _, semaphore = self.__get_semaphores()
+        async with semaphore:
+            if isinstance(image_data, BlobInformation) and settings.BLOB_RESIZE_PROCESS_POOL_MAX_WORKERS > 0:
+                resized_data = await ProcessPoolUtil.run(
+                    settings.BLOB_RESIZE_PROCESS_POOL_MAX_WORKERS,
+                    ImageUtil.resize_image_data,
+                    BlobLoader.__get_blob_data(image_data),
+                )
+                return BlobInformation(resized_data, image_data.path)
+            return await asyncio.to_thread(self.__resize, image_data)
+
     def __resize(self, image_data: BlobInformation | PILImage) -> BlobInformation:
         if isinstance(image_data, BlobInformation):
-            if image_data.data is None:
-                raise InvalidStateException("Blob data is None, cannot resize.")
-            image = ImageUtil.open_image(image_data.data)
-            path = image_data.path
-        else:
-            image = image_data
-            path = None
-        return BlobInformation(ImageUtil.resize(image), path)
+            return BlobInformation(ImageUtil.resize_image_data(self.__get_blob_data(image_data)), image_data.path)
+        return BlobInformation(ImageUtil.resize(image_data), None)
+
+    @staticmethod
+    def __get_blob_data(blob_info: BlobInformation) -> bytes:
+        if blob_info.data is None:
+            raise InvalidStateException("Blob data is None, cannot resize.")
+        return blob_info.data
 
     def __init_loader_to_string_positions(
-        self, parsed_inputs: Sequence[str | PILImage]
+        self, parsed_inputs: Sequence[str | PILImage], results: list[BlobInformation | None]
     ) -> dict[Callable[[Sequence[str]], Awaitable[list[BlobInformation]]], dict[str, list[int]]]:
+        """
+        Groups the string inputs by their loader. Base64 encoded inputs need no loading,
+        they are decoded right away into `results`, reusing the decoded data of repeated inputs.
+        """
         loader_to_string_positions: dict[
             Callable[[Sequence[str]], Awaitable[list[BlobInformation]]], dict[str, list[int]]
         ] = defaultdict(lambda: defaultdict(list))
+        base64_string_to_blob_info: dict[str, BlobInformation] = {}
         for i, parsed_input in enumerate(parsed_inputs):
-            if isinstance(parsed_input, str):
-                loader = self.__get_loader(parsed_input)
-                loader_to_string_positions[loader][parsed_input].append(i)
+            if not isinstance(parsed_input, str):
+                continue
+            if (blob_info := base64_string_to_blob_info.get(parsed_input)) is None and (
+                decoded := self.__decode_if_base64(parsed_input)
+            ) is not None:
+                blob_info = base64_string_to_blob_info[parsed_input] = BlobInformation(decoded, None)
+            if blob_info is not None:
+                results[i] = blob_info
+            else:
+                loader_to_string_positions[self.__get_loader(parsed_input)][parsed_input].append(i)
         return loader_to_string_positions
 
     def __get_loader(self, blob_like_input: str) -> Callable[[Sequence[str]], Awaitable[list[BlobInformation]]]:
-        if self.__is_base64_encoded(blob_like_input):
-            return self._load_from_bytes
-
         scheme = urlparse(blob_like_input).scheme
         file_loader = self._scheme_to_load_function.get(scheme)
         if file_loader is None:
@@ -197,9 +342,11 @@ class BlobLoader:
             )
         return file_loader
 
-    def __is_base64_encoded(self, input_string: str) -> bool:
+    def __decode_if_base64(self, input_string: str) -> bytes | None:
+        # URLs and file paths are rejected without decoding, neither of these characters is valid in base64
+        if any(char in input_string for char in NON_BASE64_URL_CHARS):
+            return None
         try:
-            base64.b64decode(input_string, validate=True)
-            return True
+            return base64.b64decode(input_string, validate=True)
         except (binascii.Error, ValueError):
-            return False
+            return None
@@ -70,7 +70,12 @@ class DataParser(ABC, Generic[SourceTypeT]):
             self._created_at_name = self._get_path(cast(EventSchemaObject, schema).created_at)
         blob_loader = BlobLoader()
         self._delayed_blob_loader = DelayedEvaluator(
-            delay_ms=settings.BATCHED_BLOB_LOAD_WAIT_TIME_MS, eval_fn=blob_loader.load, task_name="blob load"
+            delay_ms=settings.BATCHED_BLOB_LOAD_WAIT_TIME_MS,
+            eval_fn=blob_loader.load,
+            task_name="blob load",
+            max_batch_size=settings.BATCHED_BLOB_LOAD_MAX_BATCH_SIZE,
+            max_in_flight_batches=settings.BATCHED_MAX_IN_FLIGHT_BATCHES,
+            adaptive=settings.BATCHED_ADAPTIVE_WAIT_TIME,
         )
 
     @classmethod
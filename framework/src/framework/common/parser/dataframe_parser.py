@@ -31,6 +31,9 @@ from superlinked.framework.common.parser.parsed_schema import (
 from superlinked.framework.common.schema.event_schema_object import EventSchemaObject
 from superlinked.framework.common.schema.schema_object import Blob, SchemaField
 
+# bool, signed and unsigned integer, float
+NUMERIC_DTYPE_KINDS = "biuf"
+
 
 class DataFrameParser(DataParser[pd.DataFrame]):
     """
@@ -53,48 +56,56 @@ class DataFrameParser(DataParser[pd.DataFrame]):
         Returns:
             list[ParsedSchema]: A list of ParsedSchema objects that will be processed by the spaces.
         """
-        df = data.copy()
         schema_cols: dict[str, SchemaField] = self._get_column_name_to_schema_field_mapping()
-        self._ensure_id(df)
-
-        df[self._id_name] = df[self._id_name].astype(str)
-        self._convert_columns_to_type(df, schema_cols)
+        self._ensure_id(data)
+        columns = self._convert_columns_to_type(data, schema_cols)
 
-        if blob_cols := [key for key, value in schema_cols.items() if isinstance(value, Blob)]:
-            col_key_to_values = {col_key: list(df[col_key]) for col_key in blob_cols}
+        if blob_cols := [key for key, value in schema_cols.items() if isinstance(value, Blob) and key in columns]:
+            col_key_to_values = {col_key: columns[col_key].tolist() for col_key in blob_cols}
             lengths = [len(vals) for vals in col_key_to_values.values()]
             all_blob_values = [v for vals in col_key_to_values.values() for v in vals]
             evaluated_blobs = await self._delayed_blob_loader.evaluate(all_blob_values)
             offsets = [0, *accumulate(lengths)]
             for col_key, start, end in zip(col_key_to_values.keys(), offsets, offsets[1:]):
-                df[col_key] = evaluated_blobs[start:end]
+                columns[col_key] = pd.Series(evaluated_blobs[start:end], index=data.index, dtype=object)
 
         if self._is_event_data_parser:
-            self.__ensure_created_at(df)
-            df[self._created_at_name] = df[self._created_at_name].astype(int)
-            self.__ensure_created_at_type(df)
+            self.__ensure_created_at(data)
+            columns[self._created_at_name] = columns[self._created_at_name].astype(int)
+            self.__ensure_created_at_type(columns[self._created_at_name])
 
-        filtered_cols = {col: schema_field for col, schema_field in schema_cols.items() if col in df.columns}
-        schema_data = cast(pd.DataFrame, df[list(filtered_cols.keys())])
-        records = cast(list[dict[str, Any]], schema_data.to_dict(orient="records"))
-        return [self.__create_parsed_schema(record, schema_cols) for record in records]
+        return self.__create_parsed_schemas(columns, schema_cols)
 
-    def __create_parsed_schema(self, record: dict[str, Any], schema_cols: dict[str, SchemaField]) -> ParsedSchema:
+    def __create_parsed_schemas(
+        self, columns: dict[str, pd.Series], schema_cols: dict[str, SchemaField]
+    ) -> list[ParsedSchema]:
         admin_field_names = [self._id_name] + ([self._created_at_name] if self._is_event_data_parser else [])
-        other_fields = [
-            ParsedSchemaField.from_schema_field(schema_field=schema_cols[key], value=value)
-            for key, value in record.items()
-            if key not in admin_field_names and self._field_has_non_null_value(value)
+        field_columns = [
+            (schema_cols[column_name], column.tolist(), self._get_non_null_mask(column))
+            for column_name, column in columns.items()
+            if column_name not in admin_field_names
+        ]
+        ids: list[str] = columns[self._id_name].tolist()
+        fields_per_row = [
+            [
+                ParsedSchemaField.from_schema_field(schema_field=schema_field, value=values[i])
+                for schema_field, values, non_null_mask in field_columns
+                if non_null_mask[i]
+            ]
+            for i in range(len(ids))
         ]
-        id_: str = cast(str, record[self._id_name])
         if self._is_event_data_parser:
-            return EventParsedSchema(
-                self._schema,
-                id_,
-                other_fields,
-                cast(int, record[self._created_at_name]),
-            )
-        return ParsedSchema(self._schema, id_, other_fields)
+            created_ats: list[int] = columns[self._created_at_name].tolist()
+            return [
+                EventParsedSchema(self._schema, id_, fields, created_at)
+                for id_, fields, created_at in zip(ids, fields_per_row, created_ats)
+            ]
+        return [ParsedSchema(self._schema, id_, fields) for id_, fields in zip(ids, fields_per_row)]
+
+    def _get_non_null_mask(self, column: pd.Series) -> list[bool]:
+        if column.dtype.kind in NUMERIC_DTYPE_KINDS:
+            return column.notna().tolist()
+        return [self._field_has_non_null_value(value) for value in column.tolist()]
 
     @staticmethod
     def _check_value_is_null(value: Any) -> bool:
@@ -148,11 +159,8 @@ class DataFrameParser(DataParser[pd.DataFrame]):
                 f"Create a created_at column with the specified name."
             )
 
-    def __ensure_created_at_type(self, data: pd.DataFrame) -> None:
-        if any(
-            not self._is_created_at_value_valid(_created_at_val)
-            for _created_at_val in data[self._created_at_name].tolist()
-        ):
+    def __ensure_created_at_type(self, created_at_column: pd.Series) -> None:
+        if any(not self._is_created_at_value_valid(_created_at_val) for _created_at_val in created_at_column.tolist()):
             raise InvalidInputException("The mandatory created_at field has missing values in the event input object.")
 
     def _has_missing_ids(self, data: pd.DataFrame) -> bool:
@@ -167,11 +175,35 @@ class DataFrameParser(DataParser[pd.DataFrame]):
         self,
         data: pd.DataFrame,
         schema_cols: dict[str, SchemaField],
-    ) -> None:
+    ) -> dict[str, pd.Series]:
+        """
+        Returns the converted schema columns in schema order, leaving `data` untouched.
+        """
+        columns: dict[str, pd.Series] = {}
         for column_name, schema_field in schema_cols.items():
             if column_name not in data.columns and schema_field.nullable:
                 continue
-            # pylint: disable=W0640
-            data[column_name] = data[column_name].apply(
-                lambda x: schema_field.as_type(x) if self._field_has_non_null_value(x) else None
-            )
+            column = data[column_name]
+            if column_name == self._id_name:
+                column = column.astype(str)
+            columns[column_name] = self._convert_column_to_type(column, schema_field)
+        return columns
+
+    def _convert_column_to_type(self, column: pd.Series, schema_field: SchemaField) -> pd.Series:
+        """
+        Casts the whole column at once where that results in the same values as calling `as_type` on every
+        non-null cell, otherwise converts the column cell by cell.
+        """
+        if (
+            (schema_field.type_ is float and column.dtype.kind in "iuf")
+            or (schema_field.type_ is int and column.dtype.kind == "i")
+            or (schema_field.type_ is bool and column.dtype.kind == "b")
+        ):
+            return column.astype(schema_field.type_, copy=False)
+        if (
+            schema_field.type_ is str
+            and column.dtype == object
+            and pd.api.types.infer_dtype(column, skipna=True) == "string"
+        ):
+            return column.where(column.notna(), None) if column.hasnans else column
+        return column.apply(lambda x: schema_field.as_type(x) if self._field_has_non_null_value(x) else None)
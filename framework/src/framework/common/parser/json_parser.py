@@ -16,7 +16,7 @@ from __future__ import annotations
 
 from itertools import accumulate
 
-from beartype.typing import Any, Sequence, cast
+from beartype.typing import Any, Callable, Mapping, Sequence, cast
 
 from superlinked.framework.common.exception import InvalidInputException
 from superlinked.framework.common.parser.data_parser import DataParser
@@ -29,6 +29,7 @@ from superlinked.framework.common.schema.event_schema_object import (
     EventSchemaObject,
     SchemaReference,
 )
+from superlinked.framework.common.schema.id_schema_object import IdSchemaObject
 from superlinked.framework.common.schema.schema_object import Blob, SchemaField
 from superlinked.framework.common.util.dot_separated_path_util import (
     DotSeparatedPathUtil,
@@ -42,6 +43,11 @@ class JsonParser(DataParser[dict[str, Any]]):
     it transforms the `Json` to a desired schema.
     """
 
+    def __init__(self, schema: IdSchemaObject, mapping: Mapping[SchemaField, str] | None = None) -> None:
+        super().__init__(schema, mapping)
+        # compiled on the first unmarshal, parsers are also created just to marshal
+        self.__field_getters: dict[SchemaField, Callable[[Mapping], Any]] | None = None
+
     async def unmarshal(self, data: Sequence[dict[str, Any]]) -> list[ParsedSchema]:
         """
         Parses the given Json into a list of ParsedSchema objects according to the defined schema and mapping.
@@ -55,12 +61,14 @@ class JsonParser(DataParser[dict[str, Any]]):
         if isinstance(data, dict):
             data = [data]
 
-        ids = [self.__ensure_id(json_data) for json_data in data]
+        field_getters = self.__get_field_getters()
+        ids = [self.__ensure_id(id_) for id_ in map(field_getters[self._schema.id], data)]
         all_results = await self._process_fields(self._schema.schema_fields, data)
         parsed_fields_for_each_field = self._create_parsed_fields_for_each_field(all_results)
         parsed_fields_for_each_data = self._transpose_parsed_fields(data, parsed_fields_for_each_field)
         if self._is_event_data_parser:
-            created_at_values = [self.__ensure_created_at(json_data) for json_data in data]
+            created_at_getter = field_getters[cast(EventSchemaObject, self._schema).created_at]
+            created_at_values = [self.__ensure_created_at(created_at) for created_at in map(created_at_getter, data)]
             return [
                 EventParsedSchema(self._schema, id_, fields, created_at)
                 for id_, fields, created_at in zip(ids, parsed_fields_for_each_data, created_at_values)
@@ -92,8 +100,16 @@ class JsonParser(DataParser[dict[str, Any]]):
     def _read_field_values(
         self, fields: Sequence[SchemaField], json_datas: Sequence[dict[str, Any]]
     ) -> dict[SchemaField, list[Any]]:
-        field_paths = {field: self._get_path(field) for field in fields}
-        return {field: [DotSeparatedPathUtil.get(data, field_paths[field]) for data in json_datas] for field in fields}
+        field_getters = self.__get_field_getters()
+        return {field: list(map(field_getters[field], json_datas)) for field in fields}
+
+    def __get_field_getters(self) -> dict[SchemaField, Callable[[Mapping], Any]]:
+        if self.__field_getters is None:
+            fields: list[SchemaField] = [*self._schema.schema_fields, self._schema.id]
+            if self._is_event_data_parser:
+                fields.append(cast(EventSchemaObject, self._schema).created_at)
+            self.__field_getters = {field: DotSeparatedPathUtil.compile_get(self._get_path(field)) for field in fields}
+        return self.__field_getters
 
     def _create_parsed_fields_for_each_field(
         self, all_results: Sequence[tuple[SchemaField, Sequence]]
@@ -142,16 +158,14 @@ class JsonParser(DataParser[dict[str, Any]]):
             ]
         )
 
-    def __ensure_id(self, data: dict[str, Any]) -> str:
-        id_ = DotSeparatedPathUtil.get(data, self._id_name)
+    def __ensure_id(self, id_: Any) -> str:
         if not self._is_id_value_valid(id_):
             raise InvalidInputException(
                 "The mandatory id field has missing or has invalid type values in the input object."
             )
         return str(id_)
 
-    def __ensure_created_at(self, data: dict[str, Any]) -> int:
-        created_at = DotSeparatedPathUtil.get(data, self._created_at_name)
+    def __ensure_created_at(self, created_at: Any) -> int:
         if not self._is_created_at_value_valid(created_at):
             raise InvalidInputException(
                 f"The mandatory {self._created_at_name} field has missing "
@@ -60,10 +60,24 @@ class Settings(YamlBasedSettings):
     BATCHED_VDB_READ_WAIT_TIME_MS: int = 0
     BATCHED_BLOB_LOAD_WAIT_TIME_MS: int = 0
     BATCHED_VDB_WRITE_WAIT_TIME_MS: int = 0
+    BATCHED_EMBEDDING_MAX_BATCH_SIZE: int = 0
+    BATCHED_VDB_READ_MAX_BATCH_SIZE: int = 0
+    BATCHED_BLOB_LOAD_MAX_BATCH_SIZE: int = 0
+    BATCHED_VDB_WRITE_MAX_BATCH_SIZE: int = 0
+    BATCHED_MAX_IN_FLIGHT_BATCHES: int | None = None
+    BATCHED_ADAPTIVE_WAIT_TIME: bool = False
+    # Blob loading specific settings - limits per blob loader, shared by its concurrent loads
+    BLOB_LOADER_MAX_CONCURRENT_FETCHES: int = 64
+    BLOB_LOADER_MAX_CONCURRENT_RESIZES: int = 16
+    # Image resizing is spread across this many worker processes, disabled if not positive
+    BLOB_RESIZE_PROCESS_POOL_MAX_WORKERS: int = 0
+    BLOB_DISK_CACHE_PATH: str | None = None
+    BLOB_DISK_CACHE_MAX_SIZE_BYTES: int = 1024**3
     # Embedding specific settings - model
     MODEL_WARMUP: bool = False
     MODEL_CACHE_DIR: str | None = None
     MODEL_LOCK_TIMEOUT_SECONDS: int = 120
+    EMBEDDING_DISK_CACHE_PATH: str | None = None
     SENTENCE_TRANSFORMERS_MODEL_LOCK_MAX_RETRIES: int = 10
     SENTENCE_TRANSFORMERS_MODEL_LOCK_RETRY_DELAY: int = 1
     SENTENCE_TRANSFORMERS_MODEL_LOCK_TIMEOUT_BUFFER_SECONDS: int = 10
@@ -83,10 +97,17 @@ class Settings(YamlBasedSettings):
     DAG_VISUALIZATION_OUTPUT_DIR: str | None = None
     # Online settings
     ONLINE_PUT_CHUNK_SIZE: int = 10000
+    # Chunking is spread across this many worker processes, disabled if not positive
+    CHUNKING_PROCESS_POOL_MAX_WORKERS: int = 0
+    CHUNKING_PROCESS_POOL_MIN_TEXT_LENGTH: int = 1_000_000
     # Query settings
     QUERY_TO_RETURN_ORIGIN_ID: bool = False
+    # Number of entities whose stored vectors are cached for with_vector clauses, disabled if not positive
+    QUERY_STORED_VECTOR_CACHE_SIZE: int = 0
     # NLQ specific params
     SUPERLINKED_NLQ_MAX_RETRIES: int = 3
+    SUPERLINKED_NLQ_CACHE_SIZE: int = 1024
+    SUPERLINKED_NLQ_CACHE_TTL_SECONDS: int = 3600
 
     model_config = SettingsConfigDict(
         yaml_file=YAML_FILENAME, yaml_config_section=FRAMEWORK_SECTION, extra="ignore", frozen=True
@@ -161,6 +182,13 @@ class VectorDatabaseSettings(BaseModel):
     REDIS_RETRY_ON_TIMEOUT: bool = True
     REDIS_DEFAULT_HYBRID_POLICY: str | None = None
     REDIS_DEFAULT_BATCH_SIZE: int | None = 250
+    REDIS_WRITE_PIPELINE_CHUNK_SIZE: int = 500
+    REDIS_MAX_CONCURRENT_WRITE_PIPELINES: int = 8
+    # Connectors with synchronous clients (MongoDB, TopK)
+    VDB_CLIENT_MAX_WORKERS: int = 16
+    VDB_CLIENT_CHUNK_SIZE: int = 1000
+    # Qdrant specific params
+    QDRANT_EXISTING_POINT_ID_CACHE_SIZE: int = 100000
 
 
 class ResourceSettings(YamlBasedSettings):
@@ -15,14 +15,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from itertools import chain
 
 import numpy as np
-from beartype.typing import Generic, Sequence
+from beartype.typing import Generic, Sequence, cast
 from typing_extensions import override
 
 from superlinked.framework.common.const import constants
 from superlinked.framework.common.dag.context import ExecutionContext
-from superlinked.framework.common.data_types import NPArray, Vector, VectorItemT
+from superlinked.framework.common.data_types import Vector, VectorItemT
 from superlinked.framework.common.exception import InvalidStateException
 from superlinked.framework.common.interface.weighted import Weighted
 from superlinked.framework.common.space.config.aggregation.aggregation_config import (
@@ -52,6 +54,13 @@ class Aggregation(ABC, Generic[AggregationInputT]):
         context: ExecutionContext,
     ) -> AggregationInputT: ...
 
+    def aggregate_weighted_multiple(
+        self,
+        weighted_items_list: Sequence[Sequence[Weighted[AggregationInputT]]],
+        context: ExecutionContext,
+    ) -> list[AggregationInputT]:
+        return [self.aggregate_weighted(weighted_items, context) for weighted_items in weighted_items_list]
+
 
 class VectorAggregation(Aggregation[Vector]):
     @override
@@ -68,40 +77,89 @@ class VectorAggregation(Aggregation[Vector]):
 
     @override
     def aggregate_weighted(self, weighted_items: Sequence[Weighted[Vector]], context: ExecutionContext) -> Vector:
-        weighted_vectors = [
-            weighted
-            for weighted in weighted_items
-            if not weighted.item.is_empty and weighted.weight != constants.DEFAULT_NOT_AFFECTING_WEIGHT
+        return self.aggregate_weighted_multiple([weighted_items], context)[0]
+
+    @override
+    def aggregate_weighted_multiple(
+        self, weighted_items_list: Sequence[Sequence[Weighted[Vector]]], context: ExecutionContext
+    ) -> list[Vector]:
+        weighted_vectors_list = [
+            [
+                weighted
+                for weighted in weighted_items
+                if not weighted.item.is_empty and weighted.weight != constants.DEFAULT_NOT_AFFECTING_WEIGHT
+            ]
+            for weighted_items in weighted_items_list
         ]
-        if not weighted_vectors:
-            return Vector.empty_vector()
-        if len(weighted_vectors) == 1:
-            return weighted_vectors[0].item * weighted_vectors[0].weight
-        result_value = np.zeros_like(weighted_vectors[0].item.value, dtype=VectorItemT)
-        for weighted in weighted_vectors:
-            result_value += (
-                np.where(weighted.item.value_mask, weighted.item.value, constants.DEFAULT_NOT_AFFECTING_EMBEDDING_VALUE)
-                * weighted.weight
+        results: list[Vector | None] = []
+        positions_by_shape: dict[tuple[int, int], list[int]] = defaultdict(list)
+        for position, weighted_vectors in enumerate(weighted_vectors_list):
+            if not weighted_vectors:
+                results.append(Vector.empty_vector())
+            elif len(weighted_vectors) == 1:
+                results.append(weighted_vectors[0].item * weighted_vectors[0].weight)
+            else:
+                results.append(None)
+                positions_by_shape[(len(weighted_vectors), weighted_vectors[0].item.dimension)].append(position)
+        for positions in positions_by_shape.values():
+            aggregated_vectors = self.__aggregate_stacked([weighted_vectors_list[position] for position in positions])
+            for position, aggregated_vector in zip(positions, aggregated_vectors):
+                results[position] = aggregated_vector
+        return cast(list[Vector], results)
+
+    def __aggregate_stacked(self, weighted_vectors_list: Sequence[Sequence[Weighted[Vector]]]) -> list[Vector]:
+        """
+        Aggregates groups of the same size at once, reducing a (group, vector, dimension) shaped array along its
+        vector axis. The reduction adds the vectors of a group in order, so the sums match a sequential loop.
+        """
+        weighted_vectors = list(chain.from_iterable(weighted_vectors_list))
+        values = np.stack([weighted.item.value for weighted in weighted_vectors])
+        negative_filter_mask = self.__calculate_negative_filter_mask(weighted_vectors, values.shape)
+        weights = np.array([weighted.weight for weighted in weighted_vectors], dtype=VectorItemT)
+        weighted_values = (
+            np.where(negative_filter_mask, constants.DEFAULT_NOT_AFFECTING_EMBEDDING_VALUE, values) * weights[:, None]
+        )
+        group_shape = (len(weighted_vectors_list), len(weighted_vectors_list[0]), values.shape[1])
+        result_values = np.add.reduce(weighted_values.reshape(group_shape), axis=1, initial=0.0)
+        result_negative_filter_mask = np.zeros(result_values.shape, dtype=np.bool_)
+        # negative filters usually occupy a few dimensions only, the other columns are skipped
+        if len(columns := np.flatnonzero(negative_filter_mask.any(axis=0))):
+            column_negative_filter_mask = negative_filter_mask[:, columns].reshape((*group_shape[:2], len(columns)))
+            column_values = values[:, columns].reshape(column_negative_filter_mask.shape)
+            result_negative_filter_mask[:, columns] = column_negative_filter_mask.any(axis=1) & (
+                result_values[:, columns] == constants.DEFAULT_NOT_AFFECTING_EMBEDDING_VALUE
             )
-        index_to_negative_filter = self.__calculate_index_to_negative_filter(weighted_vectors, result_value)
-        for index, filter_value in index_to_negative_filter.items():
-            result_value[index] = filter_value
-        return Vector(result_value, set(index_to_negative_filter.keys()))
-
-    def __calculate_index_to_negative_filter(
-        self, weighted_vectors: Sequence[Weighted[Vector]], result_value: NPArray
-    ) -> dict[int, float]:
-        index_to_negative_filter: dict[int, float] = {}
-        for weighted in weighted_vectors:
-            for i in weighted.item.negative_filter_indices:
-                negative_filter = weighted.item.value[i]
-                if i in index_to_negative_filter and index_to_negative_filter[i] != negative_filter:
-                    raise InvalidStateException(
-                        f"Cannot aggregate vectors having different negative filter values at index {i}"
-                    )
-                if result_value[i] == constants.DEFAULT_NOT_AFFECTING_EMBEDDING_VALUE:
-                    index_to_negative_filter[i] = negative_filter
-        return index_to_negative_filter
+            negative_filter_min = np.where(column_negative_filter_mask, column_values, np.inf).min(axis=1)
+            negative_filter_max = np.where(column_negative_filter_mask, column_values, -np.inf).max(axis=1)
+            if conflicting_columns := np.flatnonzero(
+                (result_negative_filter_mask[:, columns] & (negative_filter_min != negative_filter_max)).any(axis=0)
+            ).tolist():
+                raise InvalidStateException(
+                    "Cannot aggregate vectors having different negative filter values "
+                    f"at index {columns[conflicting_columns[0]]}"
+                )
+            result_values[:, columns] = np.where(
+                result_negative_filter_mask[:, columns], negative_filter_min, result_values[:, columns]
+            )
+        return [
+            Vector(result_value, set(np.flatnonzero(negative_filter_row).tolist()))
+            for result_value, negative_filter_row in zip(result_values, result_negative_filter_mask)
+        ]
+
+    @staticmethod
+    def __calculate_negative_filter_mask(
+        weighted_vectors: Sequence[Weighted[Vector]], shape: tuple[int, ...]
+    ) -> np.ndarray:
+        negative_filter_indices_list = [list(weighted.item.negative_filter_indices) for weighted in weighted_vectors]
+        row_indices = np.repeat(
+            np.arange(len(weighted_vectors)), [len(indices) for indices in negative_filter_indices_list]
+        )
+        column_indices = np.fromiter(
+            chain.from_iterable(negative_filter_indices_list), dtype=np.int64, count=len(row_indices)
+        )
+        negative_filter_mask = np.zeros(shape, dtype=np.bool_)
+        negative_filter_mask[row_indices, column_indices] = True
+        return negative_filter_mask
 
 
 class NumberAggregation(Generic[NumberAggregationInputT], Aggregation[NumberAggregationInputT], ABC):
@@ -42,3 +42,11 @@ class AggregationStep(
         context: ExecutionContext,
     ) -> AggregationInputT:
         return self._aggregation.aggregate_weighted(input_, context)
+
+    @override
+    async def transform_multiple(
+        self,
+        inputs: Sequence[Sequence[Weighted[AggregationInputT]]],
+        context: ExecutionContext,
+    ) -> list[AggregationInputT]:
+        return self._aggregation.aggregate_weighted_multiple(inputs, context)
@@ -44,15 +44,46 @@ class CategoricalSimilarityEmbedding(InvertibleEmbedding[list[str], CategoricalS
         self._other_category_index: int | None = self.length - 1 if self._config.uncategorized_as_category else None
         self._category_index_map: dict[str, int] = {elem: i for i, elem in enumerate(self._config.categories)}
         self._default_n_hot_encoding = np.full(self.length, self._config.negative_filter, dtype=VectorItemT)
+        self._default_query_n_hot_encoding = np.full(
+            self.length, constants.DEFAULT_NOT_AFFECTING_EMBEDDING_VALUE, dtype=VectorItemT
+        )
 
     @override
     def embed(self, input_: list[str], context: ExecutionContext) -> Vector:
         if not input_:
             return self._config.default_vector
-        n_hot_encoding: NPArray = self._n_hot_encode(input_, context.is_query_context)
-        negative_filter_indices = {i for i in range(self.length) if i not in self._get_category_indices(input_)}
+        category_indices = self._get_category_indices(input_)
+        n_hot_encoding: NPArray = self._n_hot_encode(category_indices, len(input_), context.is_query_context)
+        negative_filter_indices = set(range(self.length)).difference(category_indices)
         return Vector(n_hot_encoding, negative_filter_indices)
 
+    @override
+    async def embed_multiple(self, inputs: Sequence[list[str]], context: ExecutionContext) -> list[Vector]:
+        """
+        Same as `embed` for every input, but builds the n-hot matrix of the whole batch with scatter indexing.
+        """
+        is_query = context.is_query_context
+        category_indices_list = [self._get_category_indices(input_) for input_ in inputs]
+        row_indices = np.repeat(np.arange(len(inputs)), [len(indices) for indices in category_indices_list])
+        column_indices = np.fromiter(
+            (index for indices in category_indices_list for index in indices), dtype=np.int64, count=len(row_indices)
+        )
+        categorical_values = np.array(
+            [self.get_categorical_encoding_value(len(input_), is_query) for input_ in inputs], dtype=VectorItemT
+        )
+        n_hot_matrix = np.tile(self._get_default_n_hot_encoding(is_query), (len(inputs), 1))
+        n_hot_matrix[row_indices, column_indices] = categorical_values[row_indices]
+        negative_filter_mask = np.ones((len(inputs), self.length), dtype=np.bool_)
+        negative_filter_mask[row_indices, column_indices] = False
+        return [
+            (
+                Vector(n_hot_encoding, set(np.flatnonzero(row_negative_filter_mask).tolist()))
+                if input_
+                else self._config.default_vector
+            )
+            for input_, n_hot_encoding, row_negative_filter_mask in zip(inputs, n_hot_matrix, negative_filter_mask)
+        ]
+
     @override
     def inverse_embed(self, vector: Vector, context: ExecutionContext) -> list[str]:
         return [
@@ -65,16 +96,15 @@ class CategoricalSimilarityEmbedding(InvertibleEmbedding[list[str], CategoricalS
         sqrt_len_config_categories: float = math.sqrt(len(self._config.categories))
         return sqrt_len_config_categories / (len_category_list or 1.0) if is_query else 1.0 / sqrt_len_config_categories
 
-    def _n_hot_encode(self, category_list: Sequence[str], is_query: bool) -> NPArray:
-        n_hot_encoding = self._default_n_hot_encoding.copy()
-        categorical_value = self.get_categorical_encoding_value(len(category_list), is_query)
-        if is_query:
-            n_hot_encoding.fill(constants.DEFAULT_NOT_AFFECTING_EMBEDDING_VALUE)
-        category_indices = self._get_category_indices(category_list)
+    def _n_hot_encode(self, category_indices: list[int], len_category_list: int, is_query: bool) -> NPArray:
+        n_hot_encoding = self._get_default_n_hot_encoding(is_query).copy()
         if category_indices:
-            n_hot_encoding[category_indices] = categorical_value
+            n_hot_encoding[category_indices] = self.get_categorical_encoding_value(len_category_list, is_query)
         return n_hot_encoding
 
+    def _get_default_n_hot_encoding(self, is_query: bool) -> NPArray:
+        return self._default_query_n_hot_encoding if is_query else self._default_n_hot_encoding
+
     def _get_category_indices(self, text_input: Sequence[str]) -> list[int]:
         return list(
             {
@@ -0,0 +1,62 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import numpy as np
+from beartype.typing import Sequence
+
+from superlinked.framework.common.data_types import Vector, VectorItemT
+from superlinked.framework.common.exception import InvalidStateException
+from superlinked.framework.common.util.sqlite_key_value_store import (
+    SqliteKeyValueStore,
+)
+
+EMBEDDING_TABLE = "embedding"
+
+
+class DiskEmbeddingCache:
+    """
+    Persistent embedding cache backed by a local sqlite file.
+    Vectors are stored as float32 blobs keyed by a namespace (identifying the embedding engine)
+    and the embedded input, so they survive restarts and can be shared by replicas on the same volume.
+    """
+
+    def __init__(self, store: SqliteKeyValueStore) -> None:
+        self._store = store
+
+    @classmethod
+    def get_instance(cls, path: str) -> DiskEmbeddingCache:
+        return cls(SqliteKeyValueStore.get_instance(path, EMBEDDING_TABLE))
+
+    def get_many(self, namespace: str, inputs: Sequence[str]) -> dict[str, Vector]:
+        return {
+            input_: Vector(np.frombuffer(blob, dtype=VectorItemT))
+            for input_, blob in self._store.get_many(namespace, inputs).items()
+        }
+
+    def put_many(self, namespace: str, inputs: Sequence[str], vectors: Sequence[Vector]) -> None:
+        if len(inputs) != len(vectors):
+            raise InvalidStateException(
+                "Number of inputs must match number of vectors.",
+                num_inputs=len(inputs),
+                num_vectors=len(vectors),
+            )
+        self._store.put_many(
+            namespace,
+            {
+                input_: np.ascontiguousarray(vector.value, dtype=VectorItemT).tobytes()
+                for input_, vector in zip(inputs, vectors)
+            },
+        )
@@ -0,0 +1,106 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from beartype.typing import Any, Awaitable, Callable, Coroutine, Hashable, Sequence, TypeVar, cast
+
+from superlinked.framework.common.exception import InvalidStateException
+
+ResultT = TypeVar("ResultT")
+
+EvaluateFn = Callable[[Sequence[Any]], Awaitable[list[Any]]]
+
+
+@dataclass
+class _PendingGroup:
+    evaluate_fn: EvaluateFn
+    requests: list[tuple[Sequence[Any], asyncio.Future[list[Any]]]] = field(default_factory=list)
+
+
+class EmbeddingBatchScope:
+    """
+    Coalesces the embedding requests of a known set of concurrently running coroutines.
+    Requests are held back until every coroutine that is still running waits for an embedding,
+    then the inputs sharing a key are evaluated with a single call.
+    """
+
+    __current: ContextVar[EmbeddingBatchScope | None] = ContextVar("embedding_batch_scope", default=None)
+
+    def __init__(self) -> None:
+        self.__active_count = 0
+        self.__waiting_count = 0
+        self.__pending_groups: dict[Hashable, _PendingGroup] = {}
+        self.__tasks: set[asyncio.Task[None]] = set()
+
+    @classmethod
+    def get_current(cls) -> EmbeddingBatchScope | None:
+        return cls.__current.get()
+
+    async def run(self, coroutines: Sequence[Coroutine[Any, Any, ResultT]]) -> list[ResultT]:
+        if self.__active_count:
+            raise InvalidStateException("Embedding batch scope is already running.")
+        self.__active_count = len(coroutines)
+        token = EmbeddingBatchScope.__current.set(self)
+        try:
+            # tasks created by gather copy the context, so every coroutine sees this scope
+            return list(await asyncio.gather(*[self.__run_participant(coroutine) for coroutine in coroutines]))
+        finally:
+            EmbeddingBatchScope.__current.reset(token)
+
+    async def evaluate(self, key: Hashable, inputs: Sequence[Any], evaluate_fn: EvaluateFn) -> list[Any]:
+        future: asyncio.Future[list[Any]] = asyncio.get_running_loop().create_future()
+        self.__pending_groups.setdefault(key, _PendingGroup(evaluate_fn)).requests.append((inputs, future))
+        self.__waiting_count += 1
+        self.__flush_if_every_participant_waits()
+        return await future
+
+    async def __run_participant(self, coroutine: Coroutine[Any, Any, ResultT]) -> ResultT:
+        try:
+            return await coroutine
+        finally:
+            self.__active_count -= 1
+            self.__flush_if_every_participant_waits()
+
+    def __flush_if_every_participant_waits(self) -> None:
+        if not self.__waiting_count or self.__waiting_count < self.__active_count:
+            return
+        pending_groups = self.__pending_groups
+        self.__pending_groups = {}
+        self.__waiting_count = 0
+        for pending_group in pending_groups.values():
+            task = asyncio.create_task(self.__evaluate_group(pending_group))
+            self.__tasks.add(task)
+            task.add_done_callback(self.__tasks.discard)
+
+    async def __evaluate_group(self, pending_group: _PendingGroup) -> None:
+        try:
+            results = await pending_group.evaluate_fn(
+                [input_ for inputs, _ in pending_group.requests for input_ in inputs]
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            for _, future in pending_group.requests:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        position = 0
+        for inputs, future in pending_group.requests:
+            end = position + len(inputs)
+            if not future.done():
+                future.set_result(cast(list[Any], None) if results is None else results[position:end])
+            position = end
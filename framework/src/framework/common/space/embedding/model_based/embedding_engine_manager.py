@@ -23,6 +23,9 @@ from superlinked.framework.common.data_types import Vector
 from superlinked.framework.common.delayed_evaluator import DelayedEvaluator
 from superlinked.framework.common.exception import NotImplementedException
 from superlinked.framework.common.settings import settings
+from superlinked.framework.common.space.embedding.model_based.embedding_batch_scope import (
+    EmbeddingBatchScope,
+)
 from superlinked.framework.common.space.embedding.model_based.embedding_input import (
     ModelEmbeddingInput,
 )
@@ -88,9 +91,18 @@ class EmbeddingEngineManager:
         with telemetry.span("engine.embed", attributes=labels):
             telemetry.record_metric("engine.embed.count", len(inputs), labels=labels)
             engine = self._get_engine(model_handler, model_name, model_cache_dir, config)
-            embeddings = await self._get_delayed_evaluator(engine, is_query_context).evaluate(inputs)
+            embeddings = await self._evaluate(engine, is_query_context, inputs)
             return [Vector(embedding) for embedding in embeddings]
 
+    async def _evaluate(
+        self, engine: EmbeddingEngine, is_query_context: bool, inputs: Sequence[ModelEmbeddingInput]
+    ) -> list[list[float]]:
+        delayed_evaluator = self._get_delayed_evaluator(engine, is_query_context)
+        if (batch_scope := EmbeddingBatchScope.get_current()) is not None:
+            key = self._get_delayed_evaluator_key(engine, is_query_context)
+            return await batch_scope.evaluate(key, inputs, delayed_evaluator.evaluate)
+        return await delayed_evaluator.evaluate(inputs)
+
     async def calculate_length(
         self,
         model_handler: ModelHandlerType,
@@ -107,6 +119,15 @@ class EmbeddingEngineManager:
             logger.info("Consider caching model dimension.", model_name=clean_model_name, dimension=length)
         return length
 
+    def calculate_engine_key(
+        self,
+        model_handler: ModelHandlerType,
+        model_name: str,
+        model_cache_dir: Path | None,
+        config: EmbeddingEngineConfig,
+    ) -> str:
+        return self._get_engine_type(model_handler).calculate_key(model_name, model_cache_dir, config)
+
     def clear_engines(self) -> None:
         self._key_to_engine.clear()
 
@@ -130,7 +151,12 @@ class EmbeddingEngineManager:
         for is_query in [False, True]:
             embed_fn = self._create_engine_embed_fn(engine, is_query)
             self._key_to_delayed_evaluator[(engine_key, is_query)] = DelayedEvaluator(
-                delay_ms=delay_ms, eval_fn=embed_fn, task_name=f"{engine._model_name} embed"
+                delay_ms=delay_ms,
+                eval_fn=embed_fn,
+                task_name=f"{engine._model_name} embed",
+                max_batch_size=settings.BATCHED_EMBEDDING_MAX_BATCH_SIZE,
+                max_in_flight_batches=settings.BATCHED_MAX_IN_FLIGHT_BATCHES,
+                adaptive=settings.BATCHED_ADAPTIVE_WAIT_TIME,
             )
 
     def _create_engine_embed_fn(
@@ -142,11 +168,14 @@ class EmbeddingEngineManager:
         return embed_fn
 
     def _get_delayed_evaluator(self, engine: EmbeddingEngine, is_query_context: bool) -> DelayedEvaluator:
-        key = (engine.key, is_query_context and engine.is_query_prompt_supported())
+        key = self._get_delayed_evaluator_key(engine, is_query_context)
         if (delayed_evaluator := self._key_to_delayed_evaluator.get(key)) is not None:
             return delayed_evaluator
         raise NotImplementedException("No delayed evaluator found.", engine_key=key)
 
+    def _get_delayed_evaluator_key(self, engine: EmbeddingEngine, is_query_context: bool) -> tuple[str, bool]:
+        return (engine.key, is_query_context and engine.is_query_prompt_supported())
+
     def _get_engine_type(self, model_handler: ModelHandlerType) -> type[EmbeddingEngine]:
         if (engine_type := ENGINE_BY_HANDLER.get(model_handler)) is not None:
             return engine_type
@@ -17,7 +17,7 @@ from pathlib import Path
 
 import modal
 import structlog
-from beartype.typing import Sequence
+from beartype.typing import Awaitable, Callable, Sequence
 from typing_extensions import override
 
 from superlinked.framework.common.exception import UnexpectedResponseException
@@ -30,13 +30,22 @@ from superlinked.framework.common.space.embedding.model_based.engine.embedding_e
 from superlinked.framework.common.space.embedding.model_based.engine.modal_engine_config import (
     ModalEngineConfig,
 )
+from superlinked.framework.common.util.collection_util import CollectionUtil
 
 logger = structlog.getLogger()
 
 
+RemoteEmbedFn = Callable[[list[ModelEmbeddingInput], str], Awaitable[list[list[float]]]]
+
+
 class ModalEngine(EmbeddingEngine[ModalEngineConfig]):
     def __init__(self, model_name: str, model_cache_dir: Path | None, config: ModalEngineConfig) -> None:
         super().__init__(model_name, model_cache_dir, config)
+        self._embed = self._create_remote_embed_fn()
+        # limits the in-flight batches of this engine across concurrent `embed` calls
+        self.__semaphore_by_loop: dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    def _create_remote_embed_fn(self) -> RemoteEmbedFn:
         client = modal.Client.from_credentials(token_id=self._config.token_id, token_secret=self._config.token_secret)
         modal_cls = modal.Cls.from_name(
             app_name=self._config.app_name,
@@ -44,29 +53,80 @@ class ModalEngine(EmbeddingEngine[ModalEngineConfig]):
             environment_name=self._config.environment_name,
         )
         modal_cls.hydrate(client)
-        self._embed = modal_cls().embed.remote.aio
+        remote_embed = modal_cls().embed.remote.aio
+        if self._config.batched_remote_calls:
+            return remote_embed
+
+        async def embed_one_by_one(inputs: list[ModelEmbeddingInput], model_name: str) -> list[list[float]]:
+            return list(await asyncio.gather(*[remote_embed(input_, model_name) for input_ in inputs]))
+
+        return embed_one_by_one
 
     @override
     async def embed(self, inputs: Sequence[ModelEmbeddingInput], is_query_context: bool) -> list[list[float]]:
-        retry_count = 0
-        current_delay = self._config.retry_delay
+        if not inputs:
+            return []
+        semaphore = self.__get_semaphore()
+        batched_embeddings = await asyncio.gather(
+            *[
+                self._embed_batch(batch, semaphore)
+                for batch in CollectionUtil.chunk_list(inputs, max(self._config.batch_size, 1))
+            ]
+        )
+        return [embedding for embeddings in batched_embeddings for embedding in embeddings]
+
+    def __get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if (semaphore := self.__semaphore_by_loop.get(loop)) is None:
+            # semaphores are bound to the loop they are used in, those of closed loops are dropped
+            self.__semaphore_by_loop = {
+                semaphore_loop: loop_semaphore
+                for semaphore_loop, loop_semaphore in self.__semaphore_by_loop.items()
+                if not semaphore_loop.is_closed()
+            }
+            semaphore = asyncio.Semaphore(max(self._config.max_concurrent_batches, 1))
+            self.__semaphore_by_loop[loop] = semaphore
+        return semaphore
+
+    async def _embed_batch(
+        self, inputs: Sequence[ModelEmbeddingInput], semaphore: asyncio.Semaphore, failed_attempts: int = 0
+    ) -> list[list[float]]:
+        """
+        Embeds the batch remotely, holding one slot of the semaphore. A failed batch is split in halves
+        that are retried separately, inheriting the number of failed attempts. An input that keeps failing
+        raises after `max_retries` attempts, failing the whole `embed` call.
+        """
         while True:
             try:
-                return await asyncio.gather(*[self._embed(input_, self._model_name) for input_ in inputs])
+                async with semaphore:
+                    embeddings = await self._embed(list(inputs), self._model_name)
+                if len(embeddings) != len(inputs):
+                    raise UnexpectedResponseException(
+                        f"Expected {len(inputs)} embeddings, but the remote call returned {len(embeddings)}."
+                    )
+                return embeddings
             except Exception as e:  # pylint: disable=broad-exception-caught
-                retry_count += 1
-                if retry_count >= self._config.max_retries:
+                failed_attempts += 1
+                if failed_attempts >= self._config.max_retries:
                     logger.error(f"Failed after {self._config.max_retries} attempts", error=str(e))
                     raise UnexpectedResponseException(
                         f"Failed to get embeddings after {self._config.max_retries} attempts: {str(e)}"
                     ) from e
+                retry_delay = self._config.retry_delay * 2 ** (failed_attempts - 1)
                 logger.warning(
-                    f"Request failed (attempt {retry_count}/{self._config.max_retries})",
+                    f"Request failed (attempt {failed_attempts}/{self._config.max_retries})",
                     error=str(e),
-                    retry_delay=current_delay,
+                    retry_delay=retry_delay,
+                    batch_size=len(inputs),
                 )
-                await asyncio.sleep(current_delay)
-                current_delay = current_delay * 2
+                await asyncio.sleep(retry_delay)
+                if len(inputs) > 1:
+                    middle = len(inputs) // 2
+                    first_half, second_half = await asyncio.gather(
+                        self._embed_batch(inputs[:middle], semaphore, failed_attempts),
+                        self._embed_batch(inputs[middle:], semaphore, failed_attempts),
+                    )
+                    return first_half + second_half
 
     @override
     def is_query_prompt_supported(self) -> bool:
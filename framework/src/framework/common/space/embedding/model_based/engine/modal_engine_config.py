@@ -28,8 +28,13 @@ class ModalEngineConfig(EmbeddingEngineConfig):  # pylint: disable=too-many-inst
     app_name: str = "App"
     class_name: str = "Embedder"
     environment_name: str = "main"
+    batch_size: int = 64
+    # limit of the in-flight batches per engine, shared by all concurrent embed calls
+    max_concurrent_batches: int = 8
     max_retries: int = 10
     retry_delay: float = 0.2
+    # sends each batch in a single remote call, the remote `embed` must accept and return lists
+    batched_remote_calls: bool = False
 
     @override
     def __str__(self) -> str:
@@ -37,7 +42,10 @@ class ModalEngineConfig(EmbeddingEngineConfig):  # pylint: disable=too-many-inst
             f"app_name={self.app_name}",
             f"class_name={self.class_name}",
             f"environment_name={self.environment_name}",
+            f"batch_size={self.batch_size}",
+            f"max_concurrent_batches={self.max_concurrent_batches}",
             f"max_retries={self.max_retries}",
             f"retry_delay={self.retry_delay}",
+            f"batched_remote_calls={self.batched_remote_calls}",
         ]
         return f"{super().__str__()}, " + ", ".join(attributes)
@@ -18,9 +18,13 @@ from typing_extensions import override
 
 from superlinked.framework.common.dag.context import ExecutionContext
 from superlinked.framework.common.data_types import Vector
+from superlinked.framework.common.settings import settings
 from superlinked.framework.common.space.config.embedding.text_similarity_embedding_config import (
     TextSimilarityEmbeddingConfig,
 )
+from superlinked.framework.common.space.embedding.model_based.disk_embedding_cache import (
+    DiskEmbeddingCache,
+)
 from superlinked.framework.common.space.embedding.model_based.embedding_engine_manager import (
     EmbeddingEngineManager,
 )
@@ -37,12 +41,18 @@ class TextEmbedding(ModelEmbedding[str, TextSimilarityEmbeddingConfig]):
         self, embedding_config: TextSimilarityEmbeddingConfig, embedding_engine_manager: EmbeddingEngineManager
     ) -> None:
         super().__init__(embedding_config, embedding_engine_manager)
-        self._cache = TextEmbeddingCache(self._config.cache_size)
+        disk_cache_path = settings.EMBEDDING_DISK_CACHE_PATH
+        self._cache = TextEmbeddingCache(
+            self._config.cache_size, DiskEmbeddingCache.get_instance(disk_cache_path) if disk_cache_path else None
+        )
 
     @override
     async def embed_multiple(self, inputs: Sequence[str], context: ExecutionContext) -> list[Vector]:
         unique_inputs = list(dict.fromkeys(inputs))  # used instead of set() to keep original order
-        inputs_to_embed, found_indices, existing_vectors = self._cache.calculate_cache_info(unique_inputs)
+        cache_namespace = self._calculate_cache_namespace(context.is_query_context)
+        inputs_to_embed, found_indices, existing_vectors = await self._cache.calculate_cache_info(
+            unique_inputs, cache_namespace
+        )
         new_vectors = await self._embedding_engine_manager.embed(
             self._config.model_handler,
             self._config.model_name,
@@ -51,8 +61,17 @@ class TextEmbedding(ModelEmbedding[str, TextSimilarityEmbeddingConfig]):
             self._config.model_cache_dir,
             self._config.embedding_engine_config,
         )
-        self._cache.update(inputs_to_embed, new_vectors)
+        await self._cache.update(inputs_to_embed, new_vectors, cache_namespace)
         combined_vectors = self._cache.combine_vectors(inputs_to_embed, found_indices, existing_vectors, new_vectors)
         input_to_vector = dict(zip(unique_inputs, combined_vectors))
         vectors_mapped_back_to_input_len = [input_to_vector[input_] for input_ in inputs]
         return vectors_mapped_back_to_input_len
+
+    def _calculate_cache_namespace(self, is_query_context: bool) -> str:
+        engine_key = self._embedding_engine_manager.calculate_engine_key(
+            self._config.model_handler,
+            self._config.model_name,
+            self._config.model_cache_dir,
+            self._config.embedding_engine_config,
+        )
+        return f"{engine_key}:query" if is_query_context else engine_key
@@ -12,28 +12,53 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+
 from beartype.typing import Sequence, cast
 from cachetools import LRUCache
 
 from superlinked.framework.common.data_types import Vector
 from superlinked.framework.common.exception import InvalidStateException
+from superlinked.framework.common.space.embedding.model_based.disk_embedding_cache import (
+    DiskEmbeddingCache,
+)
 
 
 class TextEmbeddingCache:
-    def __init__(self, cache_size: int) -> None:
+    def __init__(self, cache_size: int, disk_cache: DiskEmbeddingCache | None = None) -> None:
+        """
+        The in-memory LRU cache holds up to cache_size vectors. The optional disk cache is
+        consulted on LRU misses and populated with every newly embedded vector.
+        Both are keyed by the namespace and the input, as vectors may differ between namespaces.
+        """
         self._cache_size = cache_size
-        self._cache: LRUCache = LRUCache(self._cache_size)
+        self._cache: LRUCache[tuple[str, str], Vector] = LRUCache(self._cache_size)
+        self._disk_cache = disk_cache
 
-    def calculate_cache_info(self, inputs: Sequence[str]) -> tuple[list[str], list[int], list[Vector]]:
-        if self._cache_size == 0:
+    async def calculate_cache_info(
+        self, inputs: Sequence[str], namespace: str = ""
+    ) -> tuple[list[str], list[int], list[Vector]]:
+        if self._cache_size == 0 and self._disk_cache is None:
             return list(inputs), [], []
 
+        lru_misses = [input_ for input_ in inputs if (namespace, input_) not in self._cache]
+        disk_vectors = (
+            await asyncio.to_thread(self._disk_cache.get_many, namespace, lru_misses)
+            if self._disk_cache and lru_misses
+            else {}
+        )
+        if self._cache_size > 0:
+            for input_, vector in disk_vectors.items():
+                self._cache[(namespace, input_)] = vector
+
         inputs_to_embed = []
         found_indices = []
         existing_vectors = []
 
         for i, input_ in enumerate(inputs):
-            vector = self._cache.get(input_)
+            vector = self._cache.get((namespace, input_))
+            if vector is None:
+                vector = disk_vectors.get(input_)
             if vector is None:
                 inputs_to_embed.append(input_)
             else:
@@ -42,8 +67,10 @@ class TextEmbeddingCache:
 
         return inputs_to_embed, found_indices, existing_vectors
 
-    def update(self, inputs_to_embed: Sequence[str], uncached_vectors: Sequence[Vector]) -> None:
-        if self._cache_size == 0 or not inputs_to_embed:
+    async def update(
+        self, inputs_to_embed: Sequence[str], uncached_vectors: Sequence[Vector], namespace: str = ""
+    ) -> None:
+        if (self._cache_size == 0 and self._disk_cache is None) or not inputs_to_embed:
             return
         if len(inputs_to_embed) != len(uncached_vectors):
             raise InvalidStateException(
@@ -51,8 +78,11 @@ class TextEmbeddingCache:
                 num_inputs=len(inputs_to_embed),
                 num_vectors=len(uncached_vectors),
             )
-        for input_, vector in zip(inputs_to_embed, uncached_vectors):
-            self._cache[input_] = vector
+        if self._cache_size > 0:
+            for input_, vector in zip(inputs_to_embed, uncached_vectors):
+                self._cache[(namespace, input_)] = vector
+        if self._disk_cache is not None:
+            await asyncio.to_thread(self._disk_cache.put_many, namespace, inputs_to_embed, uncached_vectors)
 
     def combine_vectors(
         self,
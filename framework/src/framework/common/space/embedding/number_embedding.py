@@ -15,11 +15,11 @@
 import math
 
 import numpy as np
-from beartype.typing import cast
+from beartype.typing import Sequence, cast
 from typing_extensions import TypeVar, override
 
 from superlinked.framework.common.dag.context import ExecutionContext
-from superlinked.framework.common.data_types import Vector
+from superlinked.framework.common.data_types import Vector, VectorItemT
 from superlinked.framework.common.exception import InvalidStateException
 from superlinked.framework.common.space.config.embedding.number_embedding_config import (
     LOG_BASE,
@@ -80,6 +80,34 @@ class NumberEmbedding(InvertibleEmbedding[NumberT, NumberEmbeddingConfig]):
         vector_input = np.array([math.sin(angle_in_radians), math.cos(angle_in_radians)])
         return Vector(np.append(vector_input, [0.0]), {2})
 
+    @override
+    async def embed_multiple(self, inputs: Sequence[float], context: ExecutionContext) -> list[Vector]:
+        """
+        Same as `embed` for every input, but normalizes and clips the whole input array at once.
+        """
+        if not inputs:
+            return []
+        values = np.asarray(inputs, dtype=np.float64)
+        transformed_min = self._transform_to_log_if_logarithmic(self._config.min_value)
+        transformed_max = self._transform_to_log_if_logarithmic(self._config.max_value)
+        # clipping is done before the monotonic log transform to avoid its domain errors,
+        # the comparisons mirror min(max(...)) of the scalar path, including its NaN handling
+        is_at_min = ~(values > self._config.min_value)
+        is_at_max = values > self._config.max_value
+        in_range_values = np.where(is_at_min | is_at_max, self._config.min_value, values)
+        constrained_input = np.where(
+            is_at_min,
+            transformed_min,
+            np.where(is_at_max, transformed_max, self._transform_array_to_log_if_logarithmic(in_range_values)),
+        )
+        normalized_input = (constrained_input - transformed_min) / (transformed_max - transformed_min)
+        angle_in_radians = normalized_input * self._circle_size_in_rad
+        vector_matrix = np.zeros((len(values), self.length))
+        vector_matrix[:, 0] = np.sin(angle_in_radians)
+        vector_matrix[:, 1] = np.cos(angle_in_radians)
+        vector_matrix[self._get_out_of_bounds_mask(values)] = self._value_when_out_of_bounds
+        return [Vector(row, {2}) for row in vector_matrix.astype(VectorItemT)]
+
     @override
     def inverse_embed(self, vector: Vector, context: ExecutionContext) -> NumberT:
         """
@@ -91,11 +119,7 @@ class NumberEmbedding(InvertibleEmbedding[NumberT, NumberEmbeddingConfig]):
                 "Mismatching length of the vector to inverse embed.", len_vector=len(vector.value)
             )
         if list(vector.value) == self._value_when_out_of_bounds:
-            out_of_bounds_bias: float = (self._config.max_value - self._config.min_value) / 1000.0
-            if self._config.mode == Mode.MAXIMUM:
-                return cast(NumberT, self._config.min_value - out_of_bounds_bias)
-            # INFO: for similar it doesn't matter, which direction is it out of bounds
-            return cast(NumberT, self._config.max_value + out_of_bounds_bias)
+            return cast(NumberT, self._get_out_of_bounds_inverse_value())
         angle_in_radians = math.atan2(vector.value[0], vector.value[1])
         transformed_number = angle_in_radians / self._circle_size_in_rad
         transformed_max = self._transform_to_log_if_logarithmic(self._config.max_value)
@@ -104,14 +128,58 @@ class NumberEmbedding(InvertibleEmbedding[NumberT, NumberEmbeddingConfig]):
         input_ = self._transform_from_log_if_logarithmic(transformed_input_)
         return cast(NumberT, input_)
 
+    @override
+    def inverse_embed_multiple(self, vectors: Sequence[Vector], context: ExecutionContext) -> list[NumberT]:
+        if not vectors:
+            return []
+        if mismatching_lengths := [len(vector.value) for vector in vectors if len(vector.value) != self.length]:
+            raise InvalidStateException(
+                "Mismatching length of the vector to inverse embed.", len_vector=mismatching_lengths[0]
+            )
+        vector_matrix = np.stack([vector.value for vector in vectors])
+        is_out_of_bounds = np.all(vector_matrix == np.array(self._value_when_out_of_bounds, dtype=VectorItemT), axis=1)
+        vector_matrix = vector_matrix.astype(np.float64)
+        angle_in_radians = np.arctan2(vector_matrix[:, 0], vector_matrix[:, 1])
+        transformed_number = angle_in_radians / self._circle_size_in_rad
+        transformed_max = self._transform_to_log_if_logarithmic(self._config.max_value)
+        transformed_min = self._transform_to_log_if_logarithmic(self._config.min_value)
+        transformed_inputs = transformed_number * (transformed_max - transformed_min) + transformed_min
+        out_of_bounds_value = self._get_out_of_bounds_inverse_value()
+        return [
+            cast(
+                NumberT,
+                out_of_bounds_value if is_out_of_bounds_ else self._transform_from_log_if_logarithmic(input_),
+            )
+            for input_, is_out_of_bounds_ in zip(transformed_inputs.tolist(), is_out_of_bounds.tolist())
+        ]
+
     @property
     @override
     def needs_inversion_before_aggregation(self) -> bool:
         return True
 
+    def _get_out_of_bounds_mask(self, values: np.ndarray) -> np.ndarray:
+        is_below_min = values < self._config.min_value
+        is_above_max = values > self._config.max_value
+        if self._config.mode == Mode.MAXIMUM:
+            return is_below_min
+        if self._config.mode == Mode.MINIMUM:
+            return is_above_max
+        return is_below_min | is_above_max
+
+    def _get_out_of_bounds_inverse_value(self) -> float:
+        out_of_bounds_bias: float = (self._config.max_value - self._config.min_value) / 1000.0
+        if self._config.mode == Mode.MAXIMUM:
+            return self._config.min_value - out_of_bounds_bias
+        # INFO: for similar it doesn't matter, which direction is it out of bounds
+        return self._config.max_value + out_of_bounds_bias
+
     def _transform_to_log_if_logarithmic(self, value: float) -> float:
         return math.log(1 + value, LOG_BASE) if isinstance(self._config.scale, LogarithmicScale) else value
 
+    def _transform_array_to_log_if_logarithmic(self, values: np.ndarray) -> np.ndarray:
+        return np.log(1 + values) / math.log(LOG_BASE) if isinstance(self._config.scale, LogarithmicScale) else values
+
     def _transform_from_log_if_logarithmic(self, value: float) -> float:
         return round(
             (LOG_BASE**value - 1 if isinstance(self._config.scale, LogarithmicScale) else value),
@@ -65,6 +65,32 @@ class RecencyEmbedding(InvertibleEmbedding[int, RecencyEmbeddingConfig]):
         ]
         return CollectionUtil.concatenate_vectors(recency_vectors)
 
+    @override
+    async def embed_multiple(self, inputs: Sequence[int], context: ExecutionContext) -> list[Vector]:
+        """
+        Same as `embed` for every input, but computes the recency matrix column by column with numpy.
+        The period boundaries only depend on `context.now()`, so they are computed once per period time.
+        """
+        if not inputs:
+            return []
+        created_at = np.asarray(inputs, dtype=np.int64)
+        time_period_end: int = self._calculate_time_period_end(context.now())
+        columns: list[np.ndarray] = []
+        negative_filter_indices: set[int] = set()
+        for period_time in self._period_time_list:
+            time_period_start: int = self._calculate_time_period_start(period_time, context.now())
+            in_time_scope = (time_period_start <= created_at) & (created_at <= time_period_end)
+            # same operation order as the scalar path to produce identical values
+            normalized_time_elapsed = (created_at - time_period_start) / (time_period_end - time_period_start)
+            angle = normalized_time_elapsed * math.pi / 2
+            columns.append(np.where(in_time_scope, np.cos(angle) * period_time.weight, 0.0))
+            columns.append(np.where(in_time_scope, np.sin(angle) * period_time.weight, 0.0))
+            if period_time.period_time == self.max_period_time.period_time:
+                negative_filter_indices.add(len(columns))
+                columns.append(self._calculate_z_values(in_time_scope, context))
+        recency_matrix = np.stack(columns, axis=1).astype(VectorItemT)
+        return [Vector(row, negative_filter_indices) for row in recency_matrix]
+
     @override
     def inverse_embed(self, vector: Vector, context: ExecutionContext) -> int:
         """
@@ -124,6 +150,11 @@ class RecencyEmbedding(InvertibleEmbedding[int, RecencyEmbeddingConfig]):
             z_value = None
         return z_value
 
+    def _calculate_z_values(self, in_time_scope: np.ndarray, context: ExecutionContext) -> np.ndarray:
+        if context.is_query_context:
+            return np.ones(len(in_time_scope))
+        return np.where(in_time_scope, 0.0, self._config.negative_filter)
+
     def _build_vector(self, x_value: float, y_value: float, z_value: float | None) -> Vector:
         vector_input = np.array([x_value, y_value], dtype=VectorItemT)
         negative_filter_indices = set()
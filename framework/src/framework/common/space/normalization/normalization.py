@@ -55,6 +55,13 @@ class Normalization(Generic[NormalizationConfigT], ABC):
     @abstractmethod
     def norm(self, value: NPArray, is_query: bool = False) -> float: ...
 
+    def norm_multiple(self, values: NPArray, negative_filter_mask: np.ndarray, is_query: bool = False) -> NPArray:
+        """Returns the norm of every row, ignoring the values where `negative_filter_mask` is set"""
+        return np.array(
+            [self.norm(row[~row_mask], is_query) for row, row_mask in zip(values, negative_filter_mask)],
+            dtype=np.float64,
+        )
+
     def denormalize(self, vector: Vector) -> Vector:
         return vector.denormalize()
 
@@ -106,6 +113,10 @@ class ConstantNorm(Normalization[ConstantNormConfig]):
     def norm(self, value: NPArray, is_query: bool = False) -> float:
         return self._config.length
 
+    @override
+    def norm_multiple(self, values: NPArray, negative_filter_mask: np.ndarray, is_query: bool = False) -> NPArray:
+        return np.full(len(values), self._config.length, dtype=np.float64)
+
     @override
     def denormalize(self, vector: Vector) -> Vector:
         return vector.normalize(1 / self._config.length)
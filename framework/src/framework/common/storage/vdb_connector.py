@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from abc import ABC, abstractmethod
 
 from beartype.typing import Any, Generic, Sequence, TypeVar
@@ -151,19 +152,44 @@ class VDBConnector(ABC, Generic[VDBKNNSearchConfigT]):
         search_config: VDBKNNSearchConfigT,
         **params: Any,
     ) -> Sequence[ResultEntityData]:
+        search_params = self._apply_default_search_limit(vdb_knn_search_params)
+        self._record_knn_search_metric(index_name, schema_name, search_params)
+        return await self._knn_search(index_name, schema_name, search_params, search_config, **params)
+
+    async def knn_search_many(
+        self,
+        index_name: str,
+        schema_name: str,
+        vdb_knn_search_params_list: Sequence[VDBKNNSearchParams],
+        search_config: VDBKNNSearchConfigT,
+        **params: Any,
+    ) -> list[Sequence[ResultEntityData]]:
+        """
+        Executes multiple kNN searches on the same index, returning the results in the order of the search params.
+        """
+        search_params_list = [
+            self._apply_default_search_limit(search_params) for search_params in vdb_knn_search_params_list
+        ]
+        for search_params in search_params_list:
+            self._record_knn_search_metric(index_name, schema_name, search_params)
+        return await self._knn_search_many(index_name, schema_name, search_params_list, search_config, **params)
+
+    def _apply_default_search_limit(self, vdb_knn_search_params: VDBKNNSearchParams) -> VDBKNNSearchParams:
         # If the limit is set to the default, assign it a database-specific default value
         limit = (
             self._default_search_limit
             if vdb_knn_search_params.limit == constants.DEFAULT_LIMIT
             else vdb_knn_search_params.limit
         )
-        search_params = VDBKNNSearchParams(
+        return VDBKNNSearchParams(
             vector_field=vdb_knn_search_params.vector_field,
             limit=limit,
             fields_to_return=vdb_knn_search_params.fields_to_return,
             filters=vdb_knn_search_params.filters,
             radius=vdb_knn_search_params.radius,
         )
+
+    def _record_knn_search_metric(self, index_name: str, schema_name: str, search_params: VDBKNNSearchParams) -> None:
         labels = {
             "index_name": index_name,
             "schema_name": schema_name,
@@ -174,7 +200,6 @@ class VDBConnector(ABC, Generic[VDBKNNSearchConfigT]):
             "radius": search_params.radius,
         }
         telemetry.record_metric("vdb.knn.count", 1, labels)
-        return await self._knn_search(index_name, schema_name, search_params, search_config, **params)
 
     @abstractmethod
     async def _knn_search(
@@ -187,6 +212,26 @@ class VDBConnector(ABC, Generic[VDBKNNSearchConfigT]):
     ) -> Sequence[ResultEntityData]:
         pass
 
+    async def _knn_search_many(
+        self,
+        index_name: str,
+        schema_name: str,
+        vdb_knn_search_params_list: Sequence[VDBKNNSearchParams],
+        search_config: VDBKNNSearchConfigT,
+        **params: Any,
+    ) -> list[Sequence[ResultEntityData]]:
+        """
+        Dispatches the searches concurrently, connectors supporting multi-vector queries should override this.
+        """
+        return list(
+            await asyncio.gather(
+                *[
+                    self._knn_search(index_name, schema_name, search_params, search_config, **params)
+                    for search_params in vdb_knn_search_params_list
+                ]
+            )
+        )
+
     @abstractmethod
     def init_search_config(self, query_user_config: QueryUserConfig) -> VDBKNNSearchConfigT:
         pass
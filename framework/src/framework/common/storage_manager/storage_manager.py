@@ -16,6 +16,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 
 from beartype.typing import Any, Mapping, Sequence, TypeVar, cast
+from cachetools import LRUCache
 
 from superlinked.framework.common.dag.index_node import IndexNode
 from superlinked.framework.common.data_types import NodeDataTypes, PythonTypes, Vector
@@ -99,12 +100,23 @@ class StorageManager:
             delay_ms=settings.BATCHED_VDB_READ_WAIT_TIME_MS,
             eval_fn=self._vdb_connector.read_entities,
             task_name="vdb read",
+            max_batch_size=settings.BATCHED_VDB_READ_MAX_BATCH_SIZE,
+            max_in_flight_batches=settings.BATCHED_MAX_IN_FLIGHT_BATCHES,
+            adaptive=settings.BATCHED_ADAPTIVE_WAIT_TIME,
         )
         self._delayed_write_evaluator = DelayedEvaluator(
             delay_ms=settings.BATCHED_VDB_WRITE_WAIT_TIME_MS,
             eval_fn=self._vdb_connector.write_entities,  # type: ignore
             task_name="vdb write",
+            max_batch_size=settings.BATCHED_VDB_WRITE_MAX_BATCH_SIZE,
+            max_in_flight_batches=settings.BATCHED_MAX_IN_FLIGHT_BATCHES,
+            adaptive=settings.BATCHED_ADAPTIVE_WAIT_TIME,
         )
+        self._stored_vector_cache: LRUCache[EntityId, dict[str, Vector]] | None = (
+            LRUCache(settings.QUERY_STORED_VECTOR_CACHE_SIZE) if settings.QUERY_STORED_VECTOR_CACHE_SIZE > 0 else None
+        )
+        # bumped on every write, so reads overlapping a write do not cache what they read
+        self.__write_generation = 0
 
     async def close_connection(self) -> None:
         await self._vdb_connector.close_connection()
@@ -179,8 +191,51 @@ class StorageManager:
         should_return_index_vector: bool = False,
         **params: Any,
     ) -> Sequence[SearchResultItem]:
+        vdb_knn_search_params, schema_field_by_field_name = self._compose_vdb_knn_search_params(
+            index_node, schema, knn_search_params, should_return_index_vector
+        )
+        search_result: Sequence[ResultEntityData] = await self._vdb_connector.knn_search(
+            StorageNaming.get_index_name_from_node_id(index_node.node_id),
+            schema._schema_name,
+            vdb_knn_search_params,
+            self._vdb_connector.init_search_config(query_user_config),
+            **params,
+        )
+        return self._map_search_result(search_result, schema_field_by_field_name, index_node.node_id)
+
+    async def knn_search_many(
+        self,
+        index_node: IndexNode,
+        schema: IdSchemaObject,
+        knn_search_params_list: Sequence[KNNSearchParams],
+        query_user_config: QueryUserConfig,
+        should_return_index_vector: bool = False,
+        **params: Any,
+    ) -> list[Sequence[SearchResultItem]]:
+        composed_params = [
+            self._compose_vdb_knn_search_params(index_node, schema, knn_search_params, should_return_index_vector)
+            for knn_search_params in knn_search_params_list
+        ]
+        search_results = await self._vdb_connector.knn_search_many(
+            StorageNaming.get_index_name_from_node_id(index_node.node_id),
+            schema._schema_name,
+            [vdb_knn_search_params for vdb_knn_search_params, _ in composed_params],
+            self._vdb_connector.init_search_config(query_user_config),
+            **params,
+        )
+        return [
+            self._map_search_result(search_result, schema_field_by_field_name, index_node.node_id)
+            for search_result, (_, schema_field_by_field_name) in zip(search_results, composed_params)
+        ]
+
+    def _compose_vdb_knn_search_params(
+        self,
+        index_node: IndexNode,
+        schema: IdSchemaObject,
+        knn_search_params: KNNSearchParams,
+        should_return_index_vector: bool,
+    ) -> tuple[VDBKNNSearchParams, dict[str, SchemaField]]:
         self._validate_knn_search_input(schema, knn_search_params.schema_fields_to_return)
-        index_name = StorageNaming.get_index_name_from_node_id(index_node.node_id)
         vector_field = cast(
             VectorFieldData,
             self._entity_builder.compose_field_data(index_node.node_id, knn_search_params.vector),
@@ -189,24 +244,24 @@ class StorageManager:
         fields_to_return = list(schema_fields_by_fields.keys()) + list(self._entity_builder._admin_fields.header_fields)
         if should_return_index_vector:
             fields_to_return.append(self._entity_builder.compose_field(index_node.node_id, Vector))
-        search_config = self._vdb_connector.init_search_config(query_user_config)
-        search_result: Sequence[ResultEntityData] = await self._vdb_connector.knn_search(
-            index_name,
-            schema._schema_name,
-            VDBKNNSearchParams(
-                vector_field,
-                knn_search_params.limit,
-                fields_to_return,
-                self._compose_filter_field_data(schema, knn_search_params.filters),
-                knn_search_params.radius,
-            ),
-            search_config,
-            **params,
+        vdb_knn_search_params = VDBKNNSearchParams(
+            vector_field,
+            knn_search_params.limit,
+            fields_to_return,
+            self._compose_filter_field_data(schema, knn_search_params.filters),
+            knn_search_params.radius,
         )
-        schema_field_by_field_name = self._create_schema_field_by_field_name(schema_fields_by_fields)
+        return vdb_knn_search_params, self._create_schema_field_by_field_name(schema_fields_by_fields)
+
+    def _map_search_result(
+        self,
+        search_result: Sequence[ResultEntityData],
+        schema_field_by_field_name: dict[str, SchemaField],
+        index_node_id: str,
+    ) -> list[SearchResultItem]:
         return [
             self._map_vdb_result_item_to_search_result_item(
-                result_entity_data, schema_field_by_field_name, index_node.node_id
+                result_entity_data, schema_field_by_field_name, index_node_id
             )
             for result_entity_data in search_result
         ]
@@ -298,8 +353,11 @@ class StorageManager:
             for entity_id, node_id_to_node_info in cached_items.items()
         ]
         entity_data_items.extend(cached_entity_data)
-        with telemetry.span("vdb.write", attributes={"n_entities": len(entity_data_items)}):
-            await self._delayed_write_evaluator.evaluate(entity_data_items)
+        try:
+            with telemetry.span("vdb.write", attributes={"n_entities": len(entity_data_items)}):
+                await self._delayed_write_evaluator.evaluate(entity_data_items)
+        finally:
+            self.__invalidate_stored_vectors(entity_data_items)
 
     # TODO FAB-3639 - legacy-readwrite-interfaces
     def write_parsed_schema_fields(
@@ -309,14 +367,20 @@ class StorageManager:
             self._entity_builder.compose_entity_data_from_parsed_schema(parsed_schema, fields_to_exclude)
             for parsed_schema in parsed_schemas
         ]
-        AsyncUtil.run(self._delayed_write_evaluator.evaluate(entities_to_write))
+        try:
+            AsyncUtil.run(self._delayed_write_evaluator.evaluate(entities_to_write))
+        finally:
+            self.__invalidate_stored_vectors(entities_to_write)
 
     # TODO FAB-3639 - legacy-readwrite-interfaces
     def write_node_results(self, node_data_items: Sequence[NodeResultData]) -> None:
         entities_to_write = [
             self._entity_builder.compose_entity_data_from_node_result(node_data) for node_data in node_data_items
         ]
-        AsyncUtil.run(self._delayed_write_evaluator.evaluate(entities_to_write))
+        try:
+            AsyncUtil.run(self._delayed_write_evaluator.evaluate(entities_to_write))
+        finally:
+            self.__invalidate_stored_vectors(entities_to_write)
 
     # TODO FAB-3639 - legacy-readwrite-interfaces
     def write_node_data(
@@ -326,7 +390,10 @@ class StorageManager:
             self._compose_entity_data(schema, object_id, node_id, node_data)
             for object_id, node_data in node_data_by_object_id.items()
         ]
-        AsyncUtil.run(self._delayed_write_evaluator.evaluate(entity_data_items))
+        try:
+            AsyncUtil.run(self._delayed_write_evaluator.evaluate(entity_data_items))
+        finally:
+            self.__invalidate_stored_vectors(entity_data_items)
 
     # TODO FAB-3639 - legacy-readwrite-interfaces
     def _compose_entity_data(
@@ -376,6 +443,29 @@ class StorageManager:
     ) -> ResultTypeT | None:
         return next(iter(await self.read_node_results_async([(schema, object_id)], node_id, result_type)))
 
+    async def read_stored_vector(self, schema: IdSchemaObject, object_id: str, node_id: str) -> Vector | None:
+        """
+        Same as `read_node_result` for vectors, but served from an LRU cache if enabled.
+        Entries are invalidated by the writes of this storage manager.
+        """
+        if self._stored_vector_cache is None:
+            return await self.read_node_result(schema, object_id, node_id, Vector)
+        entity_id = self._entity_builder.compose_entity_id(schema._schema_name, object_id)
+        if (vector := self._stored_vector_cache.get(entity_id, {}).get(node_id)) is not None:
+            return vector
+        write_generation = self.__write_generation
+        vector = await self.read_node_result(schema, object_id, node_id, Vector)
+        if vector is not None and write_generation == self.__write_generation:
+            self._stored_vector_cache.setdefault(entity_id, {})[node_id] = vector
+        return vector
+
+    def __invalidate_stored_vectors(self, entity_data_items: Sequence[EntityData]) -> None:
+        self.__write_generation += 1
+        if self._stored_vector_cache is None:
+            return
+        for entity_data in entity_data_items:
+            self._stored_vector_cache.pop(entity_data.id_, None)
+
     async def read_entity_data_requests(
         self, entity_data_requests: Sequence[EntityDataRequest]
     ) -> list[dict[str, NodeInfo]]:
@@ -41,3 +41,6 @@ class SuperlinkedTelemetryConfigurator:
         telemetry.create_metric(
             MetricType.COUNTER, "vdb.knn.count", "Total number of KNN queries executed on the vector database", "1"
         )
+        telemetry.create_metric(
+            MetricType.COUNTER, "nlq.cache.hit", "Total number of natural language queries served from cache", "1"
+        )
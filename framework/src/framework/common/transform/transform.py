@@ -14,10 +14,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
-from beartype.typing import Callable, Generic, TypeVar
+from beartype.typing import Callable, Generic, Sequence, TypeVar
 from typing_extensions import override
 
 from superlinked.framework.common.dag.context import ExecutionContext
@@ -37,6 +38,13 @@ class Step(ABC, Generic[StepInputT, StepOutputT]):
     ) -> StepOutputT:
         pass
 
+    async def transform_multiple(
+        self,
+        inputs: Sequence[StepInputT],
+        context: ExecutionContext,
+    ) -> list[StepOutputT]:
+        return list(await asyncio.gather(*[self.transform(input_, context) for input_ in inputs]))
+
     def combine(self, step: Step[StepOutputT, StepCombinedOutputT]) -> Transform[StepInputT, StepCombinedOutputT]:
         return Transform(self, step)
 
@@ -80,6 +88,24 @@ class Transform(Generic[StepInputT, StepOutputT], Step[StepInputT, StepOutputT])
             input_ = result
         return await self._step2.transform(await self._step1.transform(input_, context), context)
 
+    @override
+    async def transform_multiple(
+        self,
+        inputs: Sequence[StepInputT],
+        context: ExecutionContext,
+    ) -> list[StepOutputT]:
+        if not self._predicate:
+            return await self._step2.transform_multiple(await self._step1.transform_multiple(inputs, context), context)
+        filtered_inputs = [self._predicate.filter_(input_) for input_ in inputs]
+        positions = [i for i, filtered_input in enumerate(filtered_inputs) if filtered_input is not None]
+        outputs = await self._step2.transform_multiple(
+            await self._step1.transform_multiple([filtered_inputs[i] for i in positions], context), context
+        )
+        results = [self._predicate.default_value] * len(inputs)
+        for position, output in zip(positions, outputs):
+            results[position] = output
+        return results
+
 
 WrapperInputT = TypeVar("WrapperInputT")
 WrapperOutputT = TypeVar("WrapperOutputT")
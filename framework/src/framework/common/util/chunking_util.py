@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from beartype.typing import Callable
+from collections import deque
+
+from beartype.typing import Callable, Sequence
 
 DEFAULT_CHUNK_SIZE: int = 250
 DEFAULT_CHUNK_OVERLAP: int = 20
@@ -27,7 +29,7 @@ class Chunker:
         parts = text.split(separator)
         result = [
             part + f"{separator} " * (i < len(parts) - 1) * keep_sep
-            for i, part in enumerate(text.split(separator))
+            for i, part in enumerate(parts)
             if part
         ]
         return result
@@ -53,27 +55,29 @@ class Chunker:
             remove_splitter_chars = DEFAULT_REMOVE_SPLIT_CHARS
         if additional_splitter_chars is None:
             additional_splitter_chars = DEFAULT_ADDITIONAL_SPLIT_CHARS
-        splits_to_process: list[str] = [text]
-        new_splits: list[str] = []
         split_fns: list[Callable[[str], list[str]]] = [
             self._split_by_sep(sep, keep_sep=False) for sep in remove_splitter_chars
         ] + [self._split_by_sep(sep, keep_sep=True) for sep in additional_splitter_chars + [" "]]
+        # the splits still to process are kept in reverse order, so the next one can be popped from the end
+        splits_to_process: list[str] = [text]
+        new_splits: list[str] = []
 
         while len(splits_to_process) > 0:
-            current_split: str = splits_to_process.pop(0)
+            current_split: str = splits_to_process.pop()
             if len(current_split) <= chunk_size:
                 new_splits.append(current_split)
             else:
+                normalized_split = " ".join(current_split.split())
                 sub_split: list[str] = next(
                     (
                         sub_split
-                        for sub_split in [split_fn(" ".join(current_split.split())) for split_fn in split_fns]
+                        for sub_split in (split_fn(normalized_split) for split_fn in split_fns)
                         if len(sub_split) > 1
                     ),
                     [],
                 )
                 if sub_split:
-                    splits_to_process = sub_split + splits_to_process
+                    splits_to_process.extend(reversed(sub_split))
                 else:
                     new_splits.append(current_split)
 
@@ -90,7 +94,7 @@ class Chunker:
         """
         chunks: list[str] = []
 
-        cur_chunk: list[str] = []
+        cur_chunk: deque[str] = deque()
         cur_len = 0
         for split in splits:
             split_len = len(split)
@@ -108,7 +112,7 @@ class Chunker:
                 #   2. the total length is less than chunk size
                 while cur_len > chunk_overlap or cur_len + split_len > chunk_size:
                     # pop off the first element
-                    first_chunk = cur_chunk.pop(0)
+                    first_chunk = cur_chunk.popleft()
                     cur_len -= len(first_chunk)
 
             cur_chunk.append(split)
@@ -140,3 +144,15 @@ class Chunker:
             additional_splitter_chars=split_chars_remove,
         )
         return self._merge(splits=splits, chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+    def chunk_texts(
+        self,
+        texts: Sequence[str],
+        chunk_size: int | None = None,
+        chunk_overlap: int | None = None,
+        split_chars_keep: list[str] | None = None,
+        split_chars_remove: list[str] | None = None,
+    ) -> list[list[str]]:
+        return [
+            self.chunk_text(text, chunk_size, chunk_overlap, split_chars_keep, split_chars_remove) for text in texts
+        ]
@@ -14,8 +14,9 @@
 
 from collections.abc import Mapping
 from dataclasses import dataclass
+from operator import methodcaller
 
-from beartype.typing import Any
+from beartype.typing import Any, Callable
 
 
 @dataclass
@@ -38,6 +39,26 @@ class DotSeparatedPathUtil:
         # Get the value for the final key in the path
         return current_data.get(keys[-1])
 
+    @staticmethod
+    def compile_get(path: str) -> Callable[[Mapping], Any]:
+        """
+        Returns an accessor that behaves like `get` with the given path, but splits the path only once.
+        """
+        *parent_keys, last_key = path.split(".")
+        get_last = methodcaller("get", last_key)
+        if not parent_keys:
+            return get_last
+
+        def get(data: Mapping) -> Any:
+            current_data: Mapping = data
+            for key in parent_keys:
+                # the exact type check skips the slower abstract base class check for plain dicts
+                if current_data and (type(current_data) is dict or isinstance(current_data, Mapping)):
+                    current_data = current_data.get(key, {})
+            return get_last(current_data)
+
+        return get
+
     @staticmethod
     def set(data: dict, path: str, value: Any) -> None:
         keys = path.split(".")
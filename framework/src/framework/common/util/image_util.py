@@ -38,17 +38,20 @@ class ImageUtil:
         return encoded_bytes
 
     @staticmethod
-    def open(fp: StrOrBytesPath | IO[bytes]) -> PILImage:
+    def open(fp: StrOrBytesPath | IO[bytes], draft_size: tuple[int, int] | None = None) -> PILImage:
         with PIL.Image.open(fp) as img:
+            if draft_size is not None:
+                # formats supporting it (e.g. JPEG via DCT scaling) decode at the lowest resolution >= draft_size
+                img.draft(CONVERSION_MODE, draft_size)
             img.load()
             return img
 
     @staticmethod
-    def open_image(data: bytes | str) -> PILImage:
+    def open_image(data: bytes | str, draft_size: tuple[int, int] | None = None) -> PILImage:
         try:
             if isinstance(data, str):
                 data = base64.b64decode(data, validate=True)
-            return ImageUtil.open(io.BytesIO(data))
+            return ImageUtil.open(io.BytesIO(data), draft_size)
         except (OSError, FileNotFoundError, binascii.Error, ValueError) as e:
             raise InvalidInputException(f"Failed to open image {str(data)}.") from e
 
@@ -59,3 +62,11 @@ class ImageUtil:
         if image.width > image_settings.RESIZE_IMAGE_WIDTH or image.height > image_settings.RESIZE_IMAGE_HEIGHT:
             image = image.resize((image_settings.RESIZE_IMAGE_WIDTH, image_settings.RESIZE_IMAGE_HEIGHT))
         return ImageUtil.encode_bytes(image, image_settings.IMAGE_FORMAT, image_settings.IMAGE_QUALITY)
+
+    @staticmethod
+    def resize_image_data(data: bytes | str) -> bytes:
+        """
+        Same as `resize(open_image(data))`, but lets the decoder skip the resolution that resizing would discard.
+        """
+        image = ImageUtil.open_image(data, (image_settings.RESIZE_IMAGE_WIDTH, image_settings.RESIZE_IMAGE_HEIGHT))
+        return ImageUtil.resize(image)
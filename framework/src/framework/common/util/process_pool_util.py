@@ -0,0 +1,58 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from beartype.typing import Any, Callable, TypeVar
+
+ReturnT = TypeVar("ReturnT")
+
+
+class ProcessPoolUtil:
+    """
+    Runs CPU-bound functions in process pools shared across the process, one pool per worker count.
+    The pools are created on first use and shut down at interpreter exit.
+    """
+
+    __pools: dict[int, ProcessPoolExecutor] = {}
+    __lock = threading.Lock()
+
+    @classmethod
+    async def run(cls, max_workers: int, func: Callable[..., ReturnT], *args: Any) -> ReturnT:
+        """`func` and `args` must be picklable."""
+        return await asyncio.get_running_loop().run_in_executor(cls.get_pool(max_workers), func, *args)
+
+    @classmethod
+    def get_pool(cls, max_workers: int) -> ProcessPoolExecutor:
+        max_workers = max(max_workers, 1)
+        with cls.__lock:
+            if (pool := cls.__pools.get(max_workers)) is None:
+                if not cls.__pools:
+                    atexit.register(cls.shutdown)
+                pool = ProcessPoolExecutor(max_workers=max_workers)
+                cls.__pools[max_workers] = pool
+            return pool
+
+    @classmethod
+    def shutdown(cls) -> None:
+        with cls.__lock:
+            pools = list(cls.__pools.values())
+            cls.__pools.clear()
+        for pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,180 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+
+import structlog
+from beartype.typing import Any, Mapping, Sequence
+
+from superlinked.framework.common.exception import InvalidInputException
+
+logger = structlog.getLogger()
+
+# sqlite limits the number of host parameters in a single statement
+MAX_LOOKUP_BATCH_SIZE = 500
+
+
+class SqliteKeyValueStore:
+    """
+    Thread-safe store of binary values keyed by a namespace and a key, backed by a table of a local sqlite file.
+    If `max_size_bytes` is set, the least recently used entries are evicted once the stored values exceed it.
+    Being used for caching, sqlite errors are logged instead of raised, a store that cannot be opened is disabled.
+    """
+
+    _instances: dict[tuple[str, str], SqliteKeyValueStore] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: str, table: str, max_size_bytes: int | None = None) -> None:
+        self._path = path
+        self._table = table
+        self._max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        # total size of the stored values, only tracked if there is a limit to evict by
+        self._total_size = 0
+        self._connection: sqlite3.Connection | None = None
+        try:
+            self._connection = self.__connect()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("failed to open sqlite store, disabling it", path=path, table=table, error=str(e))
+
+    def __connect(self) -> sqlite3.Connection:
+        if directory := os.path.dirname(self._path):
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self._path, check_same_thread=False)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._table} (namespace TEXT NOT NULL, key TEXT NOT NULL, "
+                + "value BLOB NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL, "
+                + "PRIMARY KEY (namespace, key))"
+            )
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {self._table}_last_access ON {self._table} (last_access)")
+            if self._max_size_bytes is not None:
+                self._total_size = connection.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self._table}").fetchone()[0]
+        except sqlite3.Error:
+            connection.close()
+            raise
+        return connection
+
+    @classmethod
+    def get_instance(cls, path: str, table: str, max_size_bytes: int | None = None) -> SqliteKeyValueStore:
+        with cls._instances_lock:
+            if (instance := cls._instances.get((path, table))) is None:
+                instance = cls(path, table, max_size_bytes)
+                cls._instances[(path, table)] = instance
+            elif instance._max_size_bytes != max_size_bytes:
+                raise InvalidInputException(
+                    f"Table {table} of {path} is already used with max_size_bytes={instance._max_size_bytes}, "
+                    + f"got {max_size_bytes}."
+                )
+            return instance
+
+    def get_many(self, namespace: str, keys: Sequence[str]) -> dict[str, bytes]:
+        if self._connection is None:
+            return {}
+        key_to_value: dict[str, bytes] = {}
+        try:
+            with self._lock:
+                key_to_value.update(self.__select_by_keys(self._connection, "value", namespace, keys))
+                if self._max_size_bytes is not None and key_to_value:
+                    self.__touch(self._connection, namespace, list(key_to_value.keys()))
+        except sqlite3.Error as e:
+            logger.warning("failed to read sqlite store", path=self._path, table=self._table, error=str(e))
+        return key_to_value
+
+    def put_many(self, namespace: str, key_to_value: Mapping[str, bytes]) -> None:
+        if self._connection is None:
+            return
+        now = time.time()
+        rows = [
+            (namespace, key, value, len(value), now)
+            for key, value in key_to_value.items()
+            if self._max_size_bytes is None or len(value) <= self._max_size_bytes
+        ]
+        if not rows:
+            return
+        try:
+            with self._lock:
+                with self._connection:
+                    size_change = self.__replace(self._connection, namespace, rows)
+                    if self._max_size_bytes is not None:
+                        size_to_free = self._total_size + size_change - self._max_size_bytes
+                        size_change -= self.__evict(self._connection, size_to_free)
+                # only applied once the transaction is committed
+                self._total_size += size_change
+        except sqlite3.Error as e:
+            logger.warning("failed to write sqlite store", path=self._path, table=self._table, error=str(e))
+
+    def __select_by_keys(
+        self, connection: sqlite3.Connection, column: str, namespace: str, keys: Sequence[str]
+    ) -> list[tuple[str, Any]]:
+        unique_keys = list(dict.fromkeys(keys))
+        rows: list[tuple[str, Any]] = []
+        for start in range(0, len(unique_keys), MAX_LOOKUP_BATCH_SIZE):
+            batch = unique_keys[start : start + MAX_LOOKUP_BATCH_SIZE]
+            rows.extend(
+                connection.execute(
+                    f"SELECT key, {column} FROM {self._table} WHERE namespace = ? AND key IN "
+                    + f"({','.join('?' * len(batch))})",
+                    [namespace, *batch],
+                ).fetchall()
+            )
+        return rows
+
+    def __replace(
+        self, connection: sqlite3.Connection, namespace: str, rows: Sequence[tuple[str, str, bytes, int, float]]
+    ) -> int:
+        """Writes the rows, returning the change of the total size if it is tracked."""
+        size_change = 0
+        if self._max_size_bytes is not None:
+            replaced_sizes = self.__select_by_keys(connection, "size", namespace, [row[1] for row in rows])
+            size_change = sum(row[3] for row in rows) - sum(size for _, size in replaced_sizes)
+        connection.executemany(
+            f"INSERT OR REPLACE INTO {self._table} (namespace, key, value, size, last_access) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        return size_change
+
+    def __touch(self, connection: sqlite3.Connection, namespace: str, keys: Sequence[str]) -> None:
+        now = time.time()
+        with connection:
+            connection.executemany(
+                f"UPDATE {self._table} SET last_access = ? WHERE namespace = ? AND key = ?",
+                [(now, namespace, key) for key in keys],
+            )
+
+    def __evict(self, connection: sqlite3.Connection, size_to_free: int) -> int:
+        """Evicts the least recently used entries until `size_to_free` is freed, returning the freed size."""
+        if size_to_free <= 0:
+            return 0
+        rows_to_evict: list[tuple[str, str]] = []
+        freed_size = 0
+        for namespace, key, size in connection.execute(
+            f"SELECT namespace, key, size FROM {self._table} ORDER BY last_access"
+        ):
+            rows_to_evict.append((namespace, key))
+            freed_size += size
+            if freed_size >= size_to_free:
+                break
+        connection.executemany(f"DELETE FROM {self._table} WHERE namespace = ? AND key = ?", rows_to_evict)
+        logger.debug(
+            "evicted entries from sqlite store", path=self._path, table=self._table, n_evicted=len(rows_to_evict)
+        )
+        return freed_size
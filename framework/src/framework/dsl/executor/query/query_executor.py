@@ -13,11 +13,13 @@
 # limitations under the License.
 
 
+import asyncio
+from collections import defaultdict
 from functools import partial, reduce
 
 import numpy as np
 import structlog
-from beartype.typing import Any, Sequence, cast
+from beartype.typing import Any, Mapping, Sequence, cast
 
 from superlinked.framework.common.dag.context import (
     CONTEXT_COMMON,
@@ -32,6 +34,9 @@ from superlinked.framework.common.exception import (
     InvalidStateException,
 )
 from superlinked.framework.common.schema.id_schema_object import IdSchemaObject
+from superlinked.framework.common.space.embedding.model_based.embedding_batch_scope import (
+    EmbeddingBatchScope,
+)
 from superlinked.framework.common.storage_manager.knn_search_params import (
     KNNSearchParams,
 )
@@ -106,6 +111,45 @@ class QueryExecutor:
             query_descriptor,
             knn_search_params.should_return_index_vector or query_descriptor.with_metadata,
         )
+        return self._create_query_result(query_descriptor, knn_search_params, entities, params)
+
+    async def query_many(self, params_list: Sequence[Mapping[str, ParamInputType | None]]) -> list[QueryResult]:
+        """
+        Execute the query once for each set of keyword parameters.
+        The embeddings of all queries are calculated together and the kNN searches are dispatched as one batch,
+        so this is cheaper than executing the queries one by one.
+
+        Args:
+            params_list: Parameter sets with keys corresponding to the `name` attribute of the `Param` instances.
+
+        Returns:
+            list[Result]: The results of the query executions in the order of the parameter sets.
+
+        Raises:
+            InvalidInputException: If the query index is not amongst the executor's indices.
+        """
+        self.__check_executor_has_index()
+        query_descriptors: list[QueryDescriptor] = await asyncio.gather(
+            *[QueryParamValueSetter.set_values(self._query_descriptor, params) for params in params_list]
+        )
+        knn_search_params_list = await EmbeddingBatchScope().run(
+            [self._produce_knn_search_params(query_descriptor) for query_descriptor in query_descriptors]
+        )
+        entities_list = await self._knn_search_many(knn_search_params_list, query_descriptors)
+        return [
+            self._create_query_result(query_descriptor, knn_search_params, entities, params)
+            for query_descriptor, knn_search_params, entities, params in zip(
+                query_descriptors, knn_search_params_list, entities_list, params_list
+            )
+        ]
+
+    def _create_query_result(
+        self,
+        query_descriptor: QueryDescriptor,
+        knn_search_params: KNNSearchParams,
+        entities: Sequence[SearchResultItem],
+        params: Mapping[str, ParamInputType | None],
+    ) -> QueryResult:
         self._logger.info(
             "executed query",
             n_results=len(entities),
@@ -260,6 +304,38 @@ class QueryExecutor:
                 should_return_index_vector,
             )
 
+    async def _knn_search_many(
+        self,
+        knn_search_params_list: Sequence[KNNSearchParams],
+        query_descriptors: Sequence[QueryDescriptor],
+    ) -> list[Sequence[SearchResultItem]]:
+        positions_by_should_return_index_vector: dict[bool, list[int]] = defaultdict(list)
+        for position, (knn_search_params, query_descriptor) in enumerate(
+            zip(knn_search_params_list, query_descriptors)
+        ):
+            should_return_index_vector = knn_search_params.should_return_index_vector or query_descriptor.with_metadata
+            positions_by_should_return_index_vector[should_return_index_vector].append(position)
+        entities_list: list[Sequence[SearchResultItem]] = [[] for _ in knn_search_params_list]
+        with telemetry.span(
+            "storage.knn_many",
+            attributes={
+                "index": self._query_descriptor.index._node_id,
+                "schema": self._query_descriptor.schema._schema_name,
+                "n_queries": len(knn_search_params_list),
+            },
+        ):
+            for should_return_index_vector, positions in positions_by_should_return_index_vector.items():
+                grouped_entities_list = await self.app.storage_manager.knn_search_many(
+                    self._query_descriptor.index._node,
+                    self._query_descriptor.schema,
+                    [knn_search_params_list[position] for position in positions],
+                    self._query_descriptor.query_user_config,
+                    should_return_index_vector,
+                )
+                for position, entities in zip(positions, grouped_entities_list):
+                    entities_list[position] = entities
+        return entities_list
+
     def _calculate_partial_scores(self, query_vector: Vector, result_vectors: Sequence[Vector]) -> list[list[float]]:
         if not result_vectors:
             return []
@@ -68,6 +68,14 @@ class RestHandler:
         result = await self.__query_mixin.async_query(query, **query_descriptor)
         return result
 
+    async def _query_many_handler(
+        self, query_descriptors: Sequence[dict], path: str, query_user_config: QueryUserConfig
+    ) -> list[QueryResult]:
+        query = self.__path_to_query_map[path].query_descriptor
+        query = query.replace_user_config(query_user_config)
+        results = await self.__query_mixin.async_query_many(query, query_descriptors)
+        return results
+
     def __create_path_to_resource_mapping(
         self,
         resources: Sequence[REST],
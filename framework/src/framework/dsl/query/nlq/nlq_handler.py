@@ -13,11 +13,19 @@
 # limitations under the License.
 
 
+import copy
+import dataclasses
+import hashlib
+import json
+import threading
+
 from beartype.typing import Any, Sequence
+from cachetools import LRUCache, TTLCache
 from pydantic import BaseModel
 
 from superlinked.framework.common.exception import UnexpectedResponseException
 from superlinked.framework.common.nlq.open_ai import OpenAIClient, OpenAIClientConfig
+from superlinked.framework.common.settings import settings
 from superlinked.framework.common.telemetry.telemetry_registry import telemetry
 from superlinked.framework.dsl.query.nlq.nlq_clause_collector import NLQClauseCollector
 from superlinked.framework.dsl.query.nlq.param_filler.query_param_model_builder import (
@@ -29,10 +37,44 @@ from superlinked.framework.dsl.query.nlq.param_filler.query_param_prompt_builder
 from superlinked.framework.dsl.query.query_clause.query_clause import QueryClause
 from superlinked.framework.dsl.query.space_weight_param_info import SpaceWeightParamInfo
 
+MAX_HANDLER_COUNT = 32
+
 
 class NLQHandler:
-    def __init__(self, client_config: OpenAIClientConfig) -> None:
+    """
+    Fills query parameters from a natural language query using an LLM.
+    The extracted parameters are cached by the natural query, the instructor prompt (containing the system prompt)
+    and the parameter schema, so repeated natural queries skip the LLM call.
+    Use `get_instance` to share the cache between queries using the same client config.
+    Unless a client is given, a client is created for each LLM call and closed afterwards,
+    as its http connections are bound to the event loop it was used in.
+    """
+
+    __instances: LRUCache[str, "NLQHandler"] = LRUCache(MAX_HANDLER_COUNT)
+    __instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        client_config: OpenAIClientConfig,
+        client: OpenAIClient | None = None,
+        cache_size: int | None = None,
+        cache_ttl_seconds: int | None = None,
+    ) -> None:
         self.__client_config = client_config
+        self.__client = client
+        cache_size = settings.SUPERLINKED_NLQ_CACHE_SIZE if cache_size is None else cache_size
+        ttl = settings.SUPERLINKED_NLQ_CACHE_TTL_SECONDS if cache_ttl_seconds is None else cache_ttl_seconds
+        self.__cache: TTLCache | None = TTLCache(maxsize=cache_size, ttl=ttl) if cache_size > 0 and ttl > 0 else None
+        self.__cache_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, client_config: OpenAIClientConfig) -> "NLQHandler":
+        key = cls.__calculate_client_config_key(client_config)
+        with cls.__instances_lock:
+            if (handler := cls.__instances.get(key)) is None:
+                handler = cls(client_config)
+                cls.__instances[key] = handler
+            return handler
 
     async def fill_params(
         self,
@@ -46,6 +88,10 @@ class NLQHandler:
             return {}
         model_class = QueryParamModelBuilder.build(clause_collector)
         instructor_prompt = QueryParamPromptBuilder.calculate_instructor_prompt(clause_collector, system_prompt)
+        cache_key = self._calculate_cache_key(natural_query, instructor_prompt, model_class)
+        if (cached_params := self.__get_cached_params(cache_key)) is not None:
+            telemetry.record_metric("nlq.cache.hit", 1)
+            return cached_params
         with telemetry.span(
             "nlq.execute",
             attributes={
@@ -53,12 +99,38 @@ class NLQHandler:
                 "model_class": model_class.__name__,
             },
         ):
-            return await self._execute_query(natural_query, instructor_prompt, model_class)
+            params = await self._execute_query(natural_query, instructor_prompt, model_class)
+        if self.__cache is not None:
+            with self.__cache_lock:
+                self.__cache[cache_key] = copy.deepcopy(params)
+        return params
+
+    def __get_cached_params(self, cache_key: tuple[str, str, str, str]) -> dict[str, Any] | None:
+        if self.__cache is None:
+            return None
+        with self.__cache_lock:
+            cached_params = self.__cache.get(cache_key)
+        return None if cached_params is None else copy.deepcopy(cached_params)
 
     async def _execute_query(self, query: str, instructor_prompt: str, model_class: type[BaseModel]) -> dict[str, Any]:
+        client = self.__client or OpenAIClient(self.__client_config)
         try:
-            client = OpenAIClient(self.__client_config)
             result = await client.query(query, instructor_prompt, model_class)
             return result
         except Exception as e:
             raise UnexpectedResponseException(f"Error executing natural language query: {str(e)}") from e
+        finally:
+            if client is not self.__client:
+                await client.aclose()
+
+    def _calculate_cache_key(
+        self, natural_query: str, instructor_prompt: str, model_class: type[BaseModel]
+    ) -> tuple[str, str, str, str]:
+        param_schema = json.dumps(model_class.model_json_schema(), sort_keys=True, default=str)
+        return (self.__client_config.model, natural_query, instructor_prompt, param_schema)
+
+    @staticmethod
+    def __calculate_client_config_key(client_config: OpenAIClientConfig) -> str:
+        # hashed, so the raw api key is not used as a registry key
+        serialized_config = json.dumps(dataclasses.asdict(client_config), sort_keys=True)
+        return hashlib.sha256(serialized_config.encode()).hexdigest()
@@ -118,7 +118,7 @@ class BaseLooksLikeFilterClause(NLQCompatible, SingleValueParamQueryClause, ABC)
                 "data_type": Vector.__name__,
             },
         ):
-            vector: Vector | None = await storage_manager.read_node_result(schema_obj, object_id, index_node_id, Vector)
+            vector = await storage_manager.read_stored_vector(schema_obj, object_id, index_node_id)
         if vector is None:
             raise NotFoundException(f"Entity not found for object_id: {object_id} node_id: {index_node_id}")
         return vector
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 
-from beartype.typing import Any, Sequence
+from beartype.typing import Any, Mapping, Sequence
 
 from superlinked.framework.common.exception import InvalidInputException
 from superlinked.framework.common.telemetry.telemetry_registry import telemetry
@@ -91,3 +91,47 @@ class QueryMixin:
                 f" {list(self._query_vector_factory_by_index.keys())}",
             )
         )
+
+    def query_many(
+        self, query_descriptor: QueryDescriptor, params_list: Sequence[Mapping[str, Any]]
+    ) -> list[QueryResult]:
+        """
+        Execute a query for each of the provided parameter sets as a single batch.
+        The query embeddings are calculated together and the kNN searches are dispatched at once.
+
+        Args:
+            query_descriptor (QueryDescriptor): The query object containing the query details.
+            params_list (Sequence[Mapping[str, Any]]): The parameters of each query execution.
+
+        Returns:
+            list[Result]: The results of the query executions in the order of the parameter sets.
+
+        Raises:
+            InvalidInputException: If the query index is not found among the executor's indices.
+        """
+        with telemetry.span(
+            "executor.query_many",
+            attributes={
+                "index_id": query_descriptor.index._node_id,
+                "schema": query_descriptor.schema._schema_name,
+                "n_queries": len(params_list),
+            },
+        ):
+            return AsyncUtil.run(self.async_query_many(query_descriptor, params_list))
+
+    async def async_query_many(
+        self, query_descriptor: QueryDescriptor, params_list: Sequence[Mapping[str, Any]]
+    ) -> list[QueryResult]:
+        if query_vector_factory := self._query_vector_factory_by_index.get(query_descriptor.index):
+            # 'self' is an App instance; MyPy can't infer the inheriting class.
+            query_results: list[QueryResult] = await QueryExecutor(
+                self, query_descriptor, query_vector_factory  # type: ignore
+            ).query_many(params_list)
+            return [self._query_result_converter.convert(query_result) for query_result in query_results]
+
+        raise InvalidInputException(
+            (
+                f"Query index {query_descriptor.index} is not amongst the executor's indices: ",
+                f" {list(self._query_vector_factory_by_index.keys())}",
+            )
+        )
@@ -74,7 +74,7 @@ class QueryParamValueSetter:
             lambda params, clause: clause.get_altered_nql_params(params), query_descriptor.clauses, NLQClauseParams()
         )
         if nlq_params.client_config is not None and nlq_params.natural_query is not None:
-            return await NLQHandler(nlq_params.client_config).fill_params(
+            return await NLQHandler.get_instance(nlq_params.client_config).fill_params(
                 nlq_params.natural_query,
                 query_descriptor.clauses,
                 query_descriptor._space_weight_param_info,
@@ -41,51 +41,47 @@ from superlinked.framework.online.dag.event_metadata_handler import EventMetadat
 
 @dataclass
 class EventAggregatorParams:
-    context: ExecutionContext
     stored_result: Vector
     affecting_vector: Weighted[Vector]
     event_metadata: EventMetadata
     effect_modifier: EffectModifier
-    transformation_config: TransformationConfig
 
 
 class EventAggregator:
-    def __init__(self, params: EventAggregatorParams) -> None:
-        self._params = params
+    def __init__(self, transformation_config: TransformationConfig) -> None:
         # * We cannot normalize, as normalization will skew the event vector.
         transform_config_with_no_norm = TransformationConfig(
             NoNormConfig(),
-            self._params.transformation_config.aggregation_config,
-            self._params.transformation_config.embedding_config,
+            transformation_config.aggregation_config,
+            transformation_config.embedding_config,
         )
         self._aggregation_transformation = TransformationFactory.create_aggregation_transformation(
             transform_config_with_no_norm, SingletonEmbeddingEngineManager()
         )
 
-    async def calculate_event_vector(self) -> Vector:
-        weighted_affecting_vector = Weighted(
-            self._params.affecting_vector.item,
-            self._params.affecting_vector.weight,
-        )
-        aggregated_affecting_vector = await self._aggregation_transformation.transform(
-            [weighted_affecting_vector],
-            self._params.context,
-        )
-        weighted_affecting_vector = Weighted(
-            aggregated_affecting_vector,
-            self._params.effect_modifier.temperature,
-        )
-        weighted_stored_vector = Weighted(self._params.stored_result, self._calculate_stored_weight())
-        not_empty_weighted_vectors = [
-            weighted_vector
-            for weighted_vector in [weighted_affecting_vector, weighted_stored_vector]
-            if not weighted_vector.item.is_empty
-        ]
-        normalized_weighted_vectors = self.calculate_normalized_weighted_vectors(not_empty_weighted_vectors)
-        return await self._aggregation_transformation.transform(
-            normalized_weighted_vectors,
-            self._params.context,
+    async def calculate_event_vectors(
+        self, params_list: Sequence[EventAggregatorParams], context: ExecutionContext
+    ) -> list[Vector]:
+        """
+        Calculates the event vectors of independent events, each of them affecting a different entity, in one batch.
+        """
+        aggregated_affecting_vectors = await self._aggregation_transformation.transform_multiple(
+            [[Weighted(params.affecting_vector.item, params.affecting_vector.weight)] for params in params_list],
+            context,
         )
+        normalized_weighted_vectors_list: list[Sequence[Weighted[Vector]]] = []
+        for params, aggregated_affecting_vector in zip(params_list, aggregated_affecting_vectors):
+            weighted_affecting_vector = Weighted(aggregated_affecting_vector, params.effect_modifier.temperature)
+            weighted_stored_vector = Weighted(params.stored_result, self._calculate_stored_weight(params, context))
+            not_empty_weighted_vectors = [
+                weighted_vector
+                for weighted_vector in [weighted_affecting_vector, weighted_stored_vector]
+                if not weighted_vector.item.is_empty
+            ]
+            normalized_weighted_vectors_list.append(
+                self.calculate_normalized_weighted_vectors(not_empty_weighted_vectors)
+            )
+        return await self._aggregation_transformation.transform_multiple(normalized_weighted_vectors_list, context)
 
     def calculate_normalized_weighted_vectors(
         self, not_empty_weighted_vectors: Sequence[Weighted[Vector]]
@@ -95,17 +91,17 @@ class EventAggregator:
         normalized_weights = L1Norm().normalize(Vector(weights)).value
         return [Weighted(vector.item, normalized_weights[i]) for i, vector in enumerate(not_empty_weighted_vectors)]
 
-    def _calculate_stored_weight(self) -> float:
+    def _calculate_stored_weight(self, params: EventAggregatorParams, context: ExecutionContext) -> float:
         return (
             EventAggregator._calculate_time_modifier(
-                self._params.context.now(),
-                self._params.event_metadata.effect_oldest_ts,
-                self._params.event_metadata.effect_avg_ts,
-                self._params.effect_modifier.max_age_delta,
-                self._params.effect_modifier.time_decay_floor,
+                context.now(),
+                params.event_metadata.effect_oldest_ts,
+                params.event_metadata.effect_avg_ts,
+                params.effect_modifier.max_age_delta,
+                params.effect_modifier.time_decay_floor,
             )
-            * (self._params.event_metadata.effect_count - 1)
-            * (1 - self._params.effect_modifier.temperature)
+            * (params.event_metadata.effect_count - 1)
+            * (1 - params.effect_modifier.temperature)
         )
 
     @classmethod
@@ -14,8 +14,6 @@
 
 from __future__ import annotations
 
-import asyncio
-
 from beartype.typing import Sequence, cast
 from typing_extensions import override
 
@@ -68,23 +66,22 @@ class OnlineAggregationNode(DefaultOnlineNode[AggregationNode, Vector], HasLengt
         parent_results: Sequence[dict[OnlineNode, SingleEvaluationResult]],
         context: ExecutionContext,
     ) -> Sequence[Vector | None]:
-        return await asyncio.gather(
-            *[self._evaluate_single(parent_result, context) for parent_result in parent_results]
-        )
-
-    async def _evaluate_single(
-        self,
-        parent_results: dict[OnlineNode, SingleEvaluationResult],
-        context: ExecutionContext,
-    ) -> Vector:
-        self._check_evaluation_inputs(parent_results)
-        not_empty_weighted_vectors = self._get_not_empty_weighted_vectors(list(parent_results.values()))
-        if self._no_event_present(not_empty_weighted_vectors):
-            return not_empty_weighted_vectors[0].item
-        return await self._aggregation_transformation.transform(
-            not_empty_weighted_vectors,
-            context,
+        for parent_result in parent_results:
+            self._check_evaluation_inputs(parent_result)
+        weighted_vectors_list = [
+            self._get_not_empty_weighted_vectors(list(parent_result.values())) for parent_result in parent_results
+        ]
+        results: list[Vector | None] = [
+            weighted_vectors[0].item if self._no_event_present(weighted_vectors) else None
+            for weighted_vectors in weighted_vectors_list
+        ]
+        positions_to_aggregate = [i for i, result in enumerate(results) if result is None]
+        aggregated_vectors = await self._aggregation_transformation.transform_multiple(
+            [weighted_vectors_list[i] for i in positions_to_aggregate], context
         )
+        for position, aggregated_vector in zip(positions_to_aggregate, aggregated_vectors):
+            results[position] = aggregated_vector
+        return results
 
     def _check_evaluation_inputs(
         self,
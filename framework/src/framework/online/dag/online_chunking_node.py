@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import asyncio
+import math
 
 from beartype.typing import Sequence
 from typing_extensions import override
@@ -24,7 +25,10 @@ from superlinked.framework.common.dag.context import ExecutionContext
 from superlinked.framework.common.dag.node import Node
 from superlinked.framework.common.exception import InvalidStateException
 from superlinked.framework.common.parser.parsed_schema import ParsedSchema
+from superlinked.framework.common.settings import settings
 from superlinked.framework.common.util.chunking_util import Chunker
+from superlinked.framework.common.util.collection_util import CollectionUtil
+from superlinked.framework.common.util.process_pool_util import ProcessPoolUtil
 from superlinked.framework.online.dag.evaluation_result import EvaluationResult
 from superlinked.framework.online.dag.online_node import OnlineNode
 from superlinked.framework.online.dag.parent_validator import ParentValidationType
@@ -38,17 +42,7 @@ class OnlineChunkingNode(OnlineNode[ChunkingNode, str]):
         parents: list[OnlineNode[Node[str], str]],
     ) -> None:
         super().__init__(node, parents, ParentValidationType.EXACTLY_ONE_PARENT)
-
-    def __chunk(
-        self,
-        text: str,
-        chunk_size: int | None,
-        chunk_overlap: int | None,
-        split_chars_keep: list[str] | None = None,
-        split_chars_remove: list[str] | None = None,
-    ) -> list[str]:
-        chunker = Chunker()
-        return chunker.chunk_text(text, chunk_size, chunk_overlap, split_chars_keep, split_chars_remove)
+        self.__chunker = Chunker()
 
     @override
     async def evaluate_self(
@@ -57,28 +51,37 @@ class OnlineChunkingNode(OnlineNode[ChunkingNode, str]):
         context: ExecutionContext,
         online_entity_cache: OnlineEntityCache,
     ) -> list[EvaluationResult[str] | None]:
-        return await asyncio.gather(
-            *[self.evaluate_self_single(schema, context, online_entity_cache) for schema in parsed_schemas]
-        )
-
-    async def evaluate_self_single(
-        self,
-        parsed_schema: ParsedSchema,
-        context: ExecutionContext,
-        online_entity_cache: OnlineEntityCache,
-    ) -> EvaluationResult[str] | None:
-        parent_result = (await self.evaluate_parent(self.parents[0], [parsed_schema], context, online_entity_cache))[0]
-        if parent_result is None:
-            return None
-        if len(parent_result.chunks) > 0:
+        parent_results = await self.evaluate_parent(self.parents[0], parsed_schemas, context, online_entity_cache)
+        if any(parent_result is not None and len(parent_result.chunks) > 0 for parent_result in parent_results):
             # We can just log a warning and proceed with input_.main.
             raise InvalidStateException(f"{self.class_name} cannot have a chunked input.")
-        input_value = parent_result.main.value
-        chunk_inputs = self.__chunk(
-            input_value,
+        input_values = [parent_result.main.value for parent_result in parent_results if parent_result is not None]
+        chunk_inputs_per_value = iter(await self.__chunk(input_values))
+        return [
+            self._wrap_in_evaluation_result(parent_result.main.value, next(chunk_inputs_per_value))
+            if parent_result is not None
+            else None
+            for parent_result in parent_results
+        ]
+
+    async def __chunk(self, texts: Sequence[str]) -> list[list[str]]:
+        chunk_args = (
             self.node.chunk_size,
             self.node.chunk_overlap,
             self.node.split_chars_keep,
             self.node.split_chars_remove,
         )
-        return self._wrap_in_evaluation_result(input_value, chunk_inputs)
+        max_workers = settings.CHUNKING_PROCESS_POOL_MAX_WORKERS
+        if (
+            max_workers <= 0
+            or len(texts) < 2
+            or sum(len(text) for text in texts) < settings.CHUNKING_PROCESS_POOL_MIN_TEXT_LENGTH
+        ):
+            return self.__chunker.chunk_texts(texts, *chunk_args)
+        chunk_inputs_per_batch = await asyncio.gather(
+            *[
+                ProcessPoolUtil.run(max_workers, self.__chunker.chunk_texts, batch, *chunk_args)
+                for batch in CollectionUtil.chunk_list(texts, math.ceil(len(texts) / max_workers))
+            ]
+        )
+        return [chunk_inputs for chunk_inputs_list in chunk_inputs_per_batch for chunk_inputs in chunk_inputs_list]
@@ -14,12 +14,16 @@
 
 from __future__ import annotations
 
-from beartype.typing import Sequence
+from collections import defaultdict
+from itertools import chain
+
+import numpy as np
+from beartype.typing import Sequence, cast
 from typing_extensions import override
 
 from superlinked.framework.common.dag.concatenation_node import ConcatenationNode
 from superlinked.framework.common.dag.context import ExecutionContext
-from superlinked.framework.common.data_types import Vector
+from superlinked.framework.common.data_types import Vector, VectorItemT
 from superlinked.framework.common.exception import InvalidInputException
 from superlinked.framework.common.interface.has_length import HasLength
 from superlinked.framework.common.space.normalization.normalization import ConstantNorm
@@ -50,13 +54,73 @@ class OnlineConcatenationNode(DefaultOnlineNode[ConcatenationNode, Vector], HasL
         context: ExecutionContext,
     ) -> list[Vector | None]:
         self._check_evaluation_inputs(parent_results)
-        vector_and_nodes_list: list[list[tuple[Vector, OnlineNode]]] = [
-            [(result.value, parent) for parent, result in parent_result.items()] for parent_result in parent_results
+        positions_by_layout: dict[tuple[tuple[OnlineNode, ...], tuple[int, ...]], list[int]] = defaultdict(list)
+        for position, parent_result in enumerate(parent_results):
+            layout = (
+                tuple(parent_result.keys()),
+                tuple(cast(Vector, result.value).dimension for result in parent_result.values()),
+            )
+            positions_by_layout[layout].append(position)
+        results: list[Vector | None] = [None] * len(parent_results)
+        for (parents, dimensions), positions in positions_by_layout.items():
+            vectors_list = [[cast(Vector, parent_results[i][parent].value) for parent in parents] for i in positions]
+            if 0 in dimensions:
+                vectors = [
+                    self._norm.normalize(
+                        self._apply_weights_and_concatenate(list(zip(vectors, parents)), context), context
+                    )
+                    for vectors in vectors_list
+                ]
+            else:
+                vectors = self._concatenate_and_normalize(vectors_list, parents, dimensions, context)
+            for position, vector in zip(positions, vectors):
+                results[position] = vector
+        return results
+
+    def _concatenate_and_normalize(
+        self,
+        vectors_list: Sequence[Sequence[Vector]],
+        parents: Sequence[OnlineNode],
+        dimensions: Sequence[int],
+        context: ExecutionContext,
+    ) -> list[Vector]:
+        """
+        Weights, concatenates and normalizes the vectors of all entities on a single matrix
+        where each parent occupies a block of columns.
+        """
+        values = np.stack([np.concatenate([vector.value for vector in vectors]) for vectors in vectors_list])
+        negative_filter_mask = self._calculate_negative_filter_mask(vectors_list, dimensions, values.shape)
+        weights = [context.get_weight_of_node(parent.node_id) for parent in parents]
+        column_weights = np.repeat(np.array(weights, dtype=VectorItemT), dimensions)
+        weighted_values = np.where(negative_filter_mask, values, values * column_weights)
+        # a zero weight zeroes the whole block, including its negative filter values
+        weighted_values[:, column_weights == 0] = 0.0
+        norms = self._norm.norm_multiple(weighted_values, negative_filter_mask, context.is_query_context)
+        normalized_values = np.divide(
+            weighted_values,
+            norms.astype(VectorItemT)[:, None],
+            where=~negative_filter_mask & (norms != 0)[:, None],
+            out=weighted_values.copy(),
+        )
+        return [
+            Vector(value, set(np.flatnonzero(row_negative_filter_mask).tolist()), 1 / norm if norm else 1.0)
+            for value, row_negative_filter_mask, norm in zip(normalized_values, negative_filter_mask, norms.tolist())
         ]
-        weighted_vectors = [
-            self._apply_weights_and_concatenate(vector_and_nodes, context) for vector_and_nodes in vector_and_nodes_list
+
+    @staticmethod
+    def _calculate_negative_filter_mask(
+        vectors_list: Sequence[Sequence[Vector]], dimensions: Sequence[int], shape: tuple[int, ...]
+    ) -> np.ndarray:
+        offsets = np.cumsum([0, *dimensions[:-1]]).tolist()
+        columns_list = [
+            [index + offset for vector, offset in zip(vectors, offsets) for index in vector.negative_filter_indices]
+            for vectors in vectors_list
         ]
-        return [self._norm.normalize(vector, context) for vector in weighted_vectors]
+        row_indices = np.repeat(np.arange(len(vectors_list)), [len(columns) for columns in columns_list])
+        column_indices = np.fromiter(chain.from_iterable(columns_list), dtype=np.int64, count=len(row_indices))
+        negative_filter_mask = np.zeros(shape, dtype=np.bool_)
+        negative_filter_mask[row_indices, column_indices] = True
+        return negative_filter_mask
 
     def _apply_weights_and_concatenate(
         self,
@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
+
 from beartype.typing import Mapping, Sequence, cast
 from typing_extensions import override
 
@@ -59,6 +61,7 @@ class OnlineEventAggregationNode(OnlineNode[EventAggregationNode, Vector], HasLe
         super().__init__(node, parents)
         self.__init_named_parents()
         self._transformation_config = self.node.transformation_config
+        self._event_aggregator = EventAggregator(self._transformation_config)
         self._event_metadata_handler = EventMetadataHandler(self.node.node_id)
         self._event_effect_handler = EventEffectHandler()
 
@@ -114,32 +117,56 @@ class OnlineEventAggregationNode(OnlineNode[EventAggregationNode, Vector], HasLe
         event_id_to_affecting_info = await self._calculate_event_id_to_affecting_info(
             context, relevant_parsed_schemas, self._input_to_aggregate, online_entity_cache
         )
+        parsed_schemas_by_id: dict[str, list[ParsedSchemaWithEvent]] = defaultdict(list)
         for parsed_schema in relevant_parsed_schemas:
-            if (event_id := parsed_schema.event_parsed_schema.id_) in event_id_to_affecting_info:
-                affecting_info = event_id_to_affecting_info[event_id]
-                stored_event_metadata = self._event_metadata_handler.read(
-                    schema, parsed_schema.id_, online_entity_cache
-                )
-                recalculated_event_metadata = self._event_metadata_handler.recalculate(
+            if parsed_schema.event_parsed_schema.id_ in event_id_to_affecting_info:
+                parsed_schemas_by_id[parsed_schema.id_].append(parsed_schema)
+        await self._aggregate_events(
+            schema, parsed_schemas_by_id, event_id_to_affecting_info, id_to_result, context, online_entity_cache
+        )
+        return self._to_evaluation_results(parsed_schemas, id_to_result)
+
+    async def _aggregate_events(  # pylint: disable=too-many-arguments
+        self,
+        schema: IdSchemaObject,
+        parsed_schemas_by_id: Mapping[str, Sequence[ParsedSchemaWithEvent]],
+        event_id_to_affecting_info: Mapping[str, EventAffectingInfo],
+        id_to_result: dict[str, Vector],
+        context: ExecutionContext,
+        online_entity_cache: OnlineEntityCache,
+    ) -> None:
+        """
+        The events of an entity build on each other, so they are applied in order, but the i-th events
+        of all the entities are aggregated in one batch. Event metadata is read and written once per entity.
+        """
+        id_to_event_metadata = {
+            object_id: self._event_metadata_handler.read(schema, object_id, online_entity_cache)
+            for object_id in parsed_schemas_by_id
+        }
+        for i in range(max((len(parsed_schemas) for parsed_schemas in parsed_schemas_by_id.values()), default=0)):
+            ith_parsed_schemas = [
+                parsed_schemas[i] for parsed_schemas in parsed_schemas_by_id.values() if len(parsed_schemas) > i
+            ]
+            params_list: list[EventAggregatorParams] = []
+            for parsed_schema in ith_parsed_schemas:
+                affecting_info = event_id_to_affecting_info[parsed_schema.event_parsed_schema.id_]
+                id_to_event_metadata[parsed_schema.id_] = self._event_metadata_handler.recalculate(
                     parsed_schema.event_parsed_schema.created_at,
                     affecting_info.number_of_weights,
-                    stored_event_metadata,
+                    id_to_event_metadata[parsed_schema.id_],
                 )
-                id_to_result[parsed_schema.id_] = await EventAggregator(
+                params_list.append(
                     EventAggregatorParams(
-                        context,
                         id_to_result[parsed_schema.id_],
                         Weighted(affecting_info.affecting_vector, affecting_info.average_weight),
-                        recalculated_event_metadata,
+                        id_to_event_metadata[parsed_schema.id_],
                         self.node.effect_modifier,
-                        self._transformation_config,
                     )
-                ).calculate_event_vector()
-                self._event_metadata_handler.write(
-                    schema, {parsed_schema.id_: recalculated_event_metadata}, online_entity_cache
                 )
-
-        return self._to_evaluation_results(parsed_schemas, id_to_result)
+            event_vectors = await self._event_aggregator.calculate_event_vectors(params_list, context)
+            for parsed_schema, event_vector in zip(ith_parsed_schemas, event_vectors):
+                id_to_result[parsed_schema.id_] = event_vector
+        self._event_metadata_handler.write(schema, id_to_event_metadata, online_entity_cache)
 
     def _to_evaluation_results(
         self, parsed_schemas: Sequence[ParsedSchema], id_to_result: Mapping[str, Vector]
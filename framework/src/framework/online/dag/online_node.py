@@ -81,6 +81,18 @@ class OnlineNode(ABC, Generic[NT, NodeDataT], metaclass=ABCMeta):
         parsed_schemas: Sequence[ParsedSchema],
         context: ExecutionContext,
         online_entity_cache: OnlineEntityCache,
+    ) -> list[EvaluationResult[NodeDataT] | None]:
+        return await online_entity_cache.get_or_evaluate_node(
+            self.node_id,
+            parsed_schemas,
+            lambda: self._evaluate_next(parsed_schemas, context, online_entity_cache),
+        )
+
+    async def _evaluate_next(
+        self,
+        parsed_schemas: Sequence[ParsedSchema],
+        context: ExecutionContext,
+        online_entity_cache: OnlineEntityCache,
     ) -> list[EvaluationResult[NodeDataT] | None]:
         with context.dag_output_recorder.record_evaluation_exception(self.node_id):
             results = await self.evaluate_self(parsed_schemas, context, online_entity_cache)
@@ -15,12 +15,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
 from collections.abc import Sequence
 
-from beartype.typing import Mapping
+from beartype.typing import Any, Awaitable, Callable, Mapping, TypeVar, cast
 
 from superlinked.framework.common.data_types import NodeDataTypes
+from superlinked.framework.common.parser.parsed_schema import ParsedSchema
 from superlinked.framework.common.storage.entity.entity_id import EntityId
 from superlinked.framework.common.storage_manager.entity_data_request import (
     EntityDataRequest,
@@ -29,6 +31,8 @@ from superlinked.framework.common.storage_manager.entity_data_request import (
 from superlinked.framework.common.storage_manager.node_info import NodeInfo
 from superlinked.framework.common.storage_manager.storage_manager import StorageManager
 
+EvaluationT = TypeVar("EvaluationT")
+
 
 class OnlineEntityCache:
     """Storage of data during online DAG evaluation, reducing database operations"""
@@ -38,6 +42,8 @@ class OnlineEntityCache:
         self._change: dict[EntityId, dict[str, NodeInfo]] = defaultdict(defaultdict)
         self._entity_to_origin: dict[EntityId, str] = {}
         self._storage_manager = storage_manager
+        # the evaluated parsed schemas are kept alongside the task so their ids stay unique within the batch
+        self._node_evaluations: dict[tuple[str, tuple[int, ...]], tuple[Sequence[ParsedSchema], asyncio.Task]] = {}
 
     @property
     def changes(self) -> Mapping[EntityId, Mapping[str, NodeInfo]]:
@@ -62,6 +68,22 @@ class OnlineEntityCache:
         previous_change = self._change.get(entity_id, {}).get(node_id)
         self._change[entity_id][node_id] = self._calculate_node_info(previous_change, delta, diff=False)
 
+    async def get_or_evaluate_node(
+        self,
+        node_id: str,
+        parsed_schemas: Sequence[ParsedSchema],
+        evaluate: Callable[[], Awaitable[EvaluationT]],
+    ) -> EvaluationT:
+        """
+        Evaluates a node at most once for the same parsed schemas within the batch.
+        Concurrent consumers of the same node await the same evaluation.
+        """
+        key = (node_id, tuple(id(parsed_schema) for parsed_schema in parsed_schemas))
+        if (node_evaluation := self._node_evaluations.get(key)) is None:
+            node_evaluation = (parsed_schemas, asyncio.ensure_future(cast(Awaitable[Any], evaluate())))
+            self._node_evaluations[key] = node_evaluation
+        return cast(EvaluationT, await node_evaluation[1])
+
     def set_origin(self, entity_id: EntityId, origin_id: str) -> None:
         self._entity_to_origin[entity_id] = origin_id
 
@@ -0,0 +1,50 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from beartype.typing import Any, Callable, Sequence, TypeVar
+
+ItemT = TypeVar("ItemT")
+ReturnT = TypeVar("ReturnT")
+
+
+class BlockingIOExecutor:
+    """
+    Runs the calls of synchronous database clients in a bounded thread pool,
+    so a slow storage call does not block the event loop.
+    """
+
+    def __init__(self, max_workers: int, chunk_size: int, thread_name_prefix: str) -> None:
+        self.__executor = ThreadPoolExecutor(max_workers=max(max_workers, 1), thread_name_prefix=thread_name_prefix)
+        self.__chunk_size = max(chunk_size, 1)
+
+    async def run(self, func: Callable[..., ReturnT], *args: Any, **kwargs: Any) -> ReturnT:
+        return await asyncio.get_running_loop().run_in_executor(self.__executor, partial(func, *args, **kwargs))
+
+    async def run_chunked(self, func: Callable[[Sequence[ItemT]], ReturnT], items: Sequence[ItemT]) -> list[ReturnT]:
+        """Splits the items into chunks and runs func for each chunk concurrently, returning the results per chunk."""
+        return list(
+            await asyncio.gather(
+                *[
+                    self.run(func, items[start : start + self.__chunk_size])
+                    for start in range(0, len(items), self.__chunk_size)
+                ]
+            )
+        )
+
+    def shutdown(self) -> None:
+        self.__executor.shutdown(wait=False)
@@ -0,0 +1,75 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import os
+import tempfile
+
+from typing_extensions import override
+
+from superlinked.framework.storage.in_memory.object_serializer import ObjectSerializer
+
+TEXT_FILE_EXTENSION = ".json"
+BINARY_FILE_EXTENSION = ".bin"
+
+
+class FileObjectSerializer(ObjectSerializer):
+    """
+    Stores serialized objects as files in a local directory.
+    Binary payloads are written as raw files, so they can be memory-mapped on restore.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self._directory = directory
+        os.makedirs(self._directory, exist_ok=True)
+
+    @override
+    def read(self, key: str) -> str:
+        with open(self._get_path(key, TEXT_FILE_EXTENSION), "r", encoding="utf-8") as file:
+            return file.read()
+
+    @override
+    def write(self, serialized_object: str, key: str) -> None:
+        with open(self._get_path(key, TEXT_FILE_EXTENSION), "w", encoding="utf-8") as file:
+            file.write(serialized_object)
+
+    @property
+    @override
+    def supports_binary(self) -> bool:
+        return True
+
+    @override
+    def read_binary(self, key: str) -> bytes:
+        with open(self._get_path(key, BINARY_FILE_EXTENSION), "rb") as file:
+            return file.read()
+
+    @override
+    def write_binary(self, serialized_object: bytes | memoryview, key: str) -> None:
+        # a restored VDB may still memory-map the previous file, so it is replaced instead of truncated
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self._directory, suffix=f"{BINARY_FILE_EXTENSION}.tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(serialized_object)
+            os.replace(temp_path, self._get_path(key, BINARY_FILE_EXTENSION))
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temp_path)
+            raise
+
+    @override
+    def get_binary_path(self, key: str) -> str | None:
+        return self._get_path(key, BINARY_FILE_EXTENSION)
+
+    def _get_path(self, key: str, extension: str) -> str:
+        return os.path.join(self._directory, f"{key}{extension}")
@@ -0,0 +1,296 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+
+import numpy as np
+from beartype.typing import Any, Collection, Hashable, Mapping, Sequence, cast
+
+from superlinked.framework.common.interface.comparison_operand import (
+    ComparisonOperation,
+)
+from superlinked.framework.common.interface.comparison_operation_type import (
+    ComparisonOperationType,
+)
+from superlinked.framework.common.storage.field.field import Field
+
+# float64 represents every integer up to this magnitude exactly
+MAX_EXACT_INTEGER = 2**53
+COLLECTION_TYPES = (list, tuple, set, frozenset)
+
+
+class InMemoryFieldIndex:
+    """
+    Inverted index of a single field: value -> row ids for equality checks, element -> row ids for
+    list values and a lazily sorted numeric array for range comparisons.
+    `find` returns None for comparisons the index cannot answer exactly; those are evaluated row by row.
+    """
+
+    def __init__(self) -> None:
+        self.__value_by_row_id: dict[str, Any] = {}
+        self.__row_ids_by_value: defaultdict[Hashable, set[str]] = defaultdict(set)
+        self.__unhashable_row_ids: set[str] = set()
+        self.__row_ids_by_element: defaultdict[Hashable, set[str]] = defaultdict(set)
+        self.__unindexed_element_row_ids: set[str] = set()
+        self.__non_numeric_row_ids: set[str] = set()
+        self.__sorted_values: np.ndarray | None = None
+        self.__sorted_row_ids: list[str] = []
+
+    @property
+    def row_ids(self) -> Collection[str]:
+        """Rows having a value other than None."""
+        return self.__value_by_row_id.keys()
+
+    def set(self, row_id: str, value: Any) -> None:
+        self.remove(row_id)
+        if value is None:
+            return
+        self.__value_by_row_id[row_id] = value
+        if InMemoryFieldIndex.__is_hashable(value):
+            self.__row_ids_by_value[value].add(row_id)
+        else:
+            self.__unhashable_row_ids.add(row_id)
+        if isinstance(value, COLLECTION_TYPES) and all(InMemoryFieldIndex.__is_hashable(item) for item in value):
+            for element in value:
+                self.__row_ids_by_element[element].add(row_id)
+        else:
+            self.__unindexed_element_row_ids.add(row_id)
+        if not InMemoryFieldIndex.__is_exact_number(value):
+            self.__non_numeric_row_ids.add(row_id)
+        self.__sorted_values = None
+
+    def remove(self, row_id: str) -> None:
+        if row_id not in self.__value_by_row_id:
+            return
+        value = self.__value_by_row_id.pop(row_id)
+        if row_id in self.__unhashable_row_ids:
+            self.__unhashable_row_ids.discard(row_id)
+        else:
+            InMemoryFieldIndex.__discard(self.__row_ids_by_value, value, row_id)
+        if row_id in self.__unindexed_element_row_ids:
+            self.__unindexed_element_row_ids.discard(row_id)
+        else:
+            for element in value:
+                InMemoryFieldIndex.__discard(self.__row_ids_by_element, element, row_id)
+        self.__non_numeric_row_ids.discard(row_id)
+        self.__sorted_values = None
+
+    def find(self, filter_: ComparisonOperation[Field], all_row_ids: Collection[str]) -> set[str] | None:
+        match filter_._op:
+            case ComparisonOperationType.EQUAL:
+                return self.__find_equal([filter_._other], all_row_ids)
+            case ComparisonOperationType.NOT_EQUAL:
+                return InMemoryFieldIndex.__complement(self.__find_equal([filter_._other], all_row_ids), all_row_ids)
+            case ComparisonOperationType.IN:
+                return self.__find_equal(filter_._get_other_as_sequence(), all_row_ids)
+            case ComparisonOperationType.NOT_IN:
+                return InMemoryFieldIndex.__complement(
+                    self.__find_equal(filter_._get_other_as_sequence(), all_row_ids), all_row_ids
+                )
+            case (
+                ComparisonOperationType.GREATER_THAN
+                | ComparisonOperationType.GREATER_EQUAL
+                | ComparisonOperationType.LESS_THAN
+                | ComparisonOperationType.LESS_EQUAL
+            ):
+                return self.__find_range(filter_)
+            case ComparisonOperationType.CONTAINS:
+                return self.__find_contains(filter_)
+            case ComparisonOperationType.NOT_CONTAINS:
+                contained_row_ids = self.__find_contains(filter_)
+                return None if contained_row_ids is None else set(self.row_ids) - contained_row_ids
+            case ComparisonOperationType.CONTAINS_ALL:
+                return self.__find_contains_all(filter_, all_row_ids)
+            case _:
+                return None
+
+    def __find_equal(self, others: Sequence[Any], all_row_ids: Collection[str]) -> set[str] | None:
+        if not all(InMemoryFieldIndex.__is_hashable(other) for other in others):
+            return None
+        row_ids: set[str] = set()
+        for other in others:
+            if other is None:
+                row_ids.update(InMemoryFieldIndex.__complement(set(self.row_ids), all_row_ids))
+            elif (equal_row_ids := self.__row_ids_by_value.get(other)) is not None:
+                row_ids.update(equal_row_ids)
+        row_ids.update(row_id for row_id in self.__unhashable_row_ids if self.__value_by_row_id[row_id] in others)
+        return row_ids
+
+    def __find_range(self, filter_: ComparisonOperation[Field]) -> set[str] | None:
+        if self.__non_numeric_row_ids or not InMemoryFieldIndex.__is_exact_number(filter_._other):
+            return None
+        other = float(cast(float, filter_._other))
+        if math.isnan(other):
+            return set()
+        sorted_values, sorted_row_ids = self.__get_sorted_values()
+        match filter_._op:
+            case ComparisonOperationType.GREATER_THAN:
+                return set(sorted_row_ids[int(np.searchsorted(sorted_values, other, side="right")) :])
+            case ComparisonOperationType.GREATER_EQUAL:
+                return set(sorted_row_ids[int(np.searchsorted(sorted_values, other, side="left")) :])
+            case ComparisonOperationType.LESS_THAN:
+                return set(sorted_row_ids[: int(np.searchsorted(sorted_values, other, side="left"))])
+            case _:
+                return set(sorted_row_ids[: int(np.searchsorted(sorted_values, other, side="right"))])
+
+    def __find_contains(self, filter_: ComparisonOperation[Field]) -> set[str] | None:
+        others = filter_._get_other_as_sequence()
+        if not all(InMemoryFieldIndex.__is_hashable(other) for other in others):
+            return None
+        row_ids: set[str] = set()
+        for other in others:
+            row_ids.update(self.__row_ids_by_element.get(other, ()))
+        row_ids.update(
+            row_id
+            for row_id in self.__unindexed_element_row_ids
+            if any(other in self.__value_by_row_id[row_id] for other in others)
+        )
+        return row_ids
+
+    def __find_contains_all(self, filter_: ComparisonOperation[Field], all_row_ids: Collection[str]) -> set[str] | None:
+        others = filter_._get_other_as_sequence()
+        if not all(InMemoryFieldIndex.__is_hashable(other) for other in others):
+            return None
+        indexed_row_ids = set(self.row_ids) - self.__unindexed_element_row_ids
+        for other in others:
+            indexed_row_ids &= self.__row_ids_by_element.get(other, set())
+        # rows without a value satisfy contains_all
+        row_ids = InMemoryFieldIndex.__complement(set(self.row_ids), all_row_ids) | indexed_row_ids
+        row_ids.update(
+            row_id
+            for row_id in self.__unindexed_element_row_ids
+            if all(other in self.__value_by_row_id[row_id] for other in others)
+        )
+        return row_ids
+
+    def __get_sorted_values(self) -> tuple[np.ndarray, list[str]]:
+        if self.__sorted_values is None:
+            row_ids = [row_id for row_id, value in self.__value_by_row_id.items() if not math.isnan(value)]
+            values = np.array([self.__value_by_row_id[row_id] for row_id in row_ids], dtype=np.float64)
+            order = np.argsort(values, kind="stable")
+            self.__sorted_values = values[order]
+            self.__sorted_row_ids = [row_ids[position] for position in order.tolist()]
+        return self.__sorted_values, self.__sorted_row_ids
+
+    @staticmethod
+    def __complement(row_ids: set[str] | None, all_row_ids: Collection[str]) -> set[str] | None:
+        if row_ids is None:
+            return None
+        return {row_id for row_id in all_row_ids if row_id not in row_ids}
+
+    @staticmethod
+    def __discard(row_ids_by_key: defaultdict[Hashable, set[str]], key: Hashable, row_id: str) -> None:
+        if (row_ids := row_ids_by_key.get(key)) is not None:
+            row_ids.discard(row_id)
+            if not row_ids:
+                del row_ids_by_key[key]
+
+    @staticmethod
+    def __is_hashable(value: Any) -> bool:
+        try:
+            hash(value)
+        except TypeError:
+            return False
+        return True
+
+    @staticmethod
+    def __is_exact_number(value: Any) -> bool:
+        if isinstance(value, float):
+            return True
+        return isinstance(value, int) and abs(value) <= MAX_EXACT_INTEGER
+
+
+class InMemoryFilterIndex:
+    """
+    Resolves hard filters to the matching row ids using per-field inverted indices.
+    A field is indexed the first time it is filtered on and kept up to date by the writes afterwards.
+    Filters the indices cannot answer are evaluated only on the rows left by the other filters.
+    """
+
+    def __init__(self) -> None:
+        self.__field_indices: dict[str, InMemoryFieldIndex] = {}
+
+    def clear(self) -> None:
+        self.__field_indices.clear()
+
+    def update(self, row_id: str, values: Mapping[str, Any]) -> None:
+        for name, value in values.items():
+            if (field_index := self.__field_indices.get(name)) is not None:
+                field_index.set(row_id, value)
+
+    def get_matching_row_ids(
+        self,
+        vdb: Mapping[str, Mapping[str, Any]],
+        filters: Sequence[ComparisonOperation[Field]],
+        has_fields: Sequence[Field] | None = None,
+    ) -> set[str] | None:
+        """
+        Returns the ids of the rows satisfying every filter group and having every field of has_fields,
+        or None if there is nothing to filter on.
+        """
+        if not (filters or has_fields):
+            return None
+        all_row_ids = vdb.keys()
+        row_ids: set[str] | None = None
+        unresolved_groups = list[tuple[int | None, list[ComparisonOperation[Field]]]]()
+        for group_key, group in ComparisonOperation._group_filters_by_group_key(filters).items():
+            found_row_ids = [self.__get_field_index(vdb, filter_).find(filter_, all_row_ids) for filter_ in group]
+            if group_key is None:
+                unresolved_groups.extend(
+                    (group_key, [filter_]) for filter_, found in zip(group, found_row_ids) if found is None
+                )
+                row_ids = InMemoryFilterIndex.__intersect(
+                    row_ids, [found for found in found_row_ids if found is not None]
+                )
+            elif any(found is None for found in found_row_ids):
+                unresolved_groups.append((group_key, group))
+            else:
+                row_ids = InMemoryFilterIndex.__intersect(
+                    row_ids, [set[str]().union(*cast(list[set[str]], found_row_ids))]
+                )
+        for field in has_fields or []:
+            field_row_ids = set(self.__get_index_by_name(vdb, field.name).row_ids)
+            row_ids = InMemoryFilterIndex.__intersect(row_ids, [field_row_ids])
+        for group_key, group in unresolved_groups:
+            evaluate_group = all if group_key is None else any
+            row_ids = {
+                row_id
+                for row_id in (all_row_ids if row_ids is None else row_ids)
+                if evaluate_group(
+                    filter_.evaluate(vdb.get(row_id, {}).get(cast(Field, filter_._operand).name)) for filter_ in group
+                )
+            }
+        return set(all_row_ids) if row_ids is None else row_ids
+
+    def __get_field_index(
+        self, vdb: Mapping[str, Mapping[str, Any]], filter_: ComparisonOperation[Field]
+    ) -> InMemoryFieldIndex:
+        return self.__get_index_by_name(vdb, cast(Field, filter_._operand).name)
+
+    def __get_index_by_name(self, vdb: Mapping[str, Mapping[str, Any]], name: str) -> InMemoryFieldIndex:
+        if (field_index := self.__field_indices.get(name)) is None:
+            field_index = InMemoryFieldIndex()
+            for row_id, raw_entity in vdb.items():
+                field_index.set(row_id, raw_entity.get(name))
+            self.__field_indices[name] = field_index
+        return field_index
+
+    @staticmethod
+    def __intersect(row_ids: set[str] | None, others: Sequence[set[str]]) -> set[str] | None:
+        for other in sorted(others, key=len):
+            row_ids = set(other) if row_ids is None else row_ids & other
+        return row_ids
@@ -14,24 +14,30 @@
 
 from collections import defaultdict
 
+import numpy as np
 from beartype.typing import Any, Sequence, cast
 
 from superlinked.framework.common.calculation.distance_metric import DistanceMetric
 from superlinked.framework.common.calculation.vector_similarity import (
     VectorSimilarityCalculator,
 )
-from superlinked.framework.common.data_types import Vector
+from superlinked.framework.common.data_types import NPArray, Vector, VectorItemT
 from superlinked.framework.common.exception import InvalidStateException
 from superlinked.framework.common.interface.comparison_operand import (
     ComparisonOperation,
 )
 from superlinked.framework.common.storage.field.field import Field
-from superlinked.framework.common.storage.field.field_data import VectorFieldData
 from superlinked.framework.common.storage.index_config import IndexConfig
 from superlinked.framework.common.storage.query.vdb_knn_search_params import (
     VDBKNNSearchParams,
 )
 from superlinked.framework.common.storage.search import Search
+from superlinked.framework.storage.in_memory.in_memory_filter_index import (
+    InMemoryFilterIndex,
+)
+from superlinked.framework.storage.in_memory.in_memory_vector_store import (
+    InMemoryVectorStore,
+)
 
 # This is associated with the DEFAULT_LIMIT from superlinked.framework.common.const
 UNLIMITED_SEARCH_RESULTS = -1
@@ -41,129 +47,152 @@ class InMemorySearch:
     def search(
         self,
         vdb: defaultdict[str, dict[str, Any]],
+        filter_index: InMemoryFilterIndex,
         filters: Sequence[ComparisonOperation[Field]],
         has_fields: Sequence[Field],
     ) -> Sequence[str]:
-        return [row_id for row_id, values in vdb.items() if InMemorySearch._is_subset(values, filters, has_fields)]
+        matching_row_ids = filter_index.get_matching_row_ids(vdb, filters, has_fields)
+        if matching_row_ids is None:
+            return list(vdb.keys())
+        return [row_id for row_id in vdb if row_id in matching_row_ids]
 
     async def knn_search(
         self,
         index_config: IndexConfig,
         vdb: defaultdict[str, dict[str, Any]],
+        filter_index: InMemoryFilterIndex,
+        vector_store: InMemoryVectorStore,
         search_params: VDBKNNSearchParams,
     ) -> Sequence[tuple[str, float]]:
-        Search.check_vector_field(index_config, search_params.vector_field)
-        Search.check_filters(index_config, search_params.filters)
-        filtered_vectors = self._filter_indexed_vectors(
-            vdb,
-            search_params.vector_field,
-            search_params.filters,
-        )
-        similarities = self._calculate_similarities(
-            index_config.vector_field_descriptor.distance_metric,
-            search_params.vector_field.value,
-            filtered_vectors,
-        )
-        sorted_similarities = self._sort_similarities(
-            similarities,
-            search_params.radius,
-        )
-        return (
-            sorted_similarities[: search_params.limit]
-            if search_params.limit != UNLIMITED_SEARCH_RESULTS
-            else sorted_similarities
-        )
+        return (await self.knn_search_many(index_config, vdb, filter_index, vector_store, [search_params]))[0]
+
+    async def knn_search_many(
+        self,
+        index_config: IndexConfig,
+        vdb: defaultdict[str, dict[str, Any]],
+        filter_index: InMemoryFilterIndex,
+        vector_store: InMemoryVectorStore,
+        search_params_list: Sequence[VDBKNNSearchParams],
+    ) -> list[Sequence[tuple[str, float]]]:
+        """
+        Unfiltered searches are scored together with a single matrix-matrix product,
+        filtered ones are scored against their own candidate rows.
+        """
+        distance_metric = index_config.vector_field_descriptor.distance_metric
+        vectors: list[Vector] = []
+        row_indices_list: list[NPArray | None] = []
+        for search_params in search_params_list:
+            Search.check_vector_field(index_config, search_params.vector_field)
+            Search.check_filters(index_config, search_params.filters)
+            vector = cast(Vector, search_params.vector_field.value)
+            vectors.append(vector)
+            row_indices_list.append(
+                self._filter_indexed_vectors(vdb, filter_index, vector_store, vector, search_params.filters)
+            )
+        unfiltered_positions = [
+            position for position, row_indices in enumerate(row_indices_list) if row_indices is None
+        ]
+        similarities_by_position: dict[int, NPArray] = {}
+        if len(unfiltered_positions) > 1:
+            similarity_matrix = self._calculate_similarities(
+                distance_metric,
+                np.stack([vectors[position].value for position in unfiltered_positions], axis=1),
+                vector_store.matrix,
+            )
+            similarities_by_position = {
+                position: similarity_matrix[:, column] for column, position in enumerate(unfiltered_positions)
+            }
+        results: list[Sequence[tuple[str, float]]] = []
+        for position, (search_params, row_indices) in enumerate(zip(search_params_list, row_indices_list)):
+            similarities = similarities_by_position.get(position)
+            if similarities is None:
+                similarities = self._calculate_similarities(
+                    distance_metric,
+                    vectors[position].value,
+                    vector_store.matrix if row_indices is None else vector_store.matrix[row_indices],
+                )
+            candidate_row_ids = (
+                vector_store.row_ids
+                if row_indices is None
+                else [vector_store.row_ids[row_index] for row_index in row_indices.tolist()]
+            )
+            results.append(
+                self._sort_similarities(candidate_row_ids, similarities, search_params.radius, search_params.limit)
+            )
+        return results
 
     def _filter_indexed_vectors(
         self,
         vdb: dict[str, dict[str, Any]],
-        vector_field: VectorFieldData,
+        filter_index: InMemoryFilterIndex,
+        vector_store: InMemoryVectorStore,
+        vector: Vector,
         filters: Sequence[ComparisonOperation[Field]] | None,
-    ) -> dict[str, Vector]:
-        filtered_unchecked_vectors = {
-            row_id: values[vector_field.name]
-            for row_id, values in vdb.items()
-            if InMemorySearch._is_subset(values, filters or []) and values.get(vector_field.name) is not None
+    ) -> NPArray | None:
+        """
+        Returns the matrix row indices of the vectors passing the filters, or None if every row is a candidate.
+        """
+        matching_row_ids = filter_index.get_matching_row_ids(vdb, filters or [])
+        if matching_row_ids is None:
+            self._validate_filtered_vectors(vector_store.invalid_values, vector_store, len(vector_store), vector)
+            return None
+        filtered_invalid_values = {
+            row_id: value for row_id, value in vector_store.invalid_values.items() if row_id in matching_row_ids
         }
-        filtered_vectors = self._validate_filtered_vectors(
-            filtered_unchecked_vectors,
-            cast(Vector, vector_field.value),
-        )
-        return filtered_vectors
+        row_indices = np.sort(vector_store.get_row_indices(matching_row_ids))
+        self._validate_filtered_vectors(filtered_invalid_values, vector_store, len(row_indices), vector)
+        return row_indices
 
     def _validate_filtered_vectors(
-        self, filtered_unchecked_vectors: dict[str, Any], vector: Vector
-    ) -> dict[str, Vector]:
-        if wrong_types := {
-            type(value) for value in filtered_unchecked_vectors.values() if not isinstance(value, Vector)
-        }:
+        self,
+        filtered_invalid_values: dict[str, Any],
+        vector_store: InMemoryVectorStore,
+        filtered_vector_count: int,
+        vector: Vector,
+    ) -> None:
+        if wrong_types := {type(value) for value in filtered_invalid_values.values() if not isinstance(value, Vector)}:
             raise InvalidStateException("Indexed vector field contains non-vectors.", wrong_types=wrong_types)
-        if wrong_dimensions := {
-            value.dimension for value in filtered_unchecked_vectors.values() if value.dimension != vector.dimension
-        }:
+        wrong_dimensions = {
+            value.dimension for value in filtered_invalid_values.values() if value.dimension != vector.dimension
+        }
+        if filtered_vector_count and vector_store.dimension != vector.dimension:
+            wrong_dimensions.add(vector_store.dimension)
+        if wrong_dimensions:
             raise InvalidStateException(
                 "Indexed vector field contains vectors with wrong dimensions.", wrong_dimensions=wrong_dimensions
             )
-        return cast(dict[str, Vector], filtered_unchecked_vectors)
 
     def _calculate_similarities(
         self,
         distance_metric: DistanceMetric,
-        vector: Vector,
-        filtered_vectors: dict[str, Vector],
-    ) -> dict[str, float]:
+        query: NPArray,
+        filtered_matrix: np.ndarray,
+    ) -> NPArray:
+        """
+        Scores a single query vector, or the columns of a query matrix, against the rows of the matrix.
+        """
         vector_similarity_calculator = VectorSimilarityCalculator(distance_metric)
-        return {
-            row_id: vector_similarity_calculator.calculate_similarity(filtered_vector, vector)
-            for row_id, filtered_vector in filtered_vectors.items()
-        }
+        if not len(filtered_matrix):
+            return np.empty((0, *query.shape[1:]), dtype=VectorItemT)
+        return vector_similarity_calculator.calculate_similarities_np(filtered_matrix, query)
 
     def _sort_similarities(
         self,
-        similarities: dict[str, float],
+        row_ids: Sequence[str],
+        similarities: NPArray,
         radius: float | None,
+        limit: int,
     ) -> Sequence[tuple[str, float]]:
-        return sorted(
-            {
-                k: similarity for k, similarity in similarities.items() if not radius or similarity >= (1 - radius)
-            }.items(),
+        positions = np.flatnonzero(similarities >= (1 - radius)) if radius else np.arange(len(similarities))
+        if limit == 0:
+            return []
+        if limit != UNLIMITED_SEARCH_RESULTS and limit < len(positions):
+            candidate_similarities = similarities[positions]
+            top_positions = np.argpartition(-candidate_similarities, limit - 1)[:limit]
+            # keep every candidate tied with the k-th score so ties are broken by row id as in a full sort
+            positions = positions[candidate_similarities >= candidate_similarities[top_positions].min()]
+        sorted_similarities = sorted(
+            zip((row_ids[position] for position in positions.tolist()), similarities[positions].tolist()),
             key=lambda x: (-x[1], x[0]),
         )
-
-    @staticmethod
-    def _is_subset(
-        raw_entity: dict[str, Any],
-        filters: Sequence[ComparisonOperation[Field]],
-        has_fields: Sequence[Field] | None = None,
-    ) -> bool:
-        """
-        Return true if all filters are True for the entity.
-        """
-        if not (filters or has_fields):
-            return True
-        grouped_filters = ComparisonOperation._group_filters_by_group_key(filters)
-        filters_evaluation = InMemorySearch._evaluate_grouped_filters(grouped_filters, raw_entity)
-        has_fields_evaluation = InMemorySearch._evaluate_has_fields(has_fields, raw_entity)
-        return filters_evaluation and has_fields_evaluation
-
-    @staticmethod
-    def _evaluate_grouped_filters(
-        grouped_filters: dict[int | None, list[ComparisonOperation[Field]]],
-        entity: dict[str, Any],
-    ) -> bool:
-        return all(
-            InMemorySearch._evaluate_group(group, group_key, entity) for group_key, group in grouped_filters.items()
-        )
-
-    @staticmethod
-    def _evaluate_group(
-        group: list[ComparisonOperation[Field]],
-        group_key: int | None,
-        entity: dict[str, Any],
-    ) -> bool:
-        evaluate_func = all if group_key is None else any
-        return evaluate_func(filter_.evaluate(entity.get(cast(Field, filter_._operand).name)) for filter_ in group)
-
-    @staticmethod
-    def _evaluate_has_fields(has_fields: Sequence[Field] | None, entity: dict[str, Any]) -> bool:
-        return all(entity.get(field.name) is not None for field in has_fields or [])
+        return sorted_similarities[:limit] if limit != UNLIMITED_SEARCH_RESULTS else sorted_similarities
@@ -18,6 +18,7 @@ from collections import defaultdict
 from beartype.typing import Any, Sequence
 from typing_extensions import override
 
+from superlinked.framework.common.data_types import Vector
 from superlinked.framework.common.interface.comparison_operand import (
     ComparisonOperation,
 )
@@ -39,10 +40,19 @@ from superlinked.framework.common.storage.search_index.manager.search_index_mana
 from superlinked.framework.common.storage.vdb_connector import VDBConnector
 from superlinked.framework.dsl.query.query_user_config import QueryUserConfig
 from superlinked.framework.storage.common.vdb_settings import VDBSettings
+from superlinked.framework.storage.in_memory.in_memory_filter_index import (
+    InMemoryFilterIndex,
+)
 from superlinked.framework.storage.in_memory.in_memory_search import InMemorySearch
 from superlinked.framework.storage.in_memory.in_memory_search_index_manager import (
     InMemorySearchIndexManager,
 )
+from superlinked.framework.storage.in_memory.in_memory_vdb_snapshot import (
+    InMemoryVDBSnapshot,
+)
+from superlinked.framework.storage.in_memory.in_memory_vector_store import (
+    InMemoryVectorStore,
+)
 from superlinked.framework.storage.in_memory.json_codec import JsonDecoder, JsonEncoder
 from superlinked.framework.storage.in_memory.object_serializer import ObjectSerializer
 
@@ -51,12 +61,16 @@ class InMemoryVDB(VDBConnector[VDBKNNSearchConfig]):
     def __init__(self, vdb_settings: VDBSettings) -> None:
         super().__init__(vdb_settings=vdb_settings)
         self._vdb = defaultdict[str, dict[str, Any]](dict)
+        self._vector_stores = defaultdict[str, InMemoryVectorStore](InMemoryVectorStore)
+        self._filter_index = InMemoryFilterIndex()
         self._search = InMemorySearch()
         self.__search_index_manager = InMemorySearchIndexManager()
 
     @override
     async def close_connection(self) -> None:
         self._vdb = defaultdict[str, dict[str, Any]](dict)
+        self._vector_stores = defaultdict[str, InMemoryVectorStore](InMemoryVectorStore)
+        self._filter_index.clear()
         self.search_index_manager.clear_configs()
 
     @property
@@ -68,7 +82,12 @@ class InMemoryVDB(VDBConnector[VDBKNNSearchConfig]):
     async def _write_entities(self, entity_data: Sequence[EntityData]) -> None:
         for ed in entity_data:
             row_id = InMemoryVDB._get_row_id_from_entity_id(ed.id_)
-            self._vdb[row_id].update({name: fd.value for name, fd in ed.field_data.items()})
+            values = {name: fd.value for name, fd in ed.field_data.items()}
+            self._vdb[row_id].update(values)
+            self._filter_index.update(row_id, values)
+            for name, fd in ed.field_data.items():
+                if isinstance(fd.value, Vector) or name in self._vector_stores:
+                    self._vector_stores[name].set(row_id, fd.value)
 
     @override
     async def _read_entities(self, entities: Sequence[Entity]) -> list[EntityData]:
@@ -97,7 +116,7 @@ class InMemoryVDB(VDBConnector[VDBKNNSearchConfig]):
         has_fields: Sequence[Field],
         return_fields: Sequence[Field],
     ) -> Sequence[EntityData]:
-        row_ids = self._search.search(self._vdb, filters, has_fields)
+        row_ids = self._search.search(self._vdb, self._filter_index, filters, has_fields)
         return [
             EntityData(
                 InMemoryVDB._get_entity_id_from_row_id(row_id),
@@ -116,12 +135,45 @@ class InMemoryVDB(VDBConnector[VDBKNNSearchConfig]):
         **params: Any,
     ) -> Sequence[ResultEntityData]:
         index_config = self._get_index_config(index_name)
-        sorted_scores = await self._search.knn_search(index_config, self._vdb, vdb_knn_search_params)
+        vector_store = self._vector_stores.get(vdb_knn_search_params.vector_field.name, InMemoryVectorStore())
+        sorted_scores = await self._search.knn_search(
+            index_config, self._vdb, self._filter_index, vector_store, vdb_knn_search_params
+        )
         return [
             self._get_result_entity_data(row_id, score, vdb_knn_search_params.fields_to_return)
             for row_id, score in sorted_scores
         ]
 
+    @override
+    async def _knn_search_many(
+        self,
+        index_name: str,
+        schema_name: str,
+        vdb_knn_search_params_list: Sequence[VDBKNNSearchParams],
+        search_config: VDBKNNSearchConfig,
+        **params: Any,
+    ) -> list[Sequence[ResultEntityData]]:
+        index_config = self._get_index_config(index_name)
+        positions_by_vector_field: dict[str, list[int]] = defaultdict(list)
+        for position, search_params in enumerate(vdb_knn_search_params_list):
+            positions_by_vector_field[search_params.vector_field.name].append(position)
+        results: list[Sequence[ResultEntityData]] = [[] for _ in vdb_knn_search_params_list]
+        for vector_field_name, positions in positions_by_vector_field.items():
+            vector_store = self._vector_stores.get(vector_field_name, InMemoryVectorStore())
+            all_sorted_scores = await self._search.knn_search_many(
+                index_config,
+                self._vdb,
+                self._filter_index,
+                vector_store,
+                [vdb_knn_search_params_list[position] for position in positions],
+            )
+            for position, sorted_scores in zip(positions, all_sorted_scores):
+                fields_to_return = vdb_knn_search_params_list[position].fields_to_return
+                results[position] = [
+                    self._get_result_entity_data(row_id, score, fields_to_return) for row_id, score in sorted_scores
+                ]
+        return results
+
     @override
     def init_search_config(self, query_user_config: QueryUserConfig) -> VDBKNNSearchConfig:
         return VDBKNNSearchConfig()
@@ -129,6 +181,9 @@ class InMemoryVDB(VDBConnector[VDBKNNSearchConfig]):
     @override
     def persist(self, serializer: ObjectSerializer) -> None:
         app_identifier = "_".join(self.search_index_manager._index_configs.keys())
+        if serializer.supports_binary:
+            InMemoryVDBSnapshot.write(self._vdb, self._vector_stores, serializer, app_identifier)
+            return
         serializer.write(
             json.dumps(self._vdb, cls=JsonEncoder),
             app_identifier,
@@ -137,12 +192,23 @@ class InMemoryVDB(VDBConnector[VDBKNNSearchConfig]):
     @override
     def restore(self, serializer: ObjectSerializer) -> None:
         app_identifier = "_".join(self.search_index_manager._index_configs.keys())
-        self._vdb.update(
-            json.loads(
-                serializer.read(app_identifier),
-                cls=JsonDecoder,
-            )
+        snapshot = json.loads(
+            serializer.read(app_identifier),
+            cls=JsonDecoder,
         )
+        self._filter_index.clear()
+        if InMemoryVDBSnapshot.is_binary_snapshot(snapshot):
+            self._vector_stores = InMemoryVDBSnapshot.read(snapshot, serializer, app_identifier, self._vdb)
+            return
+        self._vdb.update(snapshot)
+        self._rebuild_vector_stores()
+
+    def _rebuild_vector_stores(self) -> None:
+        self._vector_stores = defaultdict[str, InMemoryVectorStore](InMemoryVectorStore)
+        for row_id, raw_entity in self._vdb.items():
+            for name, value in raw_entity.items():
+                if isinstance(value, Vector):
+                    self._vector_stores[name].set(row_id, value)
 
     def _get_result_entity_data(self, row_id: str, score: float, fields_to_return: Sequence[Field]) -> ResultEntityData:
         return ResultEntityData(
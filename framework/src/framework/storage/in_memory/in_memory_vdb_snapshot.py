@@ -0,0 +1,158 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from collections import defaultdict
+
+import numpy as np
+from beartype.typing import Any, Mapping
+
+from superlinked.framework.common.data_types import Vector, VectorItemT
+from superlinked.framework.storage.in_memory.in_memory_vector_store import (
+    InMemoryVectorStore,
+)
+from superlinked.framework.storage.in_memory.json_codec import JsonEncoder
+from superlinked.framework.storage.in_memory.object_serializer import ObjectSerializer
+
+FORMAT_KEY = "__format__"
+BINARY_FORMAT = "binary_v1"
+
+
+class InMemoryVDBSnapshot:
+    """
+    Binary snapshot of the in-memory VDB.
+    Vectors are written per vector field as raw float32 matrices while every other value
+    is stored column-wise in a JSON manifest. The manifest is written with the regular
+    string payload, so snapshots in the legacy row-wise JSON format can still be restored.
+    """
+
+    @staticmethod
+    def is_binary_snapshot(snapshot: Mapping[str, Any]) -> bool:
+        return snapshot.get(FORMAT_KEY) == BINARY_FORMAT
+
+    @staticmethod
+    def write(
+        vdb: Mapping[str, dict[str, Any]],
+        vector_stores: Mapping[str, InMemoryVectorStore],
+        serializer: ObjectSerializer,
+        key: str,
+    ) -> None:
+        row_ids = list(vdb.keys())
+        position_by_row_id = {row_id: position for position, row_id in enumerate(row_ids)}
+        columns: dict[str, list[Any]] = {}
+        for position, raw_entity in enumerate(vdb.values()):
+            for name, value in raw_entity.items():
+                vector_store = vector_stores.get(name)
+                if vector_store is not None and row_ids[position] in vector_store:
+                    continue
+                columns.setdefault(name, [None] * len(row_ids))[position] = value
+        vectors = {
+            name: InMemoryVDBSnapshot._write_vector_store(
+                vdb, name, vector_store, position_by_row_id, serializer, InMemoryVDBSnapshot._get_vector_key(key, name)
+            )
+            for name, vector_store in vector_stores.items()
+        }
+        manifest = {FORMAT_KEY: BINARY_FORMAT, "row_ids": row_ids, "columns": columns, "vectors": vectors}
+        serializer.write(json.dumps(manifest, cls=JsonEncoder), key)
+
+    @staticmethod
+    def read(
+        snapshot: Mapping[str, Any], serializer: ObjectSerializer, key: str, vdb: defaultdict[str, dict[str, Any]]
+    ) -> defaultdict[str, InMemoryVectorStore]:
+        """
+        Merges the snapshot rows into `vdb` the same way `dict.update` does,
+        and returns the vector stores of the merged rows.
+        """
+        row_ids: list[str] = snapshot["row_ids"]
+        snapshot_vdb: dict[str, dict[str, Any]] = {row_id: {} for row_id in row_ids}
+        for name, values in snapshot["columns"].items():
+            for row_id, value in zip(row_ids, values):
+                if value is not None:
+                    snapshot_vdb[row_id][name] = value
+        vdb.update(snapshot_vdb)
+        vector_stores = defaultdict[str, InMemoryVectorStore](InMemoryVectorStore)
+        for name, vector_metadata in snapshot["vectors"].items():
+            vector_stores[name] = InMemoryVDBSnapshot._read_vector_store(
+                vdb, name, vector_metadata, row_ids, serializer, InMemoryVDBSnapshot._get_vector_key(key, name)
+            )
+        for row_id, raw_entity in vdb.items():
+            for name, value in raw_entity.items():
+                if name not in snapshot["vectors"] and isinstance(value, Vector):
+                    vector_stores[name].set(row_id, value)
+        return vector_stores
+
+    @staticmethod
+    def _write_vector_store(
+        vdb: Mapping[str, dict[str, Any]],
+        name: str,
+        vector_store: InMemoryVectorStore,
+        position_by_row_id: Mapping[str, int],
+        serializer: ObjectSerializer,
+        vector_key: str,
+    ) -> dict[str, Any]:
+        negative_filter_indices: dict[int, list[int]] = {}
+        denormalizers: dict[int, float] = {}
+        for row_index, row_id in enumerate(vector_store.row_ids):
+            vector: Vector = vdb[row_id][name]
+            if vector.negative_filter_indices:
+                negative_filter_indices[row_index] = sorted(vector.negative_filter_indices)
+            if vector._denormalizer != 1.0:
+                denormalizers[row_index] = vector._denormalizer
+        if vector_store.matrix.size:
+            serializer.write_binary(memoryview(np.ascontiguousarray(vector_store.matrix)).cast("B"), vector_key)
+        return {
+            "rows": [position_by_row_id[row_id] for row_id in vector_store.row_ids],
+            "dimension": vector_store.dimension,
+            "negative_filter_indices": negative_filter_indices,
+            "denormalizers": denormalizers,
+        }
+
+    @staticmethod
+    def _read_vector_store(
+        vdb: defaultdict[str, dict[str, Any]],
+        name: str,
+        vector_metadata: Mapping[str, Any],
+        row_ids: list[str],
+        serializer: ObjectSerializer,
+        vector_key: str,
+    ) -> InMemoryVectorStore:
+        vector_row_ids = [row_ids[position] for position in vector_metadata["rows"]]
+        matrix = InMemoryVDBSnapshot._read_matrix(
+            serializer, vector_key, len(vector_row_ids), vector_metadata["dimension"] or 0
+        )
+        negative_filter_indices: dict[str, list[int]] = vector_metadata["negative_filter_indices"]
+        denormalizers: dict[str, float] = vector_metadata["denormalizers"]
+        for row_index, row_id in enumerate(vector_row_ids):
+            vdb[row_id][name] = Vector(
+                matrix[row_index],
+                frozenset(negative_filter_indices.get(str(row_index), [])),
+                denormalizers.get(str(row_index), 1.0),
+            )
+        vector_store = InMemoryVectorStore.from_matrix(vector_row_ids, matrix)
+        for row_id, raw_entity in vdb.items():
+            if (value := raw_entity.get(name)) is not None and row_id not in vector_store:
+                vector_store.set(row_id, value)
+        return vector_store
+
+    @staticmethod
+    def _read_matrix(serializer: ObjectSerializer, vector_key: str, row_count: int, dimension: int) -> np.ndarray:
+        if not row_count * dimension:
+            return np.empty((row_count, dimension), dtype=VectorItemT)
+        if (path := serializer.get_binary_path(vector_key)) is not None:
+            return np.memmap(path, dtype=VectorItemT, mode="r", shape=(row_count, dimension))
+        return np.frombuffer(serializer.read_binary(vector_key), dtype=VectorItemT).reshape(row_count, dimension)
+
+    @staticmethod
+    def _get_vector_key(key: str, name: str) -> str:
+        return f"{key}.{name}.vectors"
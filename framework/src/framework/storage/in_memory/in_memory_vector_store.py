@@ -0,0 +1,139 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import numpy as np
+from beartype.typing import Any, Iterable, Sequence
+
+from superlinked.framework.common.data_types import NPArray, Vector, VectorItemT
+from superlinked.framework.common.exception import InvalidStateException
+
+INITIAL_CAPACITY = 1024
+
+
+class InMemoryVectorStore:
+    """
+    Keeps the vectors of a single vector field in a contiguous float32 matrix
+    so a query can be scored against all of them with one matrix-vector product.
+    Values that cannot be placed in the matrix (non-vectors or vectors with a
+    dimension that differs from the stored ones) are tracked separately.
+    """
+
+    def __init__(self) -> None:
+        self.__matrix: np.ndarray | None = None
+        self.__row_ids: list[str] = []
+        self.__row_index_by_row_id: dict[str, int] = {}
+        self.__invalid_values: dict[str, Any] = {}
+        self.__owns_matrix = True
+
+    @classmethod
+    def from_matrix(cls, row_ids: Sequence[str], matrix: np.ndarray) -> InMemoryVectorStore:
+        """
+        Creates a store on top of an existing (e.g. memory-mapped) matrix without copying it.
+        The matrix is only copied when the store is first modified.
+        """
+        store = cls()
+        if row_ids:
+            store.__matrix = matrix
+            store.__row_ids = list(row_ids)
+            store.__row_index_by_row_id = {row_id: row_index for row_index, row_id in enumerate(row_ids)}
+            store.__owns_matrix = False
+        return store
+
+    @property
+    def dimension(self) -> int | None:
+        return None if self.__matrix is None else self.__matrix.shape[1]
+
+    @property
+    def matrix(self) -> np.ndarray:
+        if self.__matrix is None:
+            return np.empty((0, 0), dtype=VectorItemT)
+        return self.__matrix[: len(self.__row_ids)]
+
+    @property
+    def row_ids(self) -> Sequence[str]:
+        return self.__row_ids
+
+    @property
+    def invalid_values(self) -> dict[str, Any]:
+        return self.__invalid_values
+
+    def __len__(self) -> int:
+        return len(self.__row_ids)
+
+    def __contains__(self, row_id: str) -> bool:
+        return row_id in self.__row_index_by_row_id
+
+    def set(self, row_id: str, value: Any) -> None:
+        self.remove(row_id)
+        if isinstance(value, Vector) and self.__fits(value):
+            self.__append(row_id, value.value)
+        elif value is not None:
+            self.__invalid_values[row_id] = value
+
+    def remove(self, row_id: str) -> None:
+        self.__invalid_values.pop(row_id, None)
+        row_index = self.__row_index_by_row_id.pop(row_id, None)
+        if row_index is None:
+            return
+        last_index = len(self.__row_ids) - 1
+        if last_index == 0:
+            self.__row_ids.pop()
+            self.__matrix = None
+            self.__owns_matrix = True
+            return
+        if row_index != last_index:
+            matrix = self.__get_writable_matrix()
+            matrix[row_index] = matrix[last_index]
+            self.__row_ids[row_index] = self.__row_ids[last_index]
+            self.__row_index_by_row_id[self.__row_ids[row_index]] = row_index
+        self.__row_ids.pop()
+
+    def get_row_indices(self, row_ids: Iterable[str]) -> NPArray:
+        return np.fromiter(
+            (row_index for row_id in row_ids if (row_index := self.__row_index_by_row_id.get(row_id)) is not None),
+            dtype=np.intp,
+        )
+
+    def __fits(self, vector: Vector) -> bool:
+        return self.__matrix is None or vector.dimension == self.__matrix.shape[1]
+
+    def __append(self, row_id: str, value: NPArray) -> None:
+        row_index = len(self.__row_ids)
+        self.__ensure_capacity(row_index + 1, len(value))
+        self.__get_writable_matrix()[row_index] = value
+        self.__row_ids.append(row_id)
+        self.__row_index_by_row_id[row_id] = row_index
+
+    def __ensure_capacity(self, size: int, dimension: int) -> None:
+        if self.__matrix is None:
+            self.__matrix = np.empty((max(INITIAL_CAPACITY, size), dimension), dtype=VectorItemT)
+            self.__owns_matrix = True
+            return
+        capacity = self.__matrix.shape[0]
+        if size <= capacity:
+            return
+        new_matrix = np.empty((max(capacity * 2, size), self.__matrix.shape[1]), dtype=VectorItemT)
+        new_matrix[: len(self.__row_ids)] = self.__matrix[: len(self.__row_ids)]
+        self.__matrix = new_matrix
+        self.__owns_matrix = True
+
+    def __get_writable_matrix(self) -> np.ndarray:
+        if self.__matrix is None:
+            raise InvalidStateException("Vector store matrix is not initialized.")
+        if not self.__owns_matrix:
+            self.__matrix = np.array(self.__matrix[: len(self.__row_ids)], dtype=VectorItemT)
+            self.__owns_matrix = True
+        return self.__matrix
@@ -14,6 +14,8 @@
 
 from abc import ABC, abstractmethod
 
+from superlinked.framework.common.exception import NotImplementedException
+
 
 class ObjectSerializer(ABC):
     """
@@ -33,3 +35,30 @@ class ObjectSerializer(ABC):
         Write the serialized object under the specified key.
         The serialized_object parameter should be a string representation of a serialized dictionary.
         """
+
+    @property
+    def supports_binary(self) -> bool:
+        """
+        Whether the serializer can store raw binary payloads next to the string ones.
+        Serializers supporting it should override read_binary and write_binary.
+        """
+        return False
+
+    def read_binary(self, key: str) -> bytes:
+        """
+        Read the binary payload associated with the given key.
+        """
+        raise NotImplementedException(f"{type(self).__name__} does not support binary payloads.")
+
+    def write_binary(self, serialized_object: bytes | memoryview, key: str) -> None:
+        """
+        Write the binary payload under the specified key.
+        """
+        raise NotImplementedException(f"{type(self).__name__} does not support binary payloads.")
+
+    def get_binary_path(self, key: str) -> str | None:
+        """
+        Return the local file path of the binary payload associated with the given key, if there is one.
+        Payloads with a local path can be memory-mapped instead of read into memory.
+        """
+        return None
@@ -16,6 +16,7 @@ from beartype.typing import Any, Sequence
 from pymongo import MongoClient, UpdateOne
 from typing_extensions import override
 
+from superlinked.framework.common.settings import ResourceSettings
 from superlinked.framework.common.storage.entity.entity import Entity
 from superlinked.framework.common.storage.entity.entity_data import EntityData
 from superlinked.framework.common.storage.entity.entity_id import EntityId
@@ -33,6 +34,9 @@ from superlinked.framework.common.storage.search_index.manager.search_index_mana
 )
 from superlinked.framework.common.storage.vdb_connector import VDBConnector
 from superlinked.framework.dsl.query.query_user_config import QueryUserConfig
+from superlinked.framework.storage.common.blocking_io_executor import (
+    BlockingIOExecutor,
+)
 from superlinked.framework.storage.common.vdb_settings import VDBSettings
 from superlinked.framework.storage.mongo_db.mongo_db_connection_params import (
     MongoDBConnectionParams,
@@ -59,13 +63,20 @@ class MongoDBVDBConnector(VDBConnector[VDBKNNSearchConfig]):
         self._db = self._client[connection_params.db_name]
         self._encoder = MongoDBFieldEncoder(self.vector_precision)
         self._search_index_manager = MongoDBSearchIndexManager(self._db.name, connection_params.admin_params)
-        self._search = MongoDBSearch(self._db, self._encoder)
+        vector_database_settings = ResourceSettings().vector_database
+        self._executor = BlockingIOExecutor(
+            vector_database_settings.VDB_CLIENT_MAX_WORKERS,
+            vector_database_settings.VDB_CLIENT_CHUNK_SIZE,
+            thread_name_prefix="mongo_db",
+        )
+        self._search = MongoDBSearch(self._db, self._encoder, self._executor)
 
     @override
     async def close_connection(self) -> None:
         # Due to pymongo overwriting __getattr__ and __getitem__
         # type-checkers mistake 'close' for a database.
         self._client.close()  # type: ignore
+        self._executor.shutdown()
 
     @property
     @override
@@ -76,13 +87,16 @@ class MongoDBVDBConnector(VDBConnector[VDBKNNSearchConfig]):
     async def _write_entities(self, entity_data: Sequence[EntityData]) -> None:
         if not entity_data:
             return
-        docs = [
-            {
-                "_id": MongoDBVDBConnector._get_mongo_id(ed.id_),
-                **{field_data.name: self._encoder.encode_field(field_data) for field_data in ed.field_data.values()},
-            }
-            for ed in entity_data
-        ]
+        # documents of the same entity are merged, so the chunks written concurrently never overlap
+        docs_by_id: dict[str, dict[str, Any]] = {}
+        for ed in entity_data:
+            mongo_id = MongoDBVDBConnector._get_mongo_id(ed.id_)
+            docs_by_id.setdefault(mongo_id, {"_id": mongo_id}).update(
+                {field_data.name: self._encoder.encode_field(field_data) for field_data in ed.field_data.values()}
+            )
+        await self._executor.run_chunked(self._bulk_upsert, list(docs_by_id.values()))
+
+    def _bulk_upsert(self, docs: Sequence[dict[str, Any]]) -> None:
         self._db[self.collection_name].bulk_write(
             [UpdateOne({"_id": doc["_id"]}, {"$set": doc}, upsert=True) for doc in docs]
         )
@@ -91,9 +105,13 @@ class MongoDBVDBConnector(VDBConnector[VDBKNNSearchConfig]):
         if not entities:
             return []
 
-        mongo_ids = [MongoDBVDBConnector._get_mongo_id(entity.id_) for entity in entities]
+        mongo_ids = list(dict.fromkeys(MongoDBVDBConnector._get_mongo_id(entity.id_) for entity in entities))
 
-        docs = {doc["_id"]: doc for doc in self._db[self.collection_name].find({"_id": {"$in": mongo_ids}})}
+        docs = {
+            doc["_id"]: doc
+            for chunk_docs in await self._executor.run_chunked(self._find_by_ids, mongo_ids)
+            for doc in chunk_docs
+        }
 
         return [
             EntityData(
@@ -108,6 +126,9 @@ class MongoDBVDBConnector(VDBConnector[VDBKNNSearchConfig]):
             for doc in [docs.get(MongoDBVDBConnector._get_mongo_id(entity.id_), {})]
         ]
 
+    def _find_by_ids(self, mongo_ids: Sequence[str]) -> list[dict[str, Any]]:
+        return list(self._db[self.collection_name].find({"_id": {"$in": list(mongo_ids)}}))
+
     @override
     async def _knn_search(
         self,
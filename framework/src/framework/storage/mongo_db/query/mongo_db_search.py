@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from pymongo.command_cursor import CommandCursor
+from beartype.typing import Any
 from pymongo.database import Database
 from typing_extensions import override
 
@@ -22,6 +22,9 @@ from superlinked.framework.common.storage.query.vdb_knn_search_config import (
     VDBKNNSearchConfig,
 )
 from superlinked.framework.common.storage.search import Search
+from superlinked.framework.storage.common.blocking_io_executor import (
+    BlockingIOExecutor,
+)
 from superlinked.framework.storage.mongo_db.mongo_db_field_encoder import (
     MongoDBFieldEncoder,
 )
@@ -33,11 +36,12 @@ from superlinked.framework.storage.mongo_db.query.mongo_db_vdb_knn_search_params
 MAX_NUMBER_OF_CANDIDATES = 10000
 
 
-class MongoDBSearch(Search[MongoDBVDBKNNSearchParams, MongoDBQuery, CommandCursor, VDBKNNSearchConfig]):
-    def __init__(self, db: Database, encoder: MongoDBFieldEncoder) -> None:
+class MongoDBSearch(Search[MongoDBVDBKNNSearchParams, MongoDBQuery, list[dict[str, Any]], VDBKNNSearchConfig]):
+    def __init__(self, db: Database, encoder: MongoDBFieldEncoder, executor: BlockingIOExecutor) -> None:
         super().__init__()
         self._db = db
         self._encoder = encoder
+        self._executor = executor
 
     @override
     def build_query(self, search_params: MongoDBVDBKNNSearchParams, search_config: VDBKNNSearchConfig) -> MongoDBQuery:
@@ -56,5 +60,8 @@ class MongoDBSearch(Search[MongoDBVDBKNNSearchParams, MongoDBQuery, CommandCurso
         self,
         index_config: IndexConfig,
         query: MongoDBQuery,
-    ) -> CommandCursor:
-        return self._db[query.collection_name].aggregate(query.query)
+    ) -> list[dict[str, Any]]:
+        return await self._executor.run(self._aggregate, query)
+
+    def _aggregate(self, query: MongoDBQuery) -> list[dict[str, Any]]:
+        return list(self._db[query.collection_name].aggregate(query.query))
@@ -11,14 +11,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 import re
+from collections import defaultdict
 from collections.abc import Mapping
 
 from beartype.typing import Any, Sequence, cast
+from cachetools import LRUCache
 from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.conversions.common_types import Payload, Record
 from qdrant_client.http.models.models import QueryResponse, ScoredPoint
 from qdrant_client.models import (
+    ExtendedPointId,
     PointsList,
     PointStruct,
     PointVectors,
@@ -36,6 +40,7 @@ from superlinked.framework.common.exception import (
     InvalidStateException,
     UnexpectedResponseException,
 )
+from superlinked.framework.common.settings import ResourceSettings
 from superlinked.framework.common.storage.entity.entity import Entity
 from superlinked.framework.common.storage.entity.entity_data import EntityData
 from superlinked.framework.common.storage.entity.entity_id import EntityId
@@ -98,11 +103,16 @@ class QdrantVDBConnector(VDBConnector[VDBKNNSearchConfig]):
         self.__search_index_manager = QdrantSearchIndexManager(self._sync_client)
         self._search = QdrantSearch(self._client, self._encoder)
         self._vector_field_names = list[str]()
+        # ids of the points known to exist, kept up to date by the writes of this connector
+        self._existing_point_ids: LRUCache[ExtendedPointId, bool] = LRUCache(
+            max(ResourceSettings().vector_database.QDRANT_EXISTING_POINT_ID_CACHE_SIZE, 1)
+        )
 
     @override
     async def close_connection(self) -> None:
         await self._client.close()
         self._sync_client.close()
+        self._existing_point_ids.clear()
 
     @property
     @override
@@ -117,6 +127,8 @@ class QdrantVDBConnector(VDBConnector[VDBKNNSearchConfig]):
         override_existing: bool = False,
     ) -> None:
         super().init_search_index_configs(index_configs, create_search_indices, override_existing)
+        # the collection might have been recreated, so previously seen points might not exist anymore
+        self._existing_point_ids.clear()
         self._vector_field_names.extend(
             [index_config.vector_field_descriptor.field_name for index_config in index_configs]
         )
@@ -144,14 +156,37 @@ class QdrantVDBConnector(VDBConnector[VDBKNNSearchConfig]):
         ]
         if update_vectors_points:
             update_operations.append(UpdateVectorsOperation(update_vectors=UpdateVectors(points=update_vectors_points)))
-        set_payload_operations = [
-            SetPayloadOperation(set_payload=SetPayload(payload=point.payload, points=[point.id]))
-            for point in existing_points
-            if point.payload
+        update_operations.extend(self._create_set_payload_operations(existing_points))
+        if update_operations:
+            await self._client.batch_update_points(self.collection_name, update_operations=update_operations)
+        for point in points:
+            self._existing_point_ids[point.id] = True
+
+    def _create_set_payload_operations(self, existing_points: Sequence[PointStruct]) -> list[SetPayloadOperation]:
+        """
+        The id payload of an existing point never changes, so it is left out of the update.
+        Points receiving the same payload are updated by a single operation.
+        """
+        point_ids_by_payload_key: dict[str, list[ExtendedPointId]] = defaultdict(list)
+        payload_by_payload_key: dict[str, Payload] = {}
+        for point in existing_points:
+            payload = {name: value for name, value in (point.payload or {}).items() if name != ID_PAYLOAD_FIELD_NAME}
+            if not payload:
+                continue
+            payload_key = self._calculate_payload_key(point.id, payload)
+            point_ids_by_payload_key[payload_key].append(point.id)
+            payload_by_payload_key[payload_key] = payload
+        return [
+            SetPayloadOperation(set_payload=SetPayload(payload=payload_by_payload_key[payload_key], points=point_ids))
+            for payload_key, point_ids in point_ids_by_payload_key.items()
         ]
-        if set_payload_operations:
-            update_operations.extend(set_payload_operations)
-        await self._client.batch_update_points(self.collection_name, update_operations=update_operations)
+
+    @staticmethod
+    def _calculate_payload_key(point_id: ExtendedPointId, payload: Payload) -> str:
+        try:
+            return json.dumps(payload, sort_keys=True)
+        except (TypeError, ValueError):
+            return f"{ID_PAYLOAD_FIELD_NAME}:{point_id}"
 
     def _get_point_vector_dict(self, entity_data: EntityData) -> dict[str, QdrantEncodedTypes]:
         return {
@@ -176,10 +211,12 @@ class QdrantVDBConnector(VDBConnector[VDBKNNSearchConfig]):
     async def _split_points_by_existing(
         self, points: Sequence[PointStruct]
     ) -> tuple[Sequence[PointStruct], Sequence[PointStruct]]:
-        existing_point_records = await self._client.retrieve(
-            self.collection_name, [point.id for point in points], with_payload=False
-        )
-        existing_point_ids = [point.id for point in existing_point_records]
+        existing_point_ids = {point.id for point in points if point.id in self._existing_point_ids}
+        if unknown_point_ids := list({point.id for point in points if point.id not in existing_point_ids}):
+            existing_point_records = await self._client.retrieve(
+                self.collection_name, unknown_point_ids, with_payload=False
+            )
+            existing_point_ids.update(point.id for point in existing_point_records)
         non_existing_points = [point for point in points if point.id not in existing_point_ids]
         existing_points = [point for point in points if point.id in existing_point_ids]
         return non_existing_points, existing_points
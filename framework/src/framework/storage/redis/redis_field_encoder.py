@@ -121,7 +121,7 @@ class RedisFieldEncoder:
     def _decode_vector(self, vector: bytes) -> Vector:
         if not isinstance(vector, bytes):
             raise InvalidStateException("Cannot decode non-bytes type vector.", vector_type=type(vector))
-        return Vector(np.frombuffer(vector, self.__vector_precision_type).tolist())
+        return Vector(np.frombuffer(vector, self.__vector_precision_type))
 
     def encode_field(self, field: FieldData) -> RedisEncodedTypes:
         if encoder := self._encode_map.get(field.data_type):
@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+
 import structlog
 from beartype.typing import Any, Sequence
 from typing_extensions import override
 
+from superlinked.framework.common.settings import ResourceSettings
 from superlinked.framework.common.storage.entity.entity import Entity
 from superlinked.framework.common.storage.entity.entity_data import EntityData
 from superlinked.framework.common.storage.query.vdb_knn_search_params import (
@@ -34,7 +37,10 @@ from superlinked.framework.storage.redis.query.vdb_knn_search_params import (
 from superlinked.framework.storage.redis.redis_connection_params import (
     RedisConnectionParams,
 )
-from superlinked.framework.storage.redis.redis_field_encoder import RedisFieldEncoder
+from superlinked.framework.storage.redis.redis_field_encoder import (
+    RedisEncodedTypes,
+    RedisFieldEncoder,
+)
 from superlinked.framework.storage.redis.redis_search import RedisSearch
 from superlinked.framework.storage.redis.redis_search_index_manager import (
     RedisSearchIndexManager,
@@ -55,6 +61,9 @@ class RedisVDBConnector(VDBConnector[RedisVDBKNNSearchConfig]):
         self._encoder = RedisFieldEncoder(self.vector_precision)
         self.__search_index_manager = RedisSearchIndexManager(self._client, self._encoder)
         self._search = RedisSearch(self._client, self._encoder, self.vector_precision)
+        vector_database_settings = ResourceSettings().vector_database
+        self._write_pipeline_chunk_size = vector_database_settings.REDIS_WRITE_PIPELINE_CHUNK_SIZE
+        self._max_concurrent_write_pipelines = vector_database_settings.REDIS_MAX_CONCURRENT_WRITE_PIPELINES
 
     @override
     async def close_connection(self) -> None:
@@ -67,17 +76,35 @@ class RedisVDBConnector(VDBConnector[RedisVDBKNNSearchConfig]):
 
     @override
     async def _write_entities(self, entity_data: Sequence[EntityData]) -> None:
-        if entity_data:
-            _pipeline = self._client.client.pipeline(transaction=False)
-            for ed in entity_data:
-                if ed.field_data:
-                    _pipeline.hset(
-                        self._encoder.encode_entity_id_to_redis_id(ed.id_),
-                        mapping={
-                            field_name: self._encoder.encode_field(field) for field_name, field in ed.field_data.items()
-                        },
-                    )
-            await _pipeline.execute()
+        # mappings of the same entity are merged, so the chunks written concurrently never overlap
+        mapping_by_redis_id: dict[str, dict[str, RedisEncodedTypes]] = {}
+        for ed in entity_data:
+            if not ed.field_data:
+                continue
+            redis_id = self._encoder.encode_entity_id_to_redis_id(ed.id_)
+            mapping_by_redis_id.setdefault(redis_id, {}).update(
+                {field_name: self._encoder.encode_field(field) for field_name, field in ed.field_data.items()}
+            )
+        mappings = list(mapping_by_redis_id.items())
+        if not mappings:
+            return
+        chunk_size = max(self._write_pipeline_chunk_size, 1)
+        semaphore = asyncio.Semaphore(max(self._max_concurrent_write_pipelines, 1))
+        await asyncio.gather(
+            *[
+                self._execute_write_pipeline(mappings[start : start + chunk_size], semaphore)
+                for start in range(0, len(mappings), chunk_size)
+            ]
+        )
+
+    async def _execute_write_pipeline(
+        self, mappings: Sequence[tuple[str, dict[str, RedisEncodedTypes]]], semaphore: asyncio.Semaphore
+    ) -> None:
+        async with semaphore:
+            pipeline = self._client.client.pipeline(transaction=False)
+            for redis_id, mapping in mappings:
+                pipeline.hset(redis_id, mapping=mapping)
+            await pipeline.execute()
 
     @override
     async def _read_entities(self, entities: Sequence[Entity]) -> list[EntityData]:
@@ -22,6 +22,9 @@ from superlinked.framework.common.storage.query.vdb_knn_search_params import (
     VDBKNNSearchParams,
 )
 from superlinked.framework.common.storage.search import Search
+from superlinked.framework.storage.common.blocking_io_executor import (
+    BlockingIOExecutor,
+)
 from superlinked.framework.storage.topk.query.topk_query_builder import (
     TopKQueryBuilder,
     VectorQuery,
@@ -39,9 +42,12 @@ logger = structlog.get_logger()
 
 
 class TopKSearch(Search[VDBKNNSearchParams, VectorQuery, list[dict[str, Any]], TopKVDBKNNSearchConfig]):
-    def __init__(self, client: TopKVDBClient, encoder: TopKFieldEncoder, collection_name: str) -> None:
+    def __init__(
+        self, client: TopKVDBClient, encoder: TopKFieldEncoder, collection_name: str, executor: BlockingIOExecutor
+    ) -> None:
         super().__init__()
         self._client = client
+        self._executor = executor
         self._query_builder = TopKQueryBuilder(encoder)
         self._collection_name = collection_name
 
@@ -55,7 +61,7 @@ class TopKSearch(Search[VDBKNNSearchParams, VectorQuery, list[dict[str, Any]], T
         index_config: IndexConfig,
         query: VectorQuery,
     ) -> list[dict[str, Any]]:
-        docs = self._client.query(self._collection_name, query.topk_query)
+        docs = await self._executor.run(self._client.query, self._collection_name, query.topk_query)
 
         return [
             {TopKFieldDescriptorCompiler._decode_field_name(k): v for k, v in document.items()} for document in docs
@@ -13,12 +13,15 @@
 # limitations under the License.
 
 
+import asyncio
 from collections import defaultdict
+from functools import partial
 
 import structlog
 from beartype.typing import Any, Sequence
 from typing_extensions import override
 
+from superlinked.framework.common.settings import ResourceSettings
 from superlinked.framework.common.storage.entity.entity import Entity
 from superlinked.framework.common.storage.entity.entity_data import EntityData
 from superlinked.framework.common.storage.entity.entity_id import EntityId
@@ -31,6 +34,9 @@ from superlinked.framework.common.storage.search_index.manager.search_index_mana
 )
 from superlinked.framework.common.storage.vdb_connector import VDBConnector
 from superlinked.framework.dsl.query.query_user_config import QueryUserConfig
+from superlinked.framework.storage.common.blocking_io_executor import (
+    BlockingIOExecutor,
+)
 from superlinked.framework.storage.common.vdb_settings import VDBSettings
 from superlinked.framework.storage.topk.query.topk_query_builder import (
     TOPK_VECTOR_DISTANCE_FIELD_NAME,
@@ -61,12 +67,18 @@ class TopKVDBConnector(VDBConnector):
         self._client = TopKVDBClient(connection_params)
         self._encoder = TopKFieldEncoder()
         self.__search_index_manager = TopKSearchIndexManager(self._client)
-        self._search = TopKSearch(self._client, self._encoder, self.collection_name)
+        vector_database_settings = ResourceSettings().vector_database
+        self._executor = BlockingIOExecutor(
+            vector_database_settings.VDB_CLIENT_MAX_WORKERS,
+            vector_database_settings.VDB_CLIENT_CHUNK_SIZE,
+            thread_name_prefix="topk",
+        )
+        self._search = TopKSearch(self._client, self._encoder, self.collection_name, self._executor)
         self.__vdb_settings = vdb_settings
 
     @override
     async def close_connection(self) -> None:
-        pass  # TopKVDBClient does not require explicit close
+        self._executor.shutdown()  # TopKVDBClient does not require explicit close
 
     @property
     @override
@@ -91,7 +103,10 @@ class TopKVDBConnector(VDBConnector):
             for ed in entity_data
         }
 
-        self._client.upsert_partial(self.collection_name, docs)
+        await self._executor.run_chunked(self._upsert_partial, list(docs.items()))
+
+    def _upsert_partial(self, docs: Sequence[tuple[str, dict[str, Any]]]) -> None:
+        self._client.upsert_partial(self.collection_name, dict(docs))
 
     @override
     async def _read_entities(self, entities: Sequence[Entity]) -> list[EntityData]:
@@ -99,19 +114,24 @@ class TopKVDBConnector(VDBConnector):
             return []
 
         entity_groups = self._group_entities_by_field_keys(entities)
+        entity_data_by_group = await asyncio.gather(
+            *[
+                self._get_entity_group(field_keys, grouped_entities)
+                for field_keys, grouped_entities in entity_groups.items()
+            ]
+        )
 
-        return [
-            entity_data
-            for field_keys, grouped_entities in entity_groups.items()
-            for entity_data in self._get_entity_group(field_keys, grouped_entities)
-        ]
+        return [entity_data for entity_data_list in entity_data_by_group for entity_data in entity_data_list]
 
-    def _get_entity_group(self, field_keys: tuple[str, ...], entities: list[Entity]) -> list[EntityData]:
+    async def _get_entity_group(self, field_keys: tuple[str, ...], entities: list[Entity]) -> list[EntityData]:
         if not entities:
             return []
 
         ids = [TopKVDBConnector._get_topk_id(entity.id_) for entity in entities]
-        documents = self._client.get(self.collection_name, ids, list(field_keys))
+        documents_by_chunk = await self._executor.run_chunked(
+            partial(self._client.get, self.collection_name, fields=list(field_keys)), ids
+        )
+        documents = {doc_id: document for chunk in documents_by_chunk for doc_id, document in chunk.items()}
 
         if not documents:
             logger.debug("No documents found for entity group", field_keys=field_keys, ids=ids)
@@ -0,0 +1,125 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import base64
+import io
+import os
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from beartype.typing import Sequence
+from PIL import Image
+
+from superlinked.framework.common.parser import blob_loader as blob_loader_module
+from superlinked.framework.common.parser.blob_loader import BlobLoader
+from superlinked.framework.common.schema.blob_information import BlobInformation
+from superlinked.framework.common.settings import settings
+from superlinked.framework.common.util.image_util import ImageUtil, PILImage
+
+
+def _create_png(color: tuple[int, int, int], size: tuple[int, int] = (64, 48)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class ImageRequestHandler(BaseHTTPRequestHandler):
+    requested_paths: list[str] = []
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        ImageRequestHandler.requested_paths.append(self.path)
+        body = _create_png((len(self.path), 0, 0))
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # pylint: disable=redefined-builtin
+        pass
+
+
+@pytest.fixture(name="image_server_url")
+def fixture_image_server_url() -> Iterator[str]:
+    ImageRequestHandler.requested_paths = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ImageRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(name="resize_count")
+def fixture_resize_count(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> list[int]:
+    monkeypatch.setattr(
+        blob_loader_module,
+        "settings",
+        settings.model_copy(update={"BLOB_DISK_CACHE_PATH": str(tmp_path / "cache" / "blob.db")}),
+    )
+    resize_count = [0]
+    resize = ImageUtil.resize
+
+    def count_resize(image: PILImage) -> bytes:
+        resize_count[0] += 1
+        return resize(image)
+
+    monkeypatch.setattr(ImageUtil, "resize", staticmethod(count_resize))
+    return resize_count
+
+
+def _load(inputs: Sequence[str]) -> list[BlobInformation | None]:
+    return asyncio.run(BlobLoader().load(inputs))
+
+
+def test_cached_blobs_are_not_fetched_and_resized_again(image_server_url: str, resize_count: list[int]) -> None:
+    inputs = [f"{image_server_url}/a.png", f"{image_server_url}/b.png", f"{image_server_url}/a.png"]
+
+    loaded_blobs = _load(inputs)
+    n_resizes = resize_count[0]
+    cached_blobs = _load(inputs)
+
+    assert cached_blobs == loaded_blobs
+    assert sorted(ImageRequestHandler.requested_paths) == ["/a.png", "/b.png"]
+    assert resize_count[0] == n_resizes
+
+
+def test_modified_local_file_is_loaded_again(tmp_path: Path, resize_count: list[int]) -> None:
+    path = tmp_path / "image.png"
+    path.write_bytes(_create_png((1, 2, 3)))
+    loaded_blob = _load([str(path)])[0]
+    assert _load([str(path)])[0] == loaded_blob
+    assert resize_count[0] == 1
+
+    path.write_bytes(_create_png((4, 5, 6), (32, 24)))
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+
+    modified_blob = _load([str(path)])[0]
+    assert modified_blob is not None and modified_blob != loaded_blob
+    assert modified_blob.path == str(path)
+    assert resize_count[0] == 2
+
+
+def test_base64_inputs_are_cached_by_content(resize_count: list[int]) -> None:
+    encoded_image = base64.b64encode(_create_png((7, 8, 9))).decode()
+
+    loaded_blob = _load([encoded_image])[0]
+    cached_blob = _load([encoded_image])[0]
+
+    assert cached_blob == loaded_blob
+    assert cached_blob is not None and cached_blob.path is None
+    assert resize_count[0] == 1
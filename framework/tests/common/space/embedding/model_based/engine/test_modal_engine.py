@@ -0,0 +1,116 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+from beartype.typing import Sequence
+
+from superlinked.framework.common.exception import UnexpectedResponseException
+from superlinked.framework.common.space.embedding.model_based.embedding_input import (
+    ModelEmbeddingInput,
+)
+from superlinked.framework.common.space.embedding.model_based.engine.modal_engine import (
+    ModalEngine,
+    RemoteEmbedFn,
+)
+from superlinked.framework.common.space.embedding.model_based.engine.modal_engine_config import (
+    ModalEngineConfig,
+)
+
+BAD_INPUT = "bad"
+FAILING_INPUT = "failing"
+
+
+class StubModalEngine(ModalEngine):
+    """Embeds each input as its length. Batches containing `BAD_INPUT` fail, unless it is alone in the batch."""
+
+    def __init__(self, config: ModalEngineConfig) -> None:
+        self.call_batches: list[list[ModelEmbeddingInput]] = []
+        self.n_in_flight = 0
+        self.max_in_flight = 0
+        super().__init__("model", None, config)
+
+    def _create_remote_embed_fn(self) -> RemoteEmbedFn:
+        async def embed(inputs: list[ModelEmbeddingInput], model_name: str) -> list[list[float]]:
+            self.call_batches.append(inputs)
+            self.n_in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.n_in_flight)
+            await asyncio.sleep(0.01)
+            self.n_in_flight -= 1
+            if FAILING_INPUT in inputs or (BAD_INPUT in inputs and len(inputs) > 1):
+                raise RuntimeError("remote call failed")
+            return [[float(len(str(input_)))] for input_ in inputs]
+
+        return embed
+
+
+def _create_engine(batch_size: int = 4, max_concurrent_batches: int = 8, max_retries: int = 10) -> StubModalEngine:
+    return StubModalEngine(
+        ModalEngineConfig(
+            token_id="id",
+            token_secret="secret",
+            batch_size=batch_size,
+            max_concurrent_batches=max_concurrent_batches,
+            max_retries=max_retries,
+            retry_delay=0.001,
+        )
+    )
+
+
+def _expected_embeddings(inputs: Sequence[str]) -> list[list[float]]:
+    return [[float(len(input_))] for input_ in inputs]
+
+
+def test_inputs_are_split_into_batches() -> None:
+    engine = _create_engine(batch_size=4)
+    inputs = [str(i) * i for i in range(1, 11)]
+
+    embeddings = asyncio.run(engine.embed(inputs, False))
+
+    assert embeddings == _expected_embeddings(inputs)
+    assert [len(batch) for batch in engine.call_batches] == [4, 4, 2]
+
+
+def test_in_flight_batches_are_limited_across_embed_calls() -> None:
+    engine = _create_engine(batch_size=2, max_concurrent_batches=3)
+    inputs = [str(i) for i in range(20)]
+
+    async def embed_concurrently() -> list[list[list[float]]]:
+        return await asyncio.gather(*[engine.embed(inputs, False) for _ in range(4)])
+
+    results = asyncio.run(embed_concurrently())
+
+    assert results == [_expected_embeddings(inputs)] * 4
+    assert engine.max_in_flight == 3
+
+
+def test_failed_batch_is_split_until_the_bad_input_is_alone() -> None:
+    engine = _create_engine(batch_size=8)
+    inputs = ["a", "bb", "ccc", "dddd", "e", BAD_INPUT, "gg", "hhh"]
+
+    embeddings = asyncio.run(engine.embed(inputs, False))
+
+    assert embeddings == _expected_embeddings(inputs)
+    assert sorted((len(batch) for batch in engine.call_batches), reverse=True) == [8, 4, 4, 2, 2, 1, 1]
+
+
+def test_failing_input_raises_after_max_retries() -> None:
+    engine = _create_engine(batch_size=4, max_retries=3)
+    inputs = [FAILING_INPUT, "b", "c", "d"]
+
+    with pytest.raises(UnexpectedResponseException):
+        asyncio.run(engine.embed(inputs, False))
+
+    assert [len(batch) for batch in engine.call_batches if FAILING_INPUT in batch] == [4, 2, 1]
@@ -0,0 +1,53 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from beartype.typing import Sequence
+
+from superlinked.framework.common.delayed_evaluator import (
+    ADAPTIVE_DELAY_SMOOTHING,
+    DelayedEvaluator,
+)
+
+DELAY_MS = 40
+MAX_BATCH_SIZE = 4
+
+
+async def _double(inputs: Sequence[int]) -> list[int]:
+    return [input_ * 2 for input_ in inputs]
+
+
+def _evaluate_once(inputs: list[int]) -> tuple[list[int], float]:
+    async def evaluate() -> tuple[list[int], float]:
+        evaluator = DelayedEvaluator(DELAY_MS, _double, max_batch_size=MAX_BATCH_SIZE, adaptive=True)
+        results = await evaluator.evaluate(inputs)
+        return results, evaluator._current_delay_ms
+
+    return asyncio.run(evaluate())
+
+
+def test_adaptive_delay_is_halved_by_a_single_full_request() -> None:
+    results, current_delay_ms = _evaluate_once([1, 2, 3, 4])
+
+    assert results == [2, 4, 6, 8]
+    assert current_delay_ms == DELAY_MS / 2
+
+
+def test_adaptive_delay_moves_towards_latency_for_a_partial_batch() -> None:
+    results, current_delay_ms = _evaluate_once([1, 2])
+
+    assert results == [2, 4]
+    assert DELAY_MS / 2 < current_delay_ms <= DELAY_MS
+    assert current_delay_ms >= (1 - ADAPTIVE_DELAY_SMOOTHING) * DELAY_MS
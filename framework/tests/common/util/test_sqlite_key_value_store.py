@@ -0,0 +1,78 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from pathlib import Path
+
+from superlinked.framework.common.util.sqlite_key_value_store import (
+    SqliteKeyValueStore,
+)
+
+NAMESPACE = "namespace"
+TABLE = "entry"
+
+
+def _put(store: SqliteKeyValueStore, key: str, size: int) -> None:
+    store.put_many(NAMESPACE, {key: bytes(size)})
+    # entries are ordered by their last access time
+    time.sleep(0.01)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    store = SqliteKeyValueStore(str(tmp_path / "store.db"), TABLE, max_size_bytes=300)
+    for key in ["a", "b", "c"]:
+        _put(store, key, 100)
+    store.get_many(NAMESPACE, ["a"])
+
+    _put(store, "d", 100)
+
+    assert sorted(store.get_many(NAMESPACE, ["a", "b", "c", "d"])) == ["a", "c", "d"]
+
+
+def test_replaced_entries_are_not_counted_twice(tmp_path: Path) -> None:
+    store = SqliteKeyValueStore(str(tmp_path / "store.db"), TABLE, max_size_bytes=300)
+    for key in ["a", "a", "a", "b", "c"]:
+        _put(store, key, 100)
+
+    assert sorted(store.get_many(NAMESPACE, ["a", "b", "c"])) == ["a", "b", "c"]
+
+
+def test_stored_size_is_loaded_on_startup(tmp_path: Path) -> None:
+    path = str(tmp_path / "store.db")
+    store = SqliteKeyValueStore(path, TABLE, max_size_bytes=300)
+    for key in ["a", "b", "c"]:
+        _put(store, key, 100)
+
+    reopened_store = SqliteKeyValueStore(path, TABLE, max_size_bytes=300)
+    _put(reopened_store, "d", 100)
+
+    assert sorted(reopened_store.get_many(NAMESPACE, ["a", "b", "c", "d"])) == ["b", "c", "d"]
+
+
+def test_values_over_the_limit_are_not_stored(tmp_path: Path) -> None:
+    store = SqliteKeyValueStore(str(tmp_path / "store.db"), TABLE, max_size_bytes=300)
+    _put(store, "a", 100)
+
+    _put(store, "b", 301)
+
+    assert sorted(store.get_many(NAMESPACE, ["a", "b"])) == ["a"]
+
+
+def test_store_that_cannot_be_opened_is_disabled(tmp_path: Path) -> None:
+    (tmp_path / "file").write_bytes(b"")
+    store = SqliteKeyValueStore(str(tmp_path / "file" / "store.db"), TABLE)
+
+    store.put_many(NAMESPACE, {"a": b"value"})
+
+    assert store.get_many(NAMESPACE, ["a"]) == {}
@@ -0,0 +1,106 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+
+from beartype.typing import Any
+from pydantic import BaseModel
+
+from superlinked.framework.common.nlq.open_ai import OpenAIClientConfig
+from superlinked.framework.common.schema.id_field import IdField
+from superlinked.framework.common.schema.schema import Schema
+from superlinked.framework.common.schema.schema_object import Integer
+from superlinked.framework.dsl.index.index import Index
+from superlinked.framework.dsl.query.nlq.nlq_handler import NLQHandler
+from superlinked.framework.dsl.query.param import Param
+from superlinked.framework.dsl.query.query import Query
+from superlinked.framework.dsl.query.query_descriptor import QueryDescriptor
+from superlinked.framework.dsl.space.number_space import Mode, NumberSpace
+
+CLIENT_CONFIG = OpenAIClientConfig(api_key="api_key", model="model")
+NATURAL_QUERY = "products for 10 dollars"
+
+
+class Product(Schema):
+    id: IdField
+    price: Integer
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.n_calls = 0
+
+    async def query(self, prompt: str, instructor_prompt: str, response_model: type[BaseModel]) -> dict[str, Any]:
+        self.n_calls += 1
+        return {"price": [self.n_calls]}
+
+
+def _create_query_descriptor() -> QueryDescriptor:
+    product = Product()
+    index = Index(NumberSpace(product.price, min_value=0, max_value=100, mode=Mode.MAXIMUM))
+    return (
+        Query(index)
+        .find(product)
+        .filter(product.price == Param("price"))
+        .with_natural_query(NATURAL_QUERY, CLIENT_CONFIG)
+    )
+
+
+def _fill_params(handler: NLQHandler, query_descriptor: QueryDescriptor) -> dict[str, Any]:
+    return asyncio.run(
+        handler.fill_params(NATURAL_QUERY, query_descriptor.clauses, query_descriptor._space_weight_param_info)
+    )
+
+
+def test_repeated_natural_query_skips_the_llm() -> None:
+    client = FakeClient()
+    handler = NLQHandler(CLIENT_CONFIG, client=client, cache_size=10, cache_ttl_seconds=60)
+    query_descriptor = _create_query_descriptor()
+
+    assert _fill_params(handler, query_descriptor) == {"price": [1]}
+    assert _fill_params(handler, query_descriptor) == {"price": [1]}
+    assert client.n_calls == 1
+
+
+def test_expired_params_are_extracted_again() -> None:
+    client = FakeClient()
+    handler = NLQHandler(CLIENT_CONFIG, client=client, cache_size=10, cache_ttl_seconds=1)
+    query_descriptor = _create_query_descriptor()
+
+    assert _fill_params(handler, query_descriptor) == {"price": [1]}
+    time.sleep(1.1)
+
+    assert _fill_params(handler, query_descriptor) == {"price": [2]}
+    assert client.n_calls == 2
+
+
+def test_mutating_returned_params_does_not_change_the_cache() -> None:
+    client = FakeClient()
+    handler = NLQHandler(CLIENT_CONFIG, client=client, cache_size=10, cache_ttl_seconds=60)
+    query_descriptor = _create_query_descriptor()
+
+    _fill_params(handler, query_descriptor)["price"].append(42)
+    cached_params = _fill_params(handler, query_descriptor)
+    cached_params["price"].append(43)
+
+    assert _fill_params(handler, query_descriptor) == {"price": [1]}
+    assert client.n_calls == 1
+
+
+def test_handlers_are_shared_by_client_config() -> None:
+    handler = NLQHandler.get_instance(OpenAIClientConfig(api_key="api_key", model="model"))
+
+    assert NLQHandler.get_instance(OpenAIClientConfig(api_key="api_key", model="model")) is handler
+    assert NLQHandler.get_instance(OpenAIClientConfig(api_key="other_key", model="model")) is not handler
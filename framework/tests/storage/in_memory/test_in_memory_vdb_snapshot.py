@@ -0,0 +1,88 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from pathlib import Path
+
+import numpy as np
+
+from superlinked.framework.common.data_types import Vector
+from superlinked.framework.common.storage.entity.entity_data import EntityData
+from superlinked.framework.common.storage.entity.entity_id import EntityId
+from superlinked.framework.common.storage.field.field_data import (
+    FieldData,
+    VectorFieldData,
+)
+from superlinked.framework.common.storage.field.field_data_type import FieldDataType
+from superlinked.framework.storage.common.vdb_settings import VDBSettings
+from superlinked.framework.storage.in_memory.file_object_serializer import (
+    FileObjectSerializer,
+)
+from superlinked.framework.storage.in_memory.in_memory_vdb import InMemoryVDB
+
+VECTOR_FIELD = "vector"
+TEXT_FIELD = "text"
+
+
+def _create_vdb(object_ids: list[str], offset: float = 0.0) -> InMemoryVDB:
+    vdb = InMemoryVDB(VDBSettings(default_query_limit=10))
+    entity_data = [
+        EntityData(
+            EntityId("schema", object_id),
+            {
+                VECTOR_FIELD: VectorFieldData(VECTOR_FIELD, Vector([offset + i, 1.0, 2.0])),
+                TEXT_FIELD: FieldData(FieldDataType.STRING, TEXT_FIELD, f"text {object_id}"),
+            },
+        )
+        for i, object_id in enumerate(object_ids)
+    ]
+    asyncio.run(vdb.write_entities(entity_data))
+    return vdb
+
+
+def _get_vectors(vdb: InMemoryVDB) -> dict[str, list[float]]:
+    return {row_id: raw_entity[VECTOR_FIELD].value.tolist() for row_id, raw_entity in vdb._vdb.items()}
+
+
+def test_persist_after_restore_from_same_serializer(tmp_path: Path) -> None:
+    serializer = FileObjectSerializer(str(tmp_path))
+    vdb = _create_vdb(["a", "b", "c"])
+    expected_vectors = _get_vectors(vdb)
+    vdb.persist(serializer)
+
+    restored_vdb = InMemoryVDB(VDBSettings(default_query_limit=10))
+    restored_vdb.restore(serializer)
+    restored_vdb.persist(serializer)
+
+    assert _get_vectors(restored_vdb) == expected_vectors
+    roundtrip_vdb = InMemoryVDB(VDBSettings(default_query_limit=10))
+    roundtrip_vdb.restore(serializer)
+    assert _get_vectors(roundtrip_vdb) == expected_vectors
+    assert roundtrip_vdb._vdb["schema:b"][TEXT_FIELD] == "text b"
+    assert np.array_equal(roundtrip_vdb._vector_stores[VECTOR_FIELD].matrix, vdb._vector_stores[VECTOR_FIELD].matrix)
+
+
+def test_binary_restore_merges_into_existing_rows(tmp_path: Path) -> None:
+    serializer = FileObjectSerializer(str(tmp_path))
+    _create_vdb(["a", "b"]).persist(serializer)
+
+    vdb = _create_vdb(["b", "c"], offset=10.0)
+    vdb.restore(serializer)
+
+    assert _get_vectors(vdb) == {
+        "schema:a": [0.0, 1.0, 2.0],
+        "schema:b": [1.0, 1.0, 2.0],
+        "schema:c": [11.0, 1.0, 2.0],
+    }
+    assert sorted(vdb._vector_stores[VECTOR_FIELD].row_ids) == ["schema:a", "schema:b", "schema:c"]